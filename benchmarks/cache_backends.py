@@ -0,0 +1,99 @@
+"""
+Concurrency benchmark for the response cache backends.
+
+Starts several worker processes that hammer one backend with a read-heavy mix
+of lookups and writes, the way gunicorn workers sharing a cache would, and
+reports the combined throughput. `MemoryCache` is per process, so its numbers
+are the upper bound the shared backends are measured against.
+
+Usage:
+    python benchmarks/cache_backends.py --processes 8 --seconds 5
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import tempfile
+import time
+import uuid
+
+from hevy_api_wrapper.cache import CacheEntry, MemoryCache, SharedMemoryCache, SQLiteCache
+
+KEYS = 512
+VALUE = b'{"id":"05293BCA","title":"Bench Press (Barbell)","type":"weight_reps","is_custom":false}' * 4
+
+
+def open_backend(kind, location):
+    if kind == "memory":
+        return MemoryCache(max_entries=KEYS)
+    if kind == "sqlite":
+        return SQLiteCache(location, max_entries=KEYS * 2)
+    return SharedMemoryCache(location, slots=KEYS * 2, slot_size=1024)
+
+
+def worker(kind, location, seconds, write_ratio, results):
+    backend = open_backend(kind, location)
+    rng = random.Random(os.getpid())
+    keys = [f"scope|exercise_templates.get_exercise_template|/v1/exercise_templates/{i}" for i in range(KEYS)]
+    reads = writes = hits = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        key = rng.choice(keys)
+        if rng.random() < write_ratio:
+            now = time.time()
+            backend.set(key, CacheEntry(value=VALUE, stored_at=now, expires_at=now + 3600))
+            writes += 1
+        else:
+            hits += backend.get(key) is not None
+            reads += 1
+    results.put((reads, writes, hits))
+
+
+def run(kind, processes, seconds, write_ratio):
+    location = None
+    if kind == "sqlite":
+        location = os.path.join(tempfile.mkdtemp(), "cache.db")
+        SQLiteCache(location)
+    elif kind == "shared_memory":
+        location = f"hevy-bench-{uuid.uuid4().hex[:8]}"
+        owner = open_backend(kind, location)
+
+    ctx = multiprocessing.get_context("spawn")
+    results = ctx.Queue()
+    workers = [
+        ctx.Process(target=worker, args=(kind, location, seconds, write_ratio, results)) for _ in range(processes)
+    ]
+    for process in workers:
+        process.start()
+    totals = [results.get() for _ in workers]
+    for process in workers:
+        process.join()
+    if kind == "shared_memory":
+        owner.unlink()
+        owner.close()
+
+    reads = sum(r for r, _, _ in totals)
+    writes = sum(w for _, w, _ in totals)
+    hits = sum(h for _, _, h in totals)
+    print(
+        f"{kind:>14}: {(reads + writes) / seconds:>12,.0f} ops/s"
+        f"  ({reads / seconds:,.0f} reads/s, {writes / seconds:,.0f} writes/s, hit ratio {hits / max(reads, 1):.2f})"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 4)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--write-ratio", type=float, default=0.05)
+    parser.add_argument("--backend", choices=["memory", "sqlite", "shared_memory"], action="append")
+    args = parser.parse_args()
+
+    print(f"{args.processes} processes, {args.seconds:g}s each, {args.write_ratio:.0%} writes")
+    for kind in args.backend or ["memory", "sqlite", "shared_memory"]:
+        run(kind, args.processes, args.seconds, args.write_ratio)
+
+
+if __name__ == "__main__":
+    main()
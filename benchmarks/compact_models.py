@@ -0,0 +1,124 @@
+"""
+Memory and throughput of the compact models against the pydantic models.
+
+Decodes synthetic workout pages and exercise history holding ``--sets``
+sets each into both model families and reports the memory the resulting
+objects keep alive and how fast they are built from JSON bytes.
+
+Usage:
+    python benchmarks/compact_models.py --sets 50000
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+from hevy_api_wrapper.adapters import validate_json
+from hevy_api_wrapper.compact import CompactExerciseHistoryResponse, CompactPaginatedWorkouts
+from hevy_api_wrapper.models import ExerciseHistoryResponse, PaginatedWorkouts
+
+SETS_PER_EXERCISE = 4
+EXERCISES_PER_WORKOUT = 5
+
+
+def workouts_payload(sets):
+    workouts = max(sets // (SETS_PER_EXERCISE * EXERCISES_PER_WORKOUT), 1)
+    return {
+        "page": 1,
+        "page_count": 1,
+        "workouts": [
+            {
+                "id": f"w-{w}",
+                "title": "Push Day",
+                "routine_id": None,
+                "description": "",
+                "start_time": "2024-01-01T18:00:00Z",
+                "end_time": "2024-01-01T19:10:00Z",
+                "updated_at": "2024-01-01T19:11:00Z",
+                "created_at": "2024-01-01T19:11:00Z",
+                "exercises": [
+                    {
+                        "index": e,
+                        "title": "Bench Press (Barbell)",
+                        "notes": "",
+                        "exercise_template_id": "05293BCA",
+                        "supersets_id": None,
+                        "sets": [
+                            {"index": s, "type": "normal", "weight_kg": 80.0 + s, "reps": 8, "rpe": None}
+                            for s in range(SETS_PER_EXERCISE)
+                        ],
+                    }
+                    for e in range(EXERCISES_PER_WORKOUT)
+                ],
+            }
+            for w in range(workouts)
+        ],
+    }
+
+
+def history_payload(sets):
+    return {
+        "exercise_history": [
+            {
+                "workout_id": f"w-{i // 4}",
+                "workout_title": "Push Day",
+                "workout_start_time": "2024-01-01T18:00:00Z",
+                "workout_end_time": "2024-01-01T19:10:00Z",
+                "exercise_template_id": "05293BCA",
+                "weight_kg": 80.0 + i % 4,
+                "reps": 8,
+                "set_type": "normal",
+            }
+            for i in range(sets)
+        ]
+    }
+
+
+def retained_bytes(build):
+    """Bytes still allocated once ``build()``'s result is the only thing kept."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def throughput(build, sets, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        build()
+        best = min(best, time.perf_counter() - start)
+    return sets / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sets", type=int, default=50_000)
+    args = parser.parse_args()
+
+    cases = [
+        ("workouts", json.dumps(workouts_payload(args.sets)).encode(), PaginatedWorkouts, CompactPaginatedWorkouts),
+        (
+            "history",
+            json.dumps(history_payload(args.sets)).encode(),
+            ExerciseHistoryResponse,
+            CompactExerciseHistoryResponse,
+        ),
+    ]
+    print(f"{args.sets:,} sets per payload")
+    print(f"{'payload':<10} {'backend':<9} {'retained MB':>12} {'bytes/set':>10} {'sets/s':>12}")
+    for name, raw, *types in cases:
+        for backend, model in zip(("pydantic", "compact"), types):
+            size = retained_bytes(lambda: validate_json(model, raw))
+            rate = throughput(lambda: validate_json(model, raw), args.sets)
+            print(f"{name:<10} {backend:<9} {size / 1e6:>12.1f} {size / args.sets:>10.0f} {rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Import time of the package and of its clients, each in a fresh interpreter.
+
+Usage:
+    python benchmarks/import_time.py --runs 21
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import hevy_api_wrapper",
+    "from hevy_api_wrapper import Client",
+    "from hevy_api_wrapper.models import Workout",
+]
+
+PROBE = "import time; start = time.perf_counter(); {statement}; print(time.perf_counter() - start)"
+
+
+def import_seconds(statement):
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(statement=statement)], capture_output=True, text=True, check=True
+    )
+    return float(result.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=21)
+    args = parser.parse_args()
+
+    print(f"{'statement':<45} {'median ms':>10}")
+    for statement in STATEMENTS:
+        median = statistics.median(import_seconds(statement) for _ in range(args.runs))
+        print(f"{statement:<45} {median * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Memory and speed of projected responses against full responses.
+
+Decodes the synthetic workout pages and exercise history of
+``compact_models.py`` into the full models and into projections keeping
+only the fields an analytics job reads, and reports the retained memory
+and throughput of each.
+
+Usage:
+    python benchmarks/projection.py --sets 50000
+"""
+
+import argparse
+import json
+
+from compact_models import history_payload, retained_bytes, throughput, workouts_payload
+
+from hevy_api_wrapper.adapters import validate_json
+from hevy_api_wrapper.models import ExerciseHistoryResponse, PaginatedWorkouts
+from hevy_api_wrapper.projection import project
+
+WORKOUT_FIELDS = [
+    "id",
+    "start_time",
+    "exercises.exercise_template_id",
+    "exercises.sets.weight_kg",
+    "exercises.sets.reps",
+]
+HISTORY_FIELDS = ["workout_id", "workout_start_time", "weight_kg", "reps"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sets", type=int, default=50_000)
+    args = parser.parse_args()
+
+    cases = [
+        ("workouts", json.dumps(workouts_payload(args.sets)).encode(), PaginatedWorkouts, WORKOUT_FIELDS),
+        ("history", json.dumps(history_payload(args.sets)).encode(), ExerciseHistoryResponse, HISTORY_FIELDS),
+    ]
+    print(f"{args.sets:,} sets per payload")
+    print(f"{'payload':<10} {'model':<10} {'retained MB':>12} {'sets/s':>12}")
+    for name, raw, model, fields in cases:
+        for label, response_type in (("full", model), ("projected", project(model, fields))):
+            size = retained_bytes(lambda: validate_json(response_type, raw))
+            rate = throughput(lambda: validate_json(response_type, raw), args.sets)
+            print(f"{name:<10} {label:<10} {size / 1e6:>12.1f} {rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Encoding request bodies: dict per attempt against JSON bytes once.
+
+Builds a large ``POST /v1/workouts`` body and times what the client does
+to send it ``--attempts`` times (the first try plus retries): dumping the
+model to a dict that httpx encodes for every request, as before, against
+serializing it to JSON bytes once and sending those on every attempt.
+
+Usage:
+    python benchmarks/request_bodies.py --exercises 40 --sets 25 --attempts 4
+"""
+
+import argparse
+import time
+
+import httpx
+
+from hevy_api_wrapper.adapters import dump_json
+from hevy_api_wrapper.models import (
+    PostWorkoutsRequestBody,
+    PostWorkoutsRequestBodyWorkout,
+    PostWorkoutsRequestExercise,
+    PostWorkoutsRequestSet,
+)
+
+URL = "https://api.hevyapp.com/v1/workouts"
+
+
+def workout_body(exercises, sets):
+    return PostWorkoutsRequestBody(
+        workout=PostWorkoutsRequestBodyWorkout(
+            title="Marathon Session",
+            description="Synthetic benchmark workout",
+            start_time="2024-01-01T18:00:00Z",
+            end_time="2024-01-01T21:00:00Z",
+            is_private=False,
+            exercises=[
+                PostWorkoutsRequestExercise(
+                    exercise_template_id=f"{e:08X}",
+                    notes="Slow eccentric",
+                    sets=[
+                        PostWorkoutsRequestSet(type="normal", weight_kg=60 + s, reps=8, rpe=8.5) for s in range(sets)
+                    ],
+                )
+                for e in range(exercises)
+            ],
+        )
+    )
+
+
+def per_attempt(body, attempts):
+    for _ in range(attempts):
+        httpx.Request("POST", URL, json=body.model_dump(exclude_none=True))
+
+
+def once(body, attempts):
+    content = dump_json(body, exclude_none=True)
+    for _ in range(attempts):
+        httpx.Request("POST", URL, content=content, headers={"content-type": "application/json"})
+
+
+def best_ms(run, body, attempts, repeat=50):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(body, attempts)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--exercises", type=int, default=40)
+    parser.add_argument("--sets", type=int, default=25)
+    parser.add_argument("--attempts", type=int, default=4)
+    args = parser.parse_args()
+
+    body = workout_body(args.exercises, args.sets)
+    size = len(dump_json(body, exclude_none=True))
+    print(f"{args.exercises * args.sets:,} sets, {size / 1e3:.0f} kB of JSON")
+    for attempts in (1, args.attempts):
+        before = best_ms(per_attempt, body, attempts)
+        after = best_ms(once, body, attempts)
+        print(
+            f"{attempts} attempt(s): dict per attempt {before:7.2f} ms, bytes once {after:7.2f} ms, {before / after:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
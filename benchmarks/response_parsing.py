@@ -0,0 +1,203 @@
+"""
+Benchmark for turning list endpoint responses into models.
+
+Builds one full page of synthetic JSON per list endpoint and measures, per
+page, the latency and peak memory of the two ways a response can become a
+model: decoding it with ``json.loads`` and unpacking the dict into the model
+(``Model(**data)``), and validating the bytes directly with the model's
+shared adapter (`hevy_api_wrapper.adapters.validate_json`), which is what the
+clients do.
+
+Usage:
+    python benchmarks/response_parsing.py --repeat 200
+"""
+
+import argparse
+import json
+import statistics
+import time
+import tracemalloc
+
+from hevy_api_wrapper.adapters import validate_json
+from hevy_api_wrapper.models import (
+    ExerciseHistoryResponse,
+    PaginatedExerciseTemplates,
+    PaginatedRoutineFolders,
+    PaginatedRoutines,
+    PaginatedWorkoutEvents,
+    PaginatedWorkouts,
+)
+
+TIMESTAMP = "2024-01-01T18:00:00Z"
+
+
+def workout(i):
+    return {
+        "id": f"w-{i}",
+        "title": "Push Day",
+        "routine_id": None,
+        "description": "",
+        "start_time": TIMESTAMP,
+        "end_time": TIMESTAMP,
+        "updated_at": TIMESTAMP,
+        "created_at": TIMESTAMP,
+        "exercises": [
+            {
+                "index": e,
+                "title": f"Exercise {e}",
+                "notes": "",
+                "exercise_template_id": "05293BCA",
+                "supersets_id": None,
+                "sets": [
+                    {"index": s, "type": "normal", "weight_kg": 80.0, "reps": 8, "rpe": None, "custom_metric": None}
+                    for s in range(4)
+                ],
+            }
+            for e in range(6)
+        ],
+    }
+
+
+def routine(i):
+    return {
+        "id": f"r-{i}",
+        "title": "Upper Body",
+        "folder_id": None,
+        "updated_at": TIMESTAMP,
+        "created_at": TIMESTAMP,
+        "exercises": [
+            {
+                "index": e,
+                "title": f"Exercise {e}",
+                "rest_seconds": 90,
+                "notes": "",
+                "exercise_template_id": "05293BCA",
+                "supersets_id": None,
+                "sets": [
+                    {"index": s, "type": "normal", "weight_kg": 80.0, "reps": 8, "rep_range": {"start": 8, "end": 12}}
+                    for s in range(3)
+                ],
+            }
+            for e in range(6)
+        ],
+    }
+
+
+PAGES = {
+    "workouts.get_workouts": (
+        PaginatedWorkouts,
+        {"page": 1, "page_count": 9, "workouts": [workout(i) for i in range(10)]},
+    ),
+    "workouts.get_events": (
+        PaginatedWorkoutEvents,
+        {
+            "page": 1,
+            "page_count": 9,
+            "events": [{"type": "updated", "workout": workout(i)} for i in range(5)]
+            + [{"type": "deleted", "id": f"w-{i}", "deleted_at": TIMESTAMP} for i in range(5, 10)],
+        },
+    ),
+    "routines.get_routines": (
+        PaginatedRoutines,
+        {"page": 1, "page_count": 9, "routines": [routine(i) for i in range(10)]},
+    ),
+    "exercise_templates.get_exercise_templates": (
+        PaginatedExerciseTemplates,
+        {
+            "page": 1,
+            "page_count": 9,
+            "exercise_templates": [
+                {
+                    "id": f"{i:08X}",
+                    "title": f"Exercise {i}",
+                    "type": "weight_reps",
+                    "primary_muscle_group": "chest",
+                    "secondary_muscle_groups": ["triceps", "shoulders"],
+                    "is_custom": False,
+                }
+                for i in range(100)
+            ],
+        },
+    ),
+    "routine_folders.get_routine_folders": (
+        PaginatedRoutineFolders,
+        {
+            "page": 1,
+            "page_count": 9,
+            "routine_folders": [
+                {"id": i, "index": i, "title": f"Folder {i}", "updated_at": TIMESTAMP, "created_at": TIMESTAMP}
+                for i in range(10)
+            ],
+        },
+    ),
+    "exercise_history.get_exercise_history": (
+        ExerciseHistoryResponse,
+        {
+            "exercise_history": [
+                {
+                    "workout_id": f"w-{i}",
+                    "workout_title": "Push Day",
+                    "workout_start_time": TIMESTAMP,
+                    "workout_end_time": TIMESTAMP,
+                    "exercise_template_id": "05293BCA",
+                    "weight_kg": 80.0,
+                    "reps": 8,
+                    "distance_meters": None,
+                    "duration_seconds": None,
+                    "rpe": None,
+                    "custom_metric": None,
+                    "set_type": "normal",
+                }
+                for i in range(200)
+            ]
+        },
+    ),
+}
+
+
+def latency(repeat, fn):
+    """Median per-call time in microseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1e6
+
+
+def peak_memory(fn):
+    """Peak bytes allocated while the call runs, kept result included."""
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'endpoint':<42} {'page':>8} {'unpack':>10} {'adapter':>10} {'speedup':>8} {'peak KiB':>17}")
+    for endpoint, (model, data) in PAGES.items():
+        raw = json.dumps(data).encode()
+        validate_json(model, raw)  # build the adapter outside the measurements
+
+        def unpacked():
+            return model(**json.loads(raw))
+
+        def adapted():
+            return validate_json(model, raw)
+
+        assert unpacked() == adapted()
+        slow, fast = latency(args.repeat, unpacked), latency(args.repeat, adapted)
+        slow_peak, fast_peak = peak_memory(unpacked), peak_memory(adapted)
+        print(
+            f"{endpoint:<42} {len(raw) / 1024:>6.1f}KB {slow:>8.0f}us {fast:>8.0f}us {slow / fast:>7.2f}x"
+            f" {slow_peak / 1024:>8.1f} -> {fast_peak / 1024:<6.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Flattening workout sets into rows against building a `SetTable`.
+
+Uses the synthetic multi-year account of ``string_interning.py`` and
+reports the time to flatten its workouts page and the memory the result
+keeps alive, for a list of row dicts (the usual Python loop) and for the
+columnar table.
+
+Usage:
+    python benchmarks/set_table.py --years 5
+"""
+
+import argparse
+import time
+
+from compact_models import retained_bytes
+from string_interning import account
+
+from hevy_api_wrapper.models import PaginatedWorkouts
+from hevy_api_wrapper.set_table import SetTable
+
+
+def rows(page):
+    return [
+        {
+            "workout_id": workout.id,
+            "start_time": workout.start_time,
+            "exercise_template_id": exercise.exercise_template_id,
+            "set_type": workout_set.type,
+            "weight_kg": workout_set.weight_kg,
+            "reps": workout_set.reps,
+            "distance_meters": workout_set.distance_meters,
+            "duration_seconds": workout_set.duration_seconds,
+            "rpe": workout_set.rpe,
+            "custom_metric": workout_set.custom_metric,
+        }
+        for workout in page.workouts
+        for exercise in workout.exercises
+        for workout_set in exercise.sets
+    ]
+
+
+def table(page):
+    result = SetTable()
+    result.append_page(page)
+    return result
+
+
+def best_seconds(build, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        build()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--years", type=int, default=5)
+    args = parser.parse_args()
+
+    page = PaginatedWorkouts.model_validate(account(args.years)[0])
+    sets = sum(len(exercise.sets) for workout in page.workouts for exercise in workout.exercises)
+    print(f"{args.years} years, {len(page.workouts):,} workouts, {sets:,} sets")
+    print(f"{'layout':<10} {'build ms':>10} {'retained MB':>12} {'bytes/set':>10}")
+    for name, build in (("rows", rows), ("SetTable", table)):
+        seconds = best_seconds(lambda: build(page))
+        size = retained_bytes(lambda: build(page))
+        print(f"{name:<10} {seconds * 1000:>10.1f} {size / 1e6:>12.2f} {size / sets:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Memory kept by repeated strings in a multi-year account.
+
+Builds the workouts and exercise history of a synthetic account (four
+workouts a week drawn from a library of exercise templates) and reports
+the memory retained by the resulting models and the number of distinct
+string objects they reference:
+
+- ``validated``: pydantic validation from JSON bytes, as the clients do;
+  its parser shares repeated short strings.
+- ``from dicts``: validation of ``json.loads`` output, where every
+  occurrence is a separate string, for comparison.
+
+Usage:
+    python benchmarks/string_interning.py --years 5
+"""
+
+import argparse
+import gc
+import json
+import random
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+from hevy_api_wrapper.adapters import adapter, validate_json
+from hevy_api_wrapper.models import ExerciseHistoryResponse, PaginatedWorkouts
+
+TEMPLATES = 60
+EXERCISES_PER_WORKOUT = 6
+SETS_PER_EXERCISE = 4
+SET_TYPES = ["warmup", "normal", "normal", "normal", "failure", "dropset"]
+ROUTINES = ["Push Day", "Pull Day", "Leg Day", "Upper Body", "Lower Body", "Full Body"]
+
+
+def timestamp(moment):
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def account(years, seed=0):
+    """Return the workouts page and the exercise history of every template."""
+    rng = random.Random(seed)
+    templates = [(f"{rng.randrange(16**8):08X}", f"Exercise {t} (Barbell)") for t in range(TEMPLATES)]
+    start = datetime(2020, 1, 1, 18, tzinfo=timezone.utc)
+    workouts, history = [], []
+    for w in range(years * 52 * 4):
+        began = start + timedelta(days=w * 7 / 4)
+        ended = began + timedelta(minutes=70)
+        title = rng.choice(ROUTINES)
+        exercises = []
+        for e, (template_id, template_title) in enumerate(rng.sample(templates, EXERCISES_PER_WORKOUT)):
+            sets = []
+            for s in range(SETS_PER_EXERCISE):
+                set_type, weight, reps = rng.choice(SET_TYPES), rng.randrange(20, 200) / 2, rng.randrange(3, 15)
+                sets.append({"index": s, "type": set_type, "weight_kg": weight, "reps": reps, "rpe": None})
+                history.append(
+                    {
+                        "workout_id": f"w-{w}",
+                        "workout_title": title,
+                        "workout_start_time": timestamp(began),
+                        "workout_end_time": timestamp(ended),
+                        "exercise_template_id": template_id,
+                        "weight_kg": weight,
+                        "reps": reps,
+                        "set_type": set_type,
+                    }
+                )
+            exercises.append(
+                {
+                    "index": e,
+                    "title": template_title,
+                    "notes": "",
+                    "exercise_template_id": template_id,
+                    "supersets_id": None,
+                    "sets": sets,
+                }
+            )
+        workouts.append(
+            {
+                "id": f"w-{w}",
+                "title": title,
+                "routine_id": None,
+                "description": "",
+                "start_time": timestamp(began),
+                "end_time": timestamp(ended),
+                "updated_at": timestamp(ended),
+                "created_at": timestamp(ended),
+                "exercises": exercises,
+            }
+        )
+    return {"page": 1, "page_count": 1, "workouts": workouts}, {"exercise_history": history}
+
+
+def strings(value, found):
+    """Collect the ids of the string objects reachable from ``value``."""
+    if isinstance(value, str):
+        found.add(id(value))
+    elif isinstance(value, list):
+        for item in value:
+            strings(item, found)
+    elif hasattr(value, "__dict__"):
+        for item in value.__dict__.values():
+            strings(item, found)
+    return found
+
+
+def retained(build):
+    """Bytes allocated by ``build()`` that its result keeps alive, and the result's distinct strings."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, len(strings(result, set()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--years", type=int, default=5)
+    args = parser.parse_args()
+
+    workouts, history = account(args.years)
+    sets = len(history["exercise_history"])
+    print(f"{args.years} years, {len(workouts['workouts']):,} workouts, {sets:,} sets")
+    print(f"{'payload':<10} {'parsing':<12} {'retained MB':>12} {'strings':>10}")
+    for name, model, payload in (
+        ("workouts", PaginatedWorkouts, workouts),
+        ("history", ExerciseHistoryResponse, history),
+    ):
+        raw = json.dumps(payload).encode()
+        for label, build in (
+            ("from dicts", lambda: adapter(model).validate_python(json.loads(raw))),
+            ("validated", lambda: validate_json(model, raw)),
+        ):
+            size, count = retained(build)
+            print(f"{name:<10} {label:<12} {size / 1e6:>12.1f} {count:>10,}")
+
+
+if __name__ == "__main__":
+    main()
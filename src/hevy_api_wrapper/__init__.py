@@ -2,9 +2,17 @@
 
 This package provides both synchronous and asynchronous clients for interacting
 with the Hevy API, complete with type-safe models and comprehensive error handling.
+
+The clients, and with them httpx, pydantic and the models, are imported on
+first access to ``Client`` or ``AsyncClient``, so importing the package
+itself stays cheap.
 """
 
-from .client import AsyncClient, Client
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
 from .errors import (
     AuthError,
     HevyApiError,
@@ -15,6 +23,9 @@ from .errors import (
 )
 from .version import __version__
 
+if TYPE_CHECKING:
+    from .client import AsyncClient, Client
+
 __all__ = [
     "Client",
     "AsyncClient",
@@ -26,3 +37,25 @@ __all__ = [
     "ServerError",
     "ValidationError",
 ]
+
+_LAZY = {"Client": ".client", "AsyncClient": ".client"}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(module, __name__), name)
+        globals()[name] = value
+        return value
+    # Submodules such as ``hevy_api_wrapper.models`` used to be loaded by the
+    # package import; keep them reachable as attributes.
+    try:
+        return importlib.import_module(f".{name}", __name__)
+    except ModuleNotFoundError as exc:
+        if exc.name != f"{__name__}.{name}":
+            raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,40 @@
+"""Registry of compiled pydantic validators and serializers for API types.
+
+`adapter` builds one `TypeAdapter` per type the first time it is needed and
+hands out the same one afterwards, so every response of a type is validated
+by the same compiled validator. `validate_json` validates raw response bytes
+with it directly, without decoding them into Python dicts and unpacking
+those into the model first; `dump_json` does the reverse for request bodies.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Type, TypeVar, Union
+
+from pydantic import TypeAdapter
+
+__all__ = ["adapter", "validate_json", "dump_json"]
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=None)
+def adapter(response_type: Any) -> TypeAdapter[Any]:
+    """Return the shared `TypeAdapter` of a response type."""
+    return TypeAdapter(response_type)
+
+
+def validate_json(response_type: Type[T], content: Union[bytes, bytearray, str]) -> T:
+    """Validate a JSON document straight into ``response_type``.
+
+    Raises:
+        pydantic.ValidationError: If the document is not valid JSON or does
+            not match the type.
+    """
+    return adapter(response_type).validate_json(content)  # type: ignore[no-any-return]
+
+
+def dump_json(value: Any, *, exclude_none: bool = False) -> bytes:
+    """Serialize a model straight to JSON bytes, without an intermediate dict."""
+    return adapter(type(value)).dump_json(value, exclude_none=exclude_none)
@@ -0,0 +1,82 @@
+"""Response caching for Hevy API clients.
+
+Each name is imported from its module on first access, so using the
+in-memory cache does not load the SQLite or shared-memory backends.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .base import CacheBackend, CacheEntry, CachePolicy, CacheStats
+    from .history import AsyncExerciseHistoryCache, ExerciseHistoryCache
+    from .memory import MemoryCache
+    from .response_cache import (
+        CACHEABLE_ENDPOINTS,
+        DEFAULT_POLICIES,
+        DEPENDENT_ENDPOINTS,
+        ITEM_ENDPOINTS,
+        ResponseCache,
+    )
+    from .shared_memory import SharedMemoryCache
+    from .sqlite import SQLiteCache
+    from .warmup import DEFAULT_WARM_TARGETS, WARM_TARGETS, AsyncCacheRefresher, CacheRefresher, WarmTarget
+
+__all__ = [
+    "ResponseCache",
+    "CachePolicy",
+    "CacheStats",
+    "CacheEntry",
+    "CacheBackend",
+    "MemoryCache",
+    "SQLiteCache",
+    "SharedMemoryCache",
+    "ExerciseHistoryCache",
+    "AsyncExerciseHistoryCache",
+    "CacheRefresher",
+    "AsyncCacheRefresher",
+    "WarmTarget",
+    "WARM_TARGETS",
+    "DEFAULT_WARM_TARGETS",
+    "CACHEABLE_ENDPOINTS",
+    "ITEM_ENDPOINTS",
+    "DEPENDENT_ENDPOINTS",
+    "DEFAULT_POLICIES",
+]
+
+_MODULES = {
+    "ResponseCache": ".response_cache",
+    "CachePolicy": ".base",
+    "CacheStats": ".base",
+    "CacheEntry": ".base",
+    "CacheBackend": ".base",
+    "MemoryCache": ".memory",
+    "SQLiteCache": ".sqlite",
+    "SharedMemoryCache": ".shared_memory",
+    "ExerciseHistoryCache": ".history",
+    "AsyncExerciseHistoryCache": ".history",
+    "CacheRefresher": ".warmup",
+    "AsyncCacheRefresher": ".warmup",
+    "WarmTarget": ".warmup",
+    "WARM_TARGETS": ".warmup",
+    "DEFAULT_WARM_TARGETS": ".warmup",
+    "CACHEABLE_ENDPOINTS": ".response_cache",
+    "ITEM_ENDPOINTS": ".response_cache",
+    "DEPENDENT_ENDPOINTS": ".response_cache",
+    "DEFAULT_POLICIES": ".response_cache",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
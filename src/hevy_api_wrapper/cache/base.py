@@ -0,0 +1,152 @@
+"""Shared cache data structures."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Protocol, runtime_checkable
+
+import pydantic_core
+
+__all__ = ["CacheBackend", "CacheEntry", "CachePolicy", "CacheStats", "encode_value"]
+
+
+@dataclass
+class CacheEntry:
+    """A cached response.
+
+    Attributes:
+        value: The decoded response model, or its JSON bytes when read back
+            from a backend that stores bytes.
+        stored_at: Unix time at which the entry was stored.
+        expires_at: Unix time after which the entry is stale.
+        stale_until: Unix time until which a stale entry may still be served
+            while it is refreshed in the background. None means no stale window.
+        etag: The response's ``ETag`` header, if any.
+        last_modified: The response's ``Last-Modified`` header, if any.
+        size: Bytes of the response body the entry replaces, or 0 if unknown.
+    """
+
+    value: Any
+    stored_at: float
+    expires_at: float
+    stale_until: Optional[float] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    size: int = 0
+
+    @property
+    def retain_until(self) -> float:
+        """Unix time after which a backend may drop the entry.
+
+        Entries with validators are kept until evicted, since they can still be
+        revalidated with a conditional request after they expire.
+        """
+        if self.etag or self.last_modified:
+            return float("inf")
+        return max(self.expires_at, self.stale_until or self.expires_at)
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.expires_at
+
+    def is_servable_stale(self, now: float) -> bool:
+        """Whether the entry is expired but still inside its stale window."""
+        return not self.is_fresh(now) and self.stale_until is not None and now < self.stale_until
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers revalidating the entry with a conditional GET."""
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@runtime_checkable
+class CacheBackend(Protocol):
+    """Storage for cache entries, used by `ResponseCache`.
+
+    Backends may store the entry value as given or as JSON bytes from
+    `encode_value`; `ResponseCache` decodes bytes on read. Implementations must
+    be safe to call from several threads, and should not return entries past
+    their `CacheEntry.retain_until`.
+
+    Backends that evict entries to stay within their capacity may also have an
+    ``on_evict`` attribute; `ResponseCache` sets it to a callback taking the
+    evicted key, to count evictions per endpoint.
+    """
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry stored under a key, or None."""
+        ...
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry, replacing any previous one under the key."""
+        ...
+
+    def delete(self, key: str) -> None:
+        """Drop the entry stored under a key, if any."""
+        ...
+
+    def delete_prefix(self, prefix: str) -> None:
+        """Drop every entry whose key starts with a prefix."""
+        ...
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        ...
+
+    def __len__(self) -> int: ...
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Caching rules for one endpoint.
+
+    Attributes:
+        ttl: Seconds a response stays fresh. Zero or less disables caching.
+        stale_ttl: Seconds after ``ttl`` during which the stale response is
+            still returned immediately while a fresh one is fetched in the
+            background (stale-while-revalidate).
+    """
+
+    ttl: float
+    stale_ttl: float = 0.0
+
+
+@dataclass
+class CacheStats:
+    """Counters for one endpoint.
+
+    Attributes:
+        hits: Lookups answered from a fresh entry, including cached 404s.
+        misses: Lookups that had to go to the network, including revalidations.
+        stale_hits: Lookups answered from a stale entry while it was refreshed
+            in the background.
+        revalidations: Expired entries the server confirmed unchanged with a 304.
+        evictions: Entries dropped by the backend to make room for others.
+        bytes_saved: Response bytes not downloaded thanks to hits and 304s.
+        round_trips_saved: Requests not sent thanks to hits.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    stale_hits: int = 0
+    revalidations: int = 0
+    evictions: int = 0
+    bytes_saved: int = 0
+    round_trips_saved: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.stale_hits + self.misses
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of lookups answered without waiting for the network."""
+        return (self.hits + self.stale_hits) / self.lookups if self.lookups else 0.0
+
+
+def encode_value(value: Any) -> bytes:
+    """Serialize a cached model to JSON bytes for backends that store bytes."""
+    return pydantic_core.to_json(value)
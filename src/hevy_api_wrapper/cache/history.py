@@ -0,0 +1,239 @@
+"""Range-aware cache for exercise history."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..models import ExerciseHistoryEntry, ExerciseHistoryResponse
+from ..timestamps import parse_timestamp, parse_timestamps
+
+__all__ = ["ExerciseHistoryCache", "AsyncExerciseHistoryCache"]
+
+_MIN = datetime.min.replace(tzinfo=timezone.utc)
+_MAX = datetime.max.replace(tzinfo=timezone.utc)
+
+Interval = Tuple[datetime, datetime]
+
+
+def _format(moment: datetime) -> Optional[str]:
+    if moment in (_MIN, _MAX):
+        return None
+    return moment.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+@dataclass
+class _Series:
+    """Everything known about one exercise template's history.
+
+    Attributes:
+        intervals: Sorted, disjoint, closed ranges of workout start times
+            whose entries are all in ``entries``.
+        entries: Cached entries sorted by workout start time.
+        times: Workout start time of each entry, for bisection.
+    """
+
+    intervals: List[Interval] = field(default_factory=list)
+    entries: List[ExerciseHistoryEntry] = field(default_factory=list)
+    times: List[datetime] = field(default_factory=list)
+
+    def covers(self, moment: datetime) -> bool:
+        index = bisect_right(self.intervals, (moment, _MAX)) - 1
+        return index >= 0 and self.intervals[index][1] >= moment
+
+    def missing(self, start: datetime, end: datetime) -> List[Interval]:
+        """Return the parts of ``[start, end]`` not covered yet."""
+        if start > end:
+            return []
+        gaps: List[Interval] = []
+        cursor = start
+        for low, high in self.intervals:
+            if high < cursor:
+                continue
+            if low > end:
+                break
+            if low > cursor:
+                gaps.append((cursor, low))
+            cursor = max(cursor, high)
+        if cursor < end or not gaps and not self.covers(cursor):
+            gaps.append((cursor, end))
+        return gaps
+
+    def add(self, start: datetime, end: datetime, entries: List[ExerciseHistoryEntry]) -> None:
+        """Record that ``entries`` are everything in ``[start, end]``.
+
+        Entries from workouts starting inside an already covered range are
+        already stored (fetched ranges share their endpoints), so they are
+        skipped, as are entries outside ``[start, end]``.
+        """
+        moments = parse_timestamps(entry.workout_start_time for entry in entries)
+        for entry, moment in zip(entries, moments):
+            if not start <= moment <= end or self.covers(moment):
+                continue
+            index = bisect_right(self.times, moment)
+            self.times.insert(index, moment)
+            self.entries.insert(index, entry)
+        merged: List[Interval] = []
+        for low, high in sorted(self.intervals + [(start, end)]):
+            if merged and low <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], high))
+            else:
+                merged.append((low, high))
+        self.intervals = merged
+
+    def slice(self, start: datetime, end: datetime) -> List[ExerciseHistoryEntry]:
+        return self.entries[bisect_left(self.times, start) : bisect_right(self.times, end)]
+
+
+class _BaseHistoryCache:
+    def __init__(self, client: Any, *, max_staleness: float) -> None:
+        self._client = client
+        self._series: Dict[str, _Series] = {}
+        self.max_staleness = max_staleness
+
+    def _plan(
+        self, series: _Series, start_date: Optional[str], end_date: Optional[str]
+    ) -> Tuple[datetime, datetime, List[Tuple[Interval, Optional[str], Optional[str]]]]:
+        """Return the requested range and the fetches needed to cover it.
+
+        Each fetch is the range it covers and its ``start_date``/``end_date``
+        parameters. History after the moment of the request can still grow,
+        so an open-ended or future range is only covered up to now.
+        """
+        now = datetime.now(timezone.utc)
+        start = parse_timestamp(start_date) if start_date else _MIN
+        end = parse_timestamp(end_date) if end_date else _MAX
+        covered_end = min(end, now)
+        gaps = series.missing(start, covered_end)
+        if (
+            gaps
+            and end == _MAX
+            and series.covers(gaps[-1][0])
+            and covered_end - gaps[-1][0] <= timedelta(seconds=self.max_staleness)
+        ):
+            # Only the last few seconds are missing; serve them slightly stale.
+            gaps.pop()
+        fetches = [
+            ((low, high), _format(low), None if high == covered_end and end == _MAX else _format(high))
+            for low, high in gaps
+        ]
+        return start, end, fetches
+
+    def _response(self, entries: List[Any]) -> ExerciseHistoryResponse:
+        """Wrap entries in the response class the client returns (pydantic or compact)."""
+        return self._client._model_type(ExerciseHistoryResponse)(exercise_history=entries)  # type: ignore[no-any-return]
+
+    def invalidate(self, exercise_template_id: Optional[str] = None) -> None:
+        """Forget the cached history of one exercise template, or of all of them.
+
+        Call this after logging or editing workouts that touch the exercise.
+        """
+        if exercise_template_id is None:
+            self._series.clear()
+        else:
+            self._series.pop(exercise_template_id, None)
+
+
+class ExerciseHistoryCache(_BaseHistoryCache):
+    """Caches exercise history per template and fetches only uncovered date ranges (sync).
+
+    Each template keeps the date ranges it has already fetched. A request for
+    a range fetches only its uncovered sub-ranges and answers from the merged
+    series, so asking for the last 30, 90 and 365 days in a row downloads each
+    day once.
+
+    The cache does not see workouts logged or edited later; call
+    `invalidate` after writing workouts.
+
+    Example:
+        history = ExerciseHistoryCache(client)
+        history.get_exercise_history("05293BCA", start_date="2024-01-01T00:00:00Z")
+    """
+
+    def __init__(self, client: Any, *, max_staleness: float = 60.0) -> None:
+        """Initialize the cache.
+
+        Args:
+            client: A `Client` used to fetch exercise history.
+            max_staleness: Seconds by which the end of an open-ended range may
+                lag behind now before the missing tail is fetched.
+        """
+        super().__init__(client, max_staleness=max_staleness)
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def get_exercise_history(
+        self,
+        exercise_template_id: str,
+        *,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> ExerciseHistoryResponse:
+        """Get exercise history, fetching only what is not cached yet.
+
+        Args:
+            exercise_template_id: Unique exercise template identifier.
+            start_date: Optional ISO 8601 start of the range (inclusive).
+            end_date: Optional ISO 8601 end of the range (inclusive).
+
+        Returns:
+            The entries in the range, sorted by workout start time.
+        """
+        with self._locks_guard:
+            lock = self._locks.setdefault(exercise_template_id, threading.Lock())
+        with lock:
+            series = self._series.setdefault(exercise_template_id, _Series())
+            start, end, fetches = self._plan(series, start_date, end_date)
+            for (low, high), fetch_start, fetch_end in fetches:
+                result = self._client.exercise_history.get_exercise_history(
+                    exercise_template_id, start_date=fetch_start, end_date=fetch_end
+                )
+                series.add(low, high, result.exercise_history)
+            return self._response(series.slice(start, end))
+
+
+class AsyncExerciseHistoryCache(_BaseHistoryCache):
+    """Caches exercise history per template and fetches only uncovered date ranges (async)."""
+
+    def __init__(self, client: Any, *, max_staleness: float = 60.0) -> None:
+        """Initialize the cache.
+
+        Args:
+            client: An `AsyncClient` used to fetch exercise history.
+            max_staleness: Seconds by which the end of an open-ended range may
+                lag behind now before the missing tail is fetched.
+        """
+        super().__init__(client, max_staleness=max_staleness)
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    async def get_exercise_history(
+        self,
+        exercise_template_id: str,
+        *,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> ExerciseHistoryResponse:
+        """Get exercise history, fetching only what is not cached yet.
+
+        Args:
+            exercise_template_id: Unique exercise template identifier.
+            start_date: Optional ISO 8601 start of the range (inclusive).
+            end_date: Optional ISO 8601 end of the range (inclusive).
+
+        Returns:
+            The entries in the range, sorted by workout start time.
+        """
+        lock = self._locks.setdefault(exercise_template_id, asyncio.Lock())
+        async with lock:
+            series = self._series.setdefault(exercise_template_id, _Series())
+            start, end, fetches = self._plan(series, start_date, end_date)
+            for (low, high), fetch_start, fetch_end in fetches:
+                result = await self._client.exercise_history.get_exercise_history(
+                    exercise_template_id, start_date=fetch_start, end_date=fetch_end
+                )
+                series.add(low, high, result.exercise_history)
+            return self._response(series.slice(start, end))
@@ -0,0 +1,74 @@
+"""In-process TTL + LRU cache backend."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, List, Optional
+
+from .base import CacheEntry
+
+__all__ = ["MemoryCache"]
+
+
+class MemoryCache:
+    """Per-process cache holding decoded models, evicting the least recently used.
+
+    Entries are dropped once they can no longer be served, or when more than
+    ``max_entries`` are stored. Safe to share between threads.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries kept before evicting.
+
+        Raises:
+            ValueError: If max_entries is less than 1.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_entries = max_entries
+        self.on_evict: Optional[Callable[[str], None]] = None
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.retain_until <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        evicted: List[str] = []
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                evicted.append(self._entries.popitem(last=False)[0])
+        if self.on_evict is not None:
+            for evicted_key in evicted:
+                self.on_evict(evicted_key)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
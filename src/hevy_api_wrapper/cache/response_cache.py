@@ -0,0 +1,348 @@
+"""Response cache shared by the sync and async clients."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from dataclasses import replace
+from typing import Any, Callable, Dict, Mapping, Optional, Set, Tuple, Union
+from urllib.parse import urlencode
+
+from ..adapters import validate_json
+from ..errors import NotFoundError
+from .base import CacheBackend, CacheEntry, CachePolicy, CacheStats
+from .memory import MemoryCache
+
+__all__ = [
+    "CACHEABLE_ENDPOINTS",
+    "ITEM_ENDPOINTS",
+    "DEPENDENT_ENDPOINTS",
+    "DEFAULT_POLICIES",
+    "ResponseCache",
+    "MetricsHook",
+    "cache_scope",
+]
+
+CACHEABLE_ENDPOINTS = frozenset(
+    {
+        "workouts.get_workouts",
+        "workouts.get_workout",
+        "workouts.get_events",
+        "workouts.get_count",
+        "routines.get_routines",
+        "routines.get_routine",
+        "exercise_templates.get_exercise_templates",
+        "exercise_templates.get_exercise_template",
+        "routine_folders.get_routine_folders",
+        "routine_folders.get_routine_folder",
+        "exercise_history.get_exercise_history",
+    }
+)
+
+# Single-resource lookups, the only endpoints whose 404s are negatively cached.
+ITEM_ENDPOINTS = frozenset(
+    {
+        "workouts.get_workout",
+        "routines.get_routine",
+        "exercise_templates.get_exercise_template",
+        "routine_folders.get_routine_folder",
+    }
+)
+
+# Endpoints whose cached responses go stale when a resource of an item endpoint is written.
+DEPENDENT_ENDPOINTS: Dict[str, Tuple[str, ...]] = {
+    "workouts.get_workout": (
+        "workouts.get_workouts",
+        "workouts.get_count",
+        "workouts.get_events",
+        "exercise_history.get_exercise_history",
+    ),
+    "routines.get_routine": ("routines.get_routines",),
+    "routine_folders.get_routine_folder": ("routine_folders.get_routine_folders",),
+    "exercise_templates.get_exercise_template": ("exercise_templates.get_exercise_templates",),
+}
+
+DEFAULT_POLICIES: Dict[str, CachePolicy] = {
+    "exercise_templates.get_exercise_templates": CachePolicy(ttl=3600.0),
+    "exercise_templates.get_exercise_template": CachePolicy(ttl=3600.0),
+}
+
+
+# Called with (endpoint, counter, amount) whenever a `CacheStats` counter grows.
+MetricsHook = Callable[[str, str, int], None]
+
+
+def cache_scope(base_url: str, api_key: Optional[str], variant: str = "") -> str:
+    """Return the key prefix isolating one account's entries.
+
+    The API key is hashed so it never ends up in a cache key. A non-empty
+    ``variant`` (a client's model backend) keeps entries decoded into other
+    classes apart.
+    """
+    identity = f"{base_url}\0{api_key or ''}" + (f"\0{variant}" if variant else "")
+    return hashlib.sha256(identity.encode()).hexdigest()[:16]
+
+
+class ResponseCache:
+    """Caches decoded GET responses per endpoint.
+
+    Only endpoints with a policy are cached; by default that is the exercise
+    template endpoints, whose data almost never changes. Keys include a hash of
+    the client's base URL and API key, so one cache can be shared by clients of
+    different accounts.
+
+    Entries live in a `CacheBackend`: a per-process `MemoryCache` by default, a
+    persistent `SQLiteCache`, or a `SharedMemoryCache` read by every worker
+    process on the host. Policies with
+    a ``stale_ttl`` serve expired entries immediately while the client refreshes
+    them in the background. Entries stored with an ``ETag`` or ``Last-Modified``
+    header are revalidated with a conditional GET once expired, and a
+    ``304 Not Modified`` reuses the cached model without decoding a body.
+
+    With a ``negative_ttl``, `NotFoundError` results of single-resource lookups
+    are remembered in memory for that long, so repeated lookups of deleted IDs
+    fail without a round trip. Seeing a workout event for a resource forgets
+    its cached result.
+
+    Creating or updating a resource through a client writes the returned model
+    through to the cache and invalidates the list pages and counts it appears
+    in, so the client reads its own writes.
+
+    Per-endpoint counters are available from `stats`; pass a ``metrics_hook``
+    to forward every counter increment to a metrics system.
+
+    Cached models are shared between callers and must not be mutated.
+
+    Example:
+        cache = ResponseCache(policies={"routines.get_routines": CachePolicy(ttl=60)})
+        client = Client.from_env(cache=cache)
+    """
+
+    def __init__(
+        self,
+        *,
+        policies: Optional[Mapping[str, Union[CachePolicy, float]]] = None,
+        max_entries: int = 1024,
+        backend: Optional[CacheBackend] = None,
+        negative_ttl: float = 0.0,
+        metrics_hook: Optional[MetricsHook] = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            policies: Per-endpoint policies (or TTLs in seconds) merged over
+                `DEFAULT_POLICIES`. Endpoints are named ``<group>.<method>``,
+                e.g. ``"routines.get_routines"``. A TTL of zero disables caching.
+            max_entries: Maximum number of entries kept before evicting the least
+                recently used, when no backend is given.
+            backend: Where entries are stored. Defaults to a `MemoryCache`; any
+                object implementing `CacheBackend` works.
+            negative_ttl: Seconds a 404 from a single-resource lookup is
+                remembered. Zero disables negative caching.
+            metrics_hook: Called with ``(endpoint, counter, amount)`` each time
+                a `CacheStats` counter grows, e.g. ``("routines.get_routines",
+                "hits", 1)``. It runs on the requesting thread and must not raise.
+
+        Raises:
+            ValueError: If a policy names an unknown endpoint.
+        """
+        merged: Dict[str, CachePolicy] = dict(DEFAULT_POLICIES)
+        for endpoint, policy in (policies or {}).items():
+            if endpoint not in CACHEABLE_ENDPOINTS:
+                raise ValueError(f"Unknown cacheable endpoint: {endpoint}")
+            merged[endpoint] = policy if isinstance(policy, CachePolicy) else CachePolicy(ttl=float(policy))
+        self._policies = {endpoint: policy for endpoint, policy in merged.items() if policy.ttl > 0}
+        self._backend: CacheBackend = backend if backend is not None else MemoryCache(max_entries=max_entries)
+        self._negative_ttl = negative_ttl
+        self._negative = MemoryCache(max_entries=max_entries)
+        self._stats: Dict[str, CacheStats] = {}
+        self._refreshing: Set[str] = set()
+        self._lock = threading.Lock()
+        self._metrics_hook = metrics_hook
+        if hasattr(self._backend, "on_evict"):
+            self._backend.on_evict = self._evicted  # type: ignore[attr-defined]
+
+    @property
+    def backend(self) -> CacheBackend:
+        return self._backend
+
+    def policy(self, endpoint: str) -> Optional[CachePolicy]:
+        """Return the policy for an endpoint, or None if it is not cached."""
+        return self._policies.get(endpoint)
+
+    def caches(self, endpoint: str) -> bool:
+        """Whether any result of the endpoint, found or not, may be cached."""
+        return endpoint in self._policies or (self._negative_ttl > 0 and endpoint in ITEM_ENDPOINTS)
+
+    @staticmethod
+    def key(scope: str, endpoint: str, url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        """Build the cache key of a request."""
+        key = f"{scope}|{endpoint}|{url}"
+        if params:
+            key += "?" + urlencode(sorted(params.items()))
+        return key
+
+    def _record(self, endpoint: str, **increments: int) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(endpoint, CacheStats())
+            for counter, amount in increments.items():
+                setattr(stats, counter, getattr(stats, counter) + amount)
+        if self._metrics_hook is not None:
+            for counter, amount in increments.items():
+                if amount:
+                    self._metrics_hook(endpoint, counter, amount)
+
+    def _evicted(self, key: str) -> None:
+        parts = key.split("|", 2)
+        if len(parts) == 3:
+            self._record(parts[1], evictions=1)
+
+    def get(self, endpoint: str, key: str, response_type: Any) -> Optional[CacheEntry]:
+        """Return the entry for a key with its value decoded, recording the lookup.
+
+        A fresh entry counts as a hit, a stale one inside its stale window as a
+        stale hit, and anything else (including an expired entry about to be
+        revalidated) as a miss. The entry may be stale or expired; check
+        `CacheEntry.is_fresh` before relying on it.
+        """
+        entry = self._backend.get(key)
+        if entry is None:
+            self._record(endpoint, misses=1)
+            return None
+        if isinstance(entry.value, (bytes, bytearray)):
+            size = entry.size or len(entry.value)
+            entry = replace(entry, value=validate_json(response_type, entry.value), size=size)
+        now = time.time()
+        if entry.is_fresh(now):
+            self._record(endpoint, hits=1, bytes_saved=entry.size, round_trips_saved=1)
+        elif entry.is_servable_stale(now):
+            self._record(endpoint, stale_hits=1)
+        else:
+            self._record(endpoint, misses=1)
+        return entry
+
+    def revalidated(self, endpoint: str, key: str, entry: CacheEntry) -> None:
+        """Record that the server answered a conditional request with 304 Not Modified."""
+        self._record(endpoint, revalidations=1, bytes_saved=entry.size)
+
+    def set(
+        self,
+        endpoint: str,
+        key: str,
+        value: Any,
+        *,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        size: int = 0,
+    ) -> None:
+        """Store a value under the endpoint's policy.
+
+        Args:
+            endpoint: Endpoint name, e.g. ``"routines.get_routines"``.
+            key: Cache key from `key`.
+            value: Decoded response model.
+            etag: The response's ``ETag`` header, used to revalidate the entry.
+            last_modified: The response's ``Last-Modified`` header, used to
+                revalidate the entry.
+            size: Bytes of the response body, counted as saved on each hit.
+        """
+        self._negative.delete(key)
+        policy = self._policies.get(endpoint)
+        if policy is None:
+            return
+        now = time.time()
+        expires_at = now + policy.ttl
+        stale_until = expires_at + policy.stale_ttl if policy.stale_ttl > 0 else None
+        self._backend.set(
+            key,
+            CacheEntry(
+                value=value,
+                stored_at=now,
+                expires_at=expires_at,
+                stale_until=stale_until,
+                etag=etag,
+                last_modified=last_modified,
+                size=size,
+            ),
+        )
+
+    def get_not_found(self, endpoint: str, key: str) -> Optional[NotFoundError]:
+        """Return a fresh copy of the cached `NotFoundError` for a key, if any."""
+        if self._negative_ttl <= 0:
+            return None
+        entry = self._negative.get(key)
+        if entry is None:
+            return None
+        self._record(endpoint, hits=1, round_trips_saved=1)
+        error: NotFoundError = entry.value
+        return NotFoundError(
+            str(error),
+            status_code=error.status_code,
+            error_code=error.error_code,
+            details=error.details,
+            request_id=error.request_id,
+        )
+
+    def set_not_found(self, endpoint: str, key: str, error: NotFoundError) -> None:
+        """Remember that a single-resource lookup returned 404."""
+        if self._negative_ttl <= 0 or endpoint not in ITEM_ENDPOINTS:
+            return
+        now = time.time()
+        self._negative.set(key, CacheEntry(value=error, stored_at=now, expires_at=now + self._negative_ttl))
+
+    def forget(self, key: str) -> None:
+        """Drop the cached result for a key, found or not."""
+        self._backend.delete(key)
+        self._negative.delete(key)
+
+    def write_through(self, scope: str, endpoint: str, key: str, value: Optional[Any] = None) -> None:
+        """Record that a resource was created or updated by a client.
+
+        The resource's own entry is replaced by the written model, or dropped if
+        the write did not return one in the shape its lookup caches, and every
+        entry of `DEPENDENT_ENDPOINTS` in the client's scope is invalidated.
+
+        Args:
+            scope: The writing client's key prefix from `cache_scope`.
+            endpoint: Item endpoint reading the resource back, e.g. ``"routines.get_routine"``.
+            key: Cache key of that lookup.
+            value: The model the lookup would return, if known.
+        """
+        if value is None:
+            self.forget(key)
+        else:
+            self.set(endpoint, key, value)
+        for dependent in DEPENDENT_ENDPOINTS.get(endpoint, ()):
+            self.invalidate(f"{scope}|{dependent}|")
+
+    def begin_refresh(self, key: str) -> bool:
+        """Claim a background refresh of a key; False if one is already running."""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key: str) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def invalidate(self, prefix: str) -> None:
+        """Drop every entry whose key starts with a prefix."""
+        self._backend.delete_prefix(prefix)
+        self._negative.delete_prefix(prefix)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._backend.clear()
+        self._negative.clear()
+
+    @property
+    def stats(self) -> Dict[str, CacheStats]:
+        """Snapshot of the counters per endpoint."""
+        with self._lock:
+            return {endpoint: replace(stats) for endpoint, stats in self._stats.items()}
+
+    def __len__(self) -> int:
+        return len(self._backend)
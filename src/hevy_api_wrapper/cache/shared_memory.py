@@ -0,0 +1,314 @@
+"""Shared-memory cache backend readable by every process on a host."""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import struct
+import sys
+import tempfile
+import threading
+import time
+from multiprocessing import shared_memory
+from typing import Any, Callable, Iterator, Optional, Tuple
+
+from .base import CacheEntry, encode_value
+
+__all__ = ["SharedMemoryCache"]
+
+_MAGIC = b"HEVYSHM1"
+# magic, slots, slot_size
+_HEADER = struct.Struct("<8sII")
+_HEADER_SIZE = 64
+# seq, key hash, stored_at, expires_at, stale_until (NaN for None),
+# key length, etag length, last-modified length, value length
+_SLOT = struct.Struct("<QQdddIHHI")
+_SEQ = struct.Struct("<Q")
+# Number of slots a key may live in, starting at its home slot.
+_PROBE = 8
+_READ_RETRIES = 16
+
+
+def _key_hash(key: bytes) -> int:
+    # Python's hash() is salted per process, so use a stable digest.
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+def _retain_until(header: Tuple[Any, ...]) -> float:
+    """`CacheEntry.retain_until` of a slot header."""
+    _, _, _, expires_at, stale_until, _, etag_len, last_modified_len, _ = header
+    if etag_len or last_modified_len:
+        return math.inf
+    return expires_at if math.isnan(stale_until) else max(expires_at, stale_until)
+
+
+def _open_segment(name: str, create: bool, size: int) -> shared_memory.SharedMemory:
+    """Open a segment without registering it for removal when this process exits."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, create=create, size=size, track=False)
+    segment = shared_memory.SharedMemory(name=name, create=create, size=size)
+    if os.name == "posix":
+        from multiprocessing import resource_tracker
+
+        resource_tracker.unregister(segment._name, "shared_memory")  # type: ignore[attr-defined]
+    return segment
+
+
+class _ProcessLock:
+    """Exclusive lock across the threads and processes of a host, backed by a lock file."""
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._open()
+
+    def _open(self) -> None:
+        self._pid = os.getpid()
+        self._thread_lock = threading.Lock()
+        self._fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o600)
+
+    def __enter__(self) -> None:
+        if os.getpid() != self._pid:
+            # A forked child shares the parent's file description, which would
+            # make the file lock a no-op between them.
+            self._open()
+        self._thread_lock.acquire()
+        try:
+            if os.name == "nt":
+                import msvcrt
+
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+            else:
+                import fcntl
+
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+        except BaseException:
+            self._thread_lock.release()
+            raise
+
+    def __exit__(self, *exc_info: Any) -> None:
+        try:
+            if os.name == "nt":
+                import msvcrt
+
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        finally:
+            self._thread_lock.release()
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class SharedMemoryCache:
+    """Cache in a named shared-memory segment, shared by the worker processes of a host.
+
+    The segment is a fixed table of ``slots`` slots of ``slot_size`` bytes, each
+    holding one entry as JSON bytes. A key may live in any of the few slots
+    following its home slot; when all of them are taken, the oldest entry is
+    replaced. Entries larger than a slot are not cached.
+
+    Reads take no lock: each slot carries a sequence number that writers make
+    odd while they write, and readers retry when it changed under them.
+    Writers serialize on a lock file next to the segment.
+
+    The first process to open a name creates the segment; later ones attach to
+    it. The segment outlives every process using it until `unlink` is called.
+
+    Example:
+        backend = SharedMemoryCache("hevy-cache", slots=4096)
+        cache = ResponseCache(backend=backend)
+    """
+
+    def __init__(self, name: str = "hevy-api-cache", *, slots: int = 4096, slot_size: int = 16384) -> None:
+        """Create or attach to a shared-memory segment.
+
+        Args:
+            name: Segment name, shared by every process using the cache.
+            slots: Number of entries the segment holds.
+            slot_size: Bytes per entry, including the key and a small header.
+
+        Raises:
+            ValueError: If the sizes are too small, or an existing segment of
+                this name was created with different sizes.
+        """
+        if slots < _PROBE:
+            raise ValueError(f"slots must be at least {_PROBE}")
+        if slot_size <= _SLOT.size:
+            raise ValueError(f"slot_size must be larger than {_SLOT.size}")
+        self.name = name
+        self.slots = slots
+        self.slot_size = slot_size
+        self._lock = _ProcessLock(os.path.join(tempfile.gettempdir(), f"{name}.lock"))
+        with self._lock:
+            try:
+                self._segment = _open_segment(name, True, _HEADER_SIZE + slots * slot_size)
+                _HEADER.pack_into(self._segment.buf, 0, _MAGIC, slots, slot_size)
+            except FileExistsError:
+                self._segment = _open_segment(name, False, 0)
+                magic, existing_slots, existing_slot_size = _HEADER.unpack_from(self._segment.buf, 0)
+                if magic != _MAGIC or (existing_slots, existing_slot_size) != (slots, slot_size):
+                    self._segment.close()
+                    raise ValueError(
+                        f"Shared memory segment {name!r} exists with a different layout "
+                        f"({existing_slots} slots of {existing_slot_size} bytes)"
+                    )
+        self._buf = self._segment.buf
+        self.on_evict: Optional[Callable[[str], None]] = None
+
+    def _offset(self, index: int) -> int:
+        return _HEADER_SIZE + index * self.slot_size
+
+    def _probe(self, key_hash: int) -> Iterator[int]:
+        home = key_hash % self.slots
+        for step in range(_PROBE):
+            yield (home + step) % self.slots
+
+    def _read(self, index: int, key_hash: Optional[int] = None) -> Optional[Tuple[Tuple[Any, ...], bytes]]:
+        """Return a consistent copy of a slot's header and payload.
+
+        Returns None if the slot is empty, keeps changing under the reader, or
+        holds a key whose hash is not ``key_hash``.
+        """
+        offset = self._offset(index)
+        capacity = self.slot_size - _SLOT.size
+        for _ in range(_READ_RETRIES):
+            (seq,) = _SEQ.unpack_from(self._buf, offset)
+            if seq & 1:
+                time.sleep(0)
+                continue
+            header = _SLOT.unpack_from(self._buf, offset)
+            if key_hash is not None and header[1] != key_hash:
+                if _SEQ.unpack_from(self._buf, offset)[0] == seq:
+                    return None
+                continue
+            length = min(header[5] + header[6] + header[7] + header[8], capacity)
+            payload = bytes(self._buf[offset + _SLOT.size : offset + _SLOT.size + length])
+            if _SEQ.unpack_from(self._buf, offset)[0] == seq:
+                return (header, payload) if header[5] else None
+        return None
+
+    def _write(self, index: int, header: Tuple[Any, ...], payload: bytes) -> None:
+        """Overwrite a slot; the caller holds the lock."""
+        offset = self._offset(index)
+        (seq,) = _SEQ.unpack_from(self._buf, offset)
+        # A writer that died mid-write left the number odd; round it up so the
+        # slot is even again once this write completes.
+        seq = (seq + 1) & ~1
+        _SEQ.pack_into(self._buf, offset, seq + 1)
+        _SLOT.pack_into(self._buf, offset, seq + 1, *header)
+        self._buf[offset + _SLOT.size : offset + _SLOT.size + len(payload)] = payload
+        _SEQ.pack_into(self._buf, offset, seq + 2)
+
+    def _clear_slot(self, index: int) -> None:
+        self._write(index, (0, 0.0, 0.0, math.nan, 0, 0, 0, 0), b"")
+
+    def _find(self, key: bytes, key_hash: int) -> Iterator[Tuple[int, Tuple[Any, ...], bytes]]:
+        for index in self._probe(key_hash):
+            slot = self._read(index, key_hash)
+            if slot is not None and slot[1][: slot[0][5]] == key:
+                yield index, slot[0], slot[1]
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        key_bytes = key.encode()
+        for _, header, payload in self._find(key_bytes, _key_hash(key_bytes)):
+            if _retain_until(header) <= time.time():
+                return None
+            _, _, stored_at, expires_at, stale_until, key_len, etag_len, last_modified_len, _ = header
+            etag_end = key_len + etag_len
+            value_start = etag_end + last_modified_len
+            return CacheEntry(
+                value=payload[value_start:],
+                stored_at=stored_at,
+                expires_at=expires_at,
+                stale_until=None if math.isnan(stale_until) else stale_until,
+                etag=payload[key_len:etag_end].decode() or None,
+                last_modified=payload[etag_end:value_start].decode() or None,
+            )
+        return None
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        key_bytes = key.encode()
+        key_hash = _key_hash(key_bytes)
+        etag = (entry.etag or "").encode()
+        last_modified = (entry.last_modified or "").encode()
+        value = entry.value if isinstance(entry.value, bytes) else encode_value(entry.value)
+        payload = key_bytes + etag + last_modified + value
+        if len(payload) > self.slot_size - _SLOT.size or len(etag) > 0xFFFF or len(last_modified) > 0xFFFF:
+            # Too large to cache; make sure an older version is not served instead.
+            self.delete(key)
+            return
+        header = (
+            key_hash,
+            entry.stored_at,
+            entry.expires_at,
+            math.nan if entry.stale_until is None else entry.stale_until,
+            len(key_bytes),
+            len(etag),
+            len(last_modified),
+            len(value),
+        )
+        now = time.time()
+        with self._lock:
+            target: Optional[int] = None
+            victim = key_hash % self.slots
+            victim_key = b""
+            oldest = math.inf
+            for index in self._probe(key_hash):
+                slot = self._read(index)
+                if slot is None or _retain_until(slot[0]) <= now:
+                    target = index if target is None else target
+                    continue
+                slot_header, slot_payload = slot
+                if slot_header[1] == key_hash and slot_payload[: slot_header[5]] == key_bytes:
+                    target = index
+                    break
+                if slot_header[2] < oldest:
+                    oldest, victim, victim_key = slot_header[2], index, slot_payload[: slot_header[5]]
+            self._write(victim if target is None else target, header, payload)
+        if target is None and self.on_evict is not None:
+            self.on_evict(victim_key.decode())
+
+    def delete(self, key: str) -> None:
+        key_bytes = key.encode()
+        key_hash = _key_hash(key_bytes)
+        with self._lock:
+            for index, _, _ in list(self._find(key_bytes, key_hash)):
+                self._clear_slot(index)
+
+    def delete_prefix(self, prefix: str) -> None:
+        prefix_bytes = prefix.encode()
+        with self._lock:
+            for index in range(self.slots):
+                slot = self._read(index)
+                if slot is not None and slot[1][: slot[0][5]].startswith(prefix_bytes):
+                    self._clear_slot(index)
+
+    def clear(self) -> None:
+        with self._lock:
+            for index in range(self.slots):
+                if self._read(index) is not None:
+                    self._clear_slot(index)
+
+    def close(self) -> None:
+        """Detach this process from the segment; other processes keep using it."""
+        self._buf = None  # type: ignore[assignment]
+        self._segment.close()
+        self._lock.close()
+
+    def unlink(self) -> None:
+        """Remove the segment; processes still attached keep their mapping until they close it."""
+        if sys.version_info < (3, 13) and os.name == "posix":
+            from multiprocessing import resource_tracker
+
+            # unlink() unregisters the segment, which must be registered first.
+            resource_tracker.register(self._segment._name, "shared_memory")  # type: ignore[attr-defined]
+        self._segment.unlink()
+
+    def __len__(self) -> int:
+        return sum(1 for index in range(self.slots) if self._read(index) is not None)
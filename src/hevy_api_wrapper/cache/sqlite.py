@@ -0,0 +1,167 @@
+"""Persistent SQLite cache backend."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Optional, Union
+
+from .base import CacheEntry, encode_value
+
+__all__ = ["SQLiteCache"]
+
+# Bumped whenever the table layout changes; older tables are dropped, not migrated.
+_SCHEMA_VERSION = 2
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    stale_until REAL,
+    retain_until REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    etag TEXT,
+    last_modified TEXT
+)
+"""
+
+# Refreshing ``accessed_at`` on every read would turn every hit into a write;
+# recency is only tracked to this resolution, which makes eviction approximately LRU.
+_ACCESS_RESOLUTION = 60.0
+_EVICT_EVERY = 64
+
+
+class SQLiteCache:
+    """On-disk cache that survives restarts and is shared by processes on one host.
+
+    Values are stored as JSON bytes and decoded again on read. The database
+    runs in WAL mode, so readers in other processes are not blocked by a
+    writer. Every thread uses its own connection.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike[str]], *, max_entries: int = 10_000, timeout: float = 30.0) -> None:
+        """Initialize the cache, creating the database if needed.
+
+        Args:
+            path: Database file path.
+            max_entries: Number of entries above which the least recently used are evicted.
+            timeout: Seconds to wait for a lock held by another process.
+
+        Raises:
+            ValueError: If max_entries is less than 1.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._path = os.fspath(path)
+        self._timeout = timeout
+        self._local = threading.local()
+        self._writes = 0
+        self.max_entries = max_entries
+        self.on_evict: Optional[Callable[[str], None]] = None
+        conn = self._connection()
+        (version,) = conn.execute("PRAGMA user_version").fetchone()
+        if version != _SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS entries")
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        conn.execute(_SCHEMA)
+        conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)")
+
+    def _connection(self) -> sqlite3.Connection:
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._path, timeout=self._timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT value, stored_at, expires_at, stale_until, retain_until, accessed_at, etag, last_modified"
+            " FROM entries WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        value, stored_at, expires_at, stale_until, retain_until, accessed_at, etag, last_modified = row
+        now = time.time()
+        if retain_until <= now:
+            conn.execute("DELETE FROM entries WHERE key = ? AND retain_until <= ?", (key, now))
+            return None
+        if now - accessed_at > _ACCESS_RESOLUTION:
+            conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+        return CacheEntry(
+            value=bytes(value),
+            stored_at=stored_at,
+            expires_at=expires_at,
+            stale_until=stale_until,
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        value = entry.value if isinstance(entry.value, bytes) else encode_value(entry.value)
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO entries"
+            " (key, value, stored_at, expires_at, stale_until, retain_until, accessed_at, etag, last_modified)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                value,
+                entry.stored_at,
+                entry.expires_at,
+                entry.stale_until,
+                entry.retain_until,
+                time.time(),
+                entry.etag,
+                entry.last_modified,
+            ),
+        )
+        self._writes += 1
+        if self._writes % _EVICT_EVERY == 0:
+            self.evict()
+
+    def evict(self) -> None:
+        """Drop entries that can no longer be served and trim to ``max_entries``."""
+        conn = self._connection()
+        conn.execute("DELETE FROM entries WHERE retain_until <= ?", (time.time(),))
+        (count,) = conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+        if count > self.max_entries:
+            keys = [
+                key
+                for (key,) in conn.execute(
+                    "SELECT key FROM entries ORDER BY accessed_at LIMIT ?", (count - self.max_entries,)
+                )
+            ]
+            conn.executemany("DELETE FROM entries WHERE key = ?", ((key,) for key in keys))
+            if self.on_evict is not None:
+                for key in keys:
+                    self.on_evict(key)
+
+    def delete(self, key: str) -> None:
+        self._connection().execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def delete_prefix(self, prefix: str) -> None:
+        self._connection().execute(
+            "DELETE FROM entries WHERE substr(key, 1, ?) = ?",
+            (len(prefix), prefix),
+        )
+
+    def clear(self) -> None:
+        self._connection().execute("DELETE FROM entries")
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def __len__(self) -> int:
+        (count,) = self._connection().execute("SELECT COUNT(*) FROM entries").fetchone()
+        return int(count)
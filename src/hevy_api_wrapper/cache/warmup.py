@@ -0,0 +1,177 @@
+"""Cache warm-up targets and scheduled refreshers."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Sequence, Type
+
+from ..compact import CompactRoutine, CompactRoutineResponse
+from ..models import (
+    PaginatedExerciseTemplates,
+    PaginatedRoutineFolders,
+    PaginatedRoutines,
+    RoutineResponse,
+)
+
+__all__ = ["WarmTarget", "WARM_TARGETS", "DEFAULT_WARM_TARGETS", "CacheRefresher", "AsyncCacheRefresher"]
+
+
+@dataclass(frozen=True)
+class WarmTarget:
+    """A list endpoint loaded by ``warm()``, and the item lookup its pages answer.
+
+    Attributes:
+        endpoint: List endpoint name, e.g. ``"routines.get_routines"``.
+        url: List endpoint path.
+        response_type: Model of one list page.
+        items_field: Attribute of the page holding the items.
+        page_size: Largest page size the endpoint accepts.
+        item_endpoint: Single-item endpoint seeded from the listed items.
+        item_url: Path of the single-item endpoint, formatted with the item's ``id``.
+        item_value: Builds the single-item response from a listed item.
+    """
+
+    endpoint: str
+    url: str
+    response_type: Type[Any]
+    items_field: str
+    page_size: int
+    item_endpoint: str
+    item_url: str
+    item_value: Callable[[Any], Any]
+
+
+def _routine_response(routine: Any) -> Any:
+    """The ``get_routine`` response wrapping a listed routine, compact or not."""
+    if isinstance(routine, CompactRoutine):
+        return CompactRoutineResponse(routine=routine)
+    return RoutineResponse(routine=routine)
+
+
+WARM_TARGETS = {
+    "exercise_templates": WarmTarget(
+        endpoint="exercise_templates.get_exercise_templates",
+        url="/v1/exercise_templates",
+        response_type=PaginatedExerciseTemplates,
+        items_field="exercise_templates",
+        page_size=100,
+        item_endpoint="exercise_templates.get_exercise_template",
+        item_url="/v1/exercise_templates/{id}",
+        item_value=lambda template: template,
+    ),
+    "routine_folders": WarmTarget(
+        endpoint="routine_folders.get_routine_folders",
+        url="/v1/routine_folders",
+        response_type=PaginatedRoutineFolders,
+        items_field="routine_folders",
+        page_size=10,
+        item_endpoint="routine_folders.get_routine_folder",
+        item_url="/v1/routine_folders/{id}",
+        item_value=lambda folder: folder,
+    ),
+    "routines": WarmTarget(
+        endpoint="routines.get_routines",
+        url="/v1/routines",
+        response_type=PaginatedRoutines,
+        items_field="routines",
+        page_size=10,
+        item_endpoint="routines.get_routine",
+        item_url="/v1/routines/{id}",
+        item_value=lambda routine: _routine_response(routine),
+    ),
+}
+
+DEFAULT_WARM_TARGETS = ("exercise_templates", "routine_folders", "routines")
+
+
+def refresh_interval(cache: Any, targets: Sequence[str], ratio: float) -> float:
+    """Return the refresh period renewing every target's entries before they expire.
+
+    Raises:
+        ValueError: If none of the targets' endpoints has a cache policy.
+    """
+    ttls = []
+    for name in targets:
+        target = WARM_TARGETS[name]
+        for endpoint in (target.endpoint, target.item_endpoint):
+            policy = cache.policy(endpoint)
+            if policy is not None:
+                ttls.append(policy.ttl)
+    if not ttls:
+        raise ValueError("None of the warm-up targets has a cache policy to refresh")
+    return min(ttls) * ratio
+
+
+class CacheRefresher:
+    """Re-runs ``Client.warm()`` on a background thread before cached entries expire.
+
+    Created by `Client.start_refresher`. Failed refreshes are counted in
+    `errors` and retried at the next period; entries keep their previous
+    value meanwhile.
+    """
+
+    def __init__(self, warm: Callable[[], Any], interval: float) -> None:
+        self.interval = interval
+        self.refreshes = 0
+        self.errors = 0
+        self.last_error: Optional[BaseException] = None
+        self._warm = warm
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="hevy-cache-refresher", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            try:
+                self._warm()
+                self.refreshes += 1
+            except Exception as exc:
+                self.errors += 1
+                self.last_error = exc
+
+    def stop(self) -> None:
+        """Stop refreshing and wait for a refresh in progress to finish."""
+        self._stopped.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+
+    @property
+    def running(self) -> bool:
+        return self._thread.is_alive()
+
+
+class AsyncCacheRefresher:
+    """Re-runs ``AsyncClient.warm()`` in a background task before cached entries expire.
+
+    Created by `AsyncClient.start_refresher`; stopped by `stop` or when the
+    client is closed.
+    """
+
+    def __init__(self, warm: Callable[[], Any], interval: float) -> None:
+        self.interval = interval
+        self.refreshes = 0
+        self.errors = 0
+        self.last_error: Optional[BaseException] = None
+        self._warm = warm
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self._warm()
+                self.refreshes += 1
+            except Exception as exc:
+                self.errors += 1
+                self.last_error = exc
+
+    async def stop(self) -> None:
+        """Stop refreshing, cancelling a refresh in progress."""
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+
+    @property
+    def running(self) -> bool:
+        return not self._task.done()
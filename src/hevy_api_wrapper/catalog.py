@@ -0,0 +1,276 @@
+"""Indexed in-memory catalog of exercise templates.
+
+Workouts and routines refer to exercises only by ``exercise_template_id``.
+`ExerciseTemplateCatalog` loads every template once and answers id lookups,
+attribute filters and fuzzy title searches from in-memory indexes instead of
+scanning template pages.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from collections import Counter
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from .models import CustomExerciseType, ExerciseTemplate, MuscleGroup
+
+__all__ = ["ExerciseTemplateCatalog", "trigrams"]
+
+_SNAPSHOT_VERSION = 1
+_PAGE_SIZE = 100
+_WORD = re.compile(r"[0-9a-z]+")
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    """Return the trigrams of a title, case- and punctuation-insensitive.
+
+    Each word is padded with two leading spaces and one trailing space, so
+    word starts weigh more than word middles.
+    """
+    grams: Set[str] = set()
+    for word in _WORD.findall(text.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+class ExerciseTemplateCatalog:
+    """Exercise templates indexed by id, attributes and title trigrams.
+
+    Lookups by id are dictionary reads; `filter` intersects per-attribute
+    indexes; `search` ranks titles by shared trigrams, which tolerates typos
+    and word order (``"press bench"`` finds ``"Bench Press (Barbell)"``).
+
+    Build one with `from_client` / `from_async_client`, or restore it from a
+    file written by `save_snapshot` with `from_snapshot`.
+
+    Example:
+        catalog = ExerciseTemplateCatalog.from_client(client)
+        catalog.title("05293BCA")  # "Bench Press (Barbell)"
+        catalog.search("benchpress", limit=3)
+        catalog.filter(primary_muscle_group=MuscleGroup.chest, is_custom=False)
+    """
+
+    def __init__(self, templates: Iterable[ExerciseTemplate] = ()) -> None:
+        """Index templates; later templates replace earlier ones with the same id.
+
+        Args:
+            templates: The templates to index.
+        """
+        self._by_id: Dict[str, ExerciseTemplate] = {}
+        self._by_primary: Dict[str, Set[str]] = {}
+        self._by_secondary: Dict[str, Set[str]] = {}
+        self._by_type: Dict[str, Set[str]] = {}
+        self._by_custom: Dict[bool, Set[str]] = {True: set(), False: set()}
+        self._trigrams: Dict[str, FrozenSet[str]] = {}
+        self._by_trigram: Dict[str, Set[str]] = {}
+        for template in templates:
+            self.add(template)
+
+    @classmethod
+    def from_client(cls, client: Any, *, page_size: int = _PAGE_SIZE) -> "ExerciseTemplateCatalog":
+        """Load every exercise template through a `Client`.
+
+        Args:
+            client: The client to page through ``get_exercise_templates`` with.
+            page_size: Templates requested per page (1-100).
+
+        Returns:
+            A catalog of all templates visible to the account.
+        """
+        catalog = cls()
+        page = 1
+        while True:
+            result = client.exercise_templates.get_exercise_templates(page=page, page_size=page_size)
+            for template in result.exercise_templates:
+                catalog.add(template)
+            if page >= result.page_count or not result.exercise_templates:
+                return catalog
+            page += 1
+
+    @classmethod
+    async def from_async_client(cls, client: Any, *, page_size: int = _PAGE_SIZE) -> "ExerciseTemplateCatalog":
+        """Load every exercise template through an `AsyncClient`.
+
+        Args:
+            client: The client to page through ``get_exercise_templates`` with.
+            page_size: Templates requested per page (1-100).
+
+        Returns:
+            A catalog of all templates visible to the account.
+        """
+        catalog = cls()
+        page = 1
+        while True:
+            result = await client.exercise_templates.get_exercise_templates(page=page, page_size=page_size)
+            for template in result.exercise_templates:
+                catalog.add(template)
+            if page >= result.page_count or not result.exercise_templates:
+                return catalog
+            page += 1
+
+    def add(self, template: ExerciseTemplate) -> None:
+        """Index a template, replacing any template with the same id."""
+        self.remove(template.id)
+        self._by_id[template.id] = template
+        self._by_primary.setdefault(_value(template.primary_muscle_group), set()).add(template.id)
+        for group in template.secondary_muscle_groups:
+            self._by_secondary.setdefault(_value(group), set()).add(template.id)
+        self._by_type.setdefault(_value(template.type), set()).add(template.id)
+        self._by_custom[template.is_custom].add(template.id)
+        grams = trigrams(template.title)
+        self._trigrams[template.id] = grams
+        for gram in grams:
+            self._by_trigram.setdefault(gram, set()).add(template.id)
+
+    def remove(self, template_id: str) -> None:
+        """Drop a template from the catalog, if present."""
+        template = self._by_id.pop(template_id, None)
+        if template is None:
+            return
+        self._by_primary[_value(template.primary_muscle_group)].discard(template_id)
+        for group in template.secondary_muscle_groups:
+            self._by_secondary[_value(group)].discard(template_id)
+        self._by_type[_value(template.type)].discard(template_id)
+        self._by_custom[template.is_custom].discard(template_id)
+        for gram in self._trigrams.pop(template_id):
+            self._by_trigram[gram].discard(template_id)
+
+    def get(self, template_id: str) -> Optional[ExerciseTemplate]:
+        """Return the template with an id, or None."""
+        return self._by_id.get(template_id)
+
+    def title(self, template_id: str) -> str:
+        """Return the title of a template.
+
+        Raises:
+            KeyError: If no template has the id.
+        """
+        return self._by_id[template_id].title
+
+    def primary_muscle_group(self, template_id: str) -> MuscleGroup:
+        """Return the primary muscle group of a template.
+
+        Raises:
+            KeyError: If no template has the id.
+        """
+        return self._by_id[template_id].primary_muscle_group
+
+    def filter(
+        self,
+        *,
+        primary_muscle_group: Optional[Union[MuscleGroup, str]] = None,
+        secondary_muscle_group: Optional[Union[MuscleGroup, str]] = None,
+        type: Optional[Union[CustomExerciseType, str]] = None,
+        is_custom: Optional[bool] = None,
+    ) -> List[ExerciseTemplate]:
+        """Return the templates matching every given attribute, sorted by title.
+
+        Args:
+            primary_muscle_group: Required primary muscle group.
+            secondary_muscle_group: Muscle group that must be among the secondary ones.
+            type: Required exercise type.
+            is_custom: Whether the templates must be custom (True) or built in (False).
+
+        Returns:
+            The matching templates; all templates if no attribute is given.
+        """
+        candidates: List[Set[str]] = []
+        if primary_muscle_group is not None:
+            candidates.append(self._by_primary.get(_value(primary_muscle_group), set()))
+        if secondary_muscle_group is not None:
+            candidates.append(self._by_secondary.get(_value(secondary_muscle_group), set()))
+        if type is not None:
+            candidates.append(self._by_type.get(_value(type), set()))
+        if is_custom is not None:
+            candidates.append(self._by_custom[is_custom])
+        if not candidates:
+            ids: Iterable[str] = self._by_id
+        else:
+            candidates.sort(key=len)
+            ids = candidates[0].intersection(*candidates[1:])
+        return sorted((self._by_id[i] for i in ids), key=lambda t: t.title)
+
+    def search(self, query: str, *, limit: int = 10, min_score: float = 0.5) -> List[ExerciseTemplate]:
+        """Find templates whose titles resemble a query.
+
+        Titles are scored by the share of the query's trigrams they contain;
+        ties go to the title with fewer extra trigrams.
+
+        Args:
+            query: Free-text exercise name, e.g. ``"incline db press"``.
+            limit: Maximum number of results.
+            min_score: Minimum share of query trigrams (0-1) a title must contain.
+
+        Returns:
+            Up to ``limit`` templates, best match first.
+        """
+        grams = trigrams(query)
+        if not grams:
+            return []
+        shared: Counter[str] = Counter()
+        for gram in grams:
+            shared.update(self._by_trigram.get(gram, ()))
+        ranked: List[Tuple[float, float, str, str]] = []
+        for template_id, count in shared.items():
+            score = count / len(grams)
+            if score < min_score:
+                continue
+            similarity = count / (len(grams) + len(self._trigrams[template_id]) - count)
+            ranked.append((-score, -similarity, self._by_id[template_id].title, template_id))
+        ranked.sort()
+        return [self._by_id[template_id] for *_, template_id in ranked[:limit]]
+
+    def save_snapshot(self, path: Union[str, os.PathLike[str]]) -> None:
+        """Write the templates to a JSON file readable by `from_snapshot`."""
+        snapshot = {
+            "version": _SNAPSHOT_VERSION,
+            "templates": [template.model_dump(mode="json") for template in self._by_id.values()],
+        }
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(snapshot, fh, separators=(",", ":"))
+
+    @classmethod
+    def from_snapshot(cls, path: Union[str, os.PathLike[str]]) -> "ExerciseTemplateCatalog":
+        """Restore a catalog written by `save_snapshot`.
+
+        The snapshot was validated when it was saved, so templates are rebuilt
+        without running validation again.
+
+        Raises:
+            ValueError: If the file is not a catalog snapshot of a supported version.
+        """
+        with open(path, encoding="utf-8") as fh:
+            snapshot = json.load(fh)
+        if not isinstance(snapshot, dict) or snapshot.get("version") != _SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported exercise template snapshot: {path}")
+        return cls(
+            ExerciseTemplate.model_construct(
+                id=data["id"],
+                title=data["title"],
+                type=CustomExerciseType(data["type"]),
+                primary_muscle_group=MuscleGroup(data["primary_muscle_group"]),
+                secondary_muscle_groups=list(data.get("secondary_muscle_groups", [])),
+                is_custom=data["is_custom"],
+            )
+            for data in snapshot["templates"]
+        )
+
+    def __getitem__(self, template_id: str) -> ExerciseTemplate:
+        return self._by_id[template_id]
+
+    def __contains__(self, template_id: object) -> bool:
+        return template_id in self._by_id
+
+    def __iter__(self) -> Iterator[ExerciseTemplate]:
+        return iter(self._by_id.values())
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+
+def _value(value: Any) -> str:
+    """Index key of an enum member or its string value."""
+    return value.value if hasattr(value, "value") else str(value)
@@ -4,17 +4,47 @@ from __future__ import annotations
 
 import asyncio
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Optional, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Sequence, Set, Tuple, Type, TypeVar, cast
 
 import httpx
 
 from . import endpoints as _endpoints
+from .adapters import adapter, dump_json, validate_json
+from .cache import CacheEntry, CacheStats, ResponseCache
+from .cache.response_cache import cache_scope
+from .errors import NotFoundError, raise_for_status
+
+if TYPE_CHECKING:
+    from .cache.warmup import AsyncCacheRefresher, CacheRefresher, WarmTarget
 
 DEFAULT_BASE_URL = "https://api.hevyapp.com/"
 DEFAULT_API_KEY_HEADER = "api-key"
 
+T = TypeVar("T")
+
+MODEL_BACKENDS = ("pydantic", "compact", "lazy")
+
+
+def _backend_types(model_backend: str) -> Mapping[Any, Any]:
+    """Return the response types a model backend decodes in place of the pydantic models.
+
+    The compact and lazy models are imported here, by the clients that use
+    them, so importing the client does not load them.
+    """
+    if model_backend == "compact":
+        from .compact import COMPACT_TYPES
+
+        return COMPACT_TYPES
+    if model_backend == "lazy":
+        from .models import LazyPaginatedWorkouts, LazyWorkout, PaginatedWorkouts, Workout
+
+        return {Workout: LazyWorkout, PaginatedWorkouts: LazyPaginatedWorkouts}
+    return {}
+
 
 @dataclass
 class ClientConfig:
@@ -27,6 +57,10 @@ class ClientConfig:
         timeout: Request timeout in seconds.
         max_retries: Maximum number of retry attempts for failed requests.
         backoff_factor: Multiplier for exponential backoff between retries.
+        model_backend: ``"pydantic"`` for the pydantic models,
+            ``"compact"`` for the slotted dataclasses of `compact` where one
+            exists, or ``"lazy"`` for workouts parsing their exercises on
+            first access (`LazyWorkout`).
     """
 
     base_url: str = DEFAULT_BASE_URL
@@ -35,18 +69,37 @@ class ClientConfig:
     timeout: float = 30.0
     max_retries: int = 3
     backoff_factor: float = 0.5
+    model_backend: str = "pydantic"
 
 
 class _BaseClient:
     """Base client with shared configuration and header building."""
 
-    def __init__(self, *, config: ClientConfig) -> None:
+    def __init__(self, *, config: ClientConfig, cache: Optional[ResponseCache] = None) -> None:
+        if config.model_backend not in MODEL_BACKENDS:
+            raise ValueError(f"model_backend must be one of {', '.join(MODEL_BACKENDS)}")
         self._config = config
+        self._cache = cache
+        self._model_types = _backend_types(config.model_backend)
+        self._cache_scope = cache_scope(
+            config.base_url, config.api_key, config.model_backend if self._model_types else ""
+        )
 
     @property
     def config(self) -> ClientConfig:
         return self._config
 
+    @property
+    def cache(self) -> Optional[ResponseCache]:
+        return self._cache
+
+    def cache_stats(self) -> Dict[str, CacheStats]:
+        """Return the cache counters per endpoint, or an empty dict without a cache.
+
+        The counters belong to the cache and include every client sharing it.
+        """
+        return self._cache.stats if self._cache is not None else {}
+
     def _build_headers(self) -> dict[str, str]:
         """Build request headers including API key authentication."""
         headers: dict[str, str] = {"accept": "application/json"}
@@ -54,6 +107,122 @@ class _BaseClient:
             headers[self._config.api_key_header] = self._config.api_key
         return headers
 
+    def _model_type(self, response_type: Any) -> Any:
+        """Return the class this client decodes ``response_type`` responses into."""
+        return self._model_types.get(response_type, response_type)
+
+    def _decode_type(self, response_type: Any, fields: Optional[Sequence[str]]) -> Tuple[Any, str]:
+        """Return the type to decode a response into and the cache key suffix telling projections apart."""
+        if not fields:
+            return self._model_type(response_type), ""
+        from .projection import project, projection_key
+
+        return project(response_type, fields), projection_key(fields)
+
+    def _cache_key(self, endpoint: str, url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        return ResponseCache.key(self._cache_scope, endpoint, url, params)
+
+    def _invalidate_item(self, endpoint: str, url: str) -> None:
+        """Forget the cached result of a single-resource lookup after it changed."""
+        if self._cache is not None:
+            self._cache.forget(self._cache_key(endpoint, url))
+
+    def _write_through(self, endpoint: str, url: str, value: Optional[Any] = None) -> None:
+        """Seed the lookup of a resource this client wrote and invalidate the lists it appears in."""
+        if self._cache is not None:
+            if self._config.model_backend == "compact":
+                from .compact import to_compact
+
+                value = to_compact(value)
+            else:
+                target = self._model_types.get(type(value))
+                if target is not None:
+                    value = adapter(target).validate_python(value.model_dump())
+            self._cache.write_through(self._cache_scope, endpoint, self._cache_key(endpoint, url), value)
+
+    def _warm_targets(self, targets: Optional[Sequence[str]]) -> Tuple[Sequence[str], Dict[str, WarmTarget]]:
+        """Resolve warm-up target names, None meaning `DEFAULT_WARM_TARGETS`.
+
+        Returns:
+            The target names, and the targets among them the cache would store.
+        """
+        from .cache.warmup import DEFAULT_WARM_TARGETS, WARM_TARGETS
+
+        cache = self._cache
+        if cache is None:
+            raise ValueError("Cache warm-up requires a client created with a cache")
+        if targets is None:
+            targets = DEFAULT_WARM_TARGETS
+        unknown = [name for name in targets if name not in WARM_TARGETS]
+        if unknown:
+            raise ValueError(f"Unknown warm-up targets: {', '.join(unknown)}")
+        resolved = {name: WARM_TARGETS[name] for name in targets}
+        return targets, {
+            name: target
+            for name, target in resolved.items()
+            if cache.policy(target.endpoint) is not None or cache.policy(target.item_endpoint) is not None
+        }
+
+    def _warm_params(self, target: WarmTarget, page: int) -> Tuple[str, Dict[str, Any]]:
+        params: Dict[str, Any] = {"page": page, "pageSize": target.page_size}
+        return self._cache_key(target.endpoint, target.url, params), params
+
+    def _seed_items(self, target: WarmTarget, page: Any) -> int:
+        """Store each listed item as the answer to its single-item lookup."""
+        assert self._cache is not None
+        items = getattr(page, target.items_field)
+        for item in items:
+            url = target.item_url.format(id=item.id)
+            self._cache.set(target.item_endpoint, self._cache_key(target.item_endpoint, url), target.item_value(item))
+        return len(items)
+
+    def _parse_response(self, resp: httpx.Response, response_type: Type[T]) -> T:
+        """Raise for error responses, otherwise build the response model.
+
+        Successful responses are validated straight from the body bytes by the
+        type's shared adapter.
+        """
+        if resp.status_code >= 400:
+            data = resp.json()
+            message = (data.get("message") if isinstance(data, dict) else None) or resp.text
+            code = data.get("code") if isinstance(data, dict) else None
+            raise_for_status(
+                status_code=resp.status_code,
+                message=message,
+                error_code=code,
+                details=data,
+                request_id=None,
+            )
+        return validate_json(response_type, resp.content)
+
+    def _store(
+        self, endpoint: str, key: str, resp: httpx.Response, response_type: Type[T], entry: Optional[CacheEntry]
+    ) -> T:
+        """Decode a cacheable response and store it, reusing the cached model on a 304."""
+        if resp.status_code == 304 and entry is not None:
+            value = cast(T, entry.value)
+            size = entry.size
+            if self._cache is not None:
+                self._cache.revalidated(endpoint, key, entry)
+        else:
+            try:
+                value = self._parse_response(resp, response_type)
+            except NotFoundError as exc:
+                if self._cache is not None:
+                    self._cache.set_not_found(endpoint, key, exc)
+                raise
+            size = len(resp.content)
+        if self._cache is not None:
+            self._cache.set(
+                endpoint,
+                key,
+                value,
+                etag=resp.headers.get("etag") or (entry.etag if entry is not None else None),
+                last_modified=resp.headers.get("last-modified") or (entry.last_modified if entry is not None else None),
+                size=size,
+            )
+        return value
+
 
 class Client(_BaseClient):
     """Synchronous Hevy API client.
@@ -79,6 +248,8 @@ class Client(_BaseClient):
         max_retries: int = 3,
         backoff_factor: float = 0.5,
         transport: Optional[httpx.BaseTransport] = None,
+        cache: Optional[ResponseCache] = None,
+        model_backend: str = "pydantic",
     ) -> None:
         """Initialize the synchronous client.
 
@@ -90,6 +261,14 @@ class Client(_BaseClient):
             max_retries: Maximum number of retry attempts.
             backoff_factor: Multiplier for exponential backoff.
             transport: Optional custom httpx transport.
+            cache: Optional response cache for GET endpoints.
+            model_backend: ``"compact"`` to return the slotted dataclasses of
+                `hevy_api_wrapper.compact` for workouts, routines and exercise
+                history instead of pydantic models, or ``"lazy"`` to return
+                workouts that parse their exercises on first access.
+
+        Raises:
+            ValueError: If ``model_backend`` is unknown.
         """
         super().__init__(
             config=ClientConfig(
@@ -99,13 +278,16 @@ class Client(_BaseClient):
                 timeout=timeout,
                 max_retries=max_retries,
                 backoff_factor=backoff_factor,
-            )
+                model_backend=model_backend,
+            ),
+            cache=cache,
         )
         self._client = httpx.Client(
             base_url=self.config.base_url,
             timeout=self.config.timeout,
             transport=transport,
         )
+        self._refreshers: List[CacheRefresher] = []
 
         self.workouts = _endpoints.WorkoutsSync(self)
         self.routines = _endpoints.RoutinesSync(self)
@@ -128,19 +310,106 @@ class Client(_BaseClient):
         return cls(api_key=token, **kwargs)
 
     def close(self) -> None:
-        """Close the underlying HTTP client."""
+        """Stop cache refreshers and close the underlying HTTP client."""
+        for refresher in self._refreshers:
+            refresher.stop()
         self._client.close()
 
+    def warm(self, targets: Optional[Sequence[str]] = None, *, max_concurrency: int = 4) -> Dict[str, int]:
+        """Load list endpoints into the cache ahead of the first user request.
+
+        Every page of each target is fetched, replacing entries already cached,
+        and every listed item also answers the matching single-item lookup
+        (listing templates fills ``get_exercise_template``). Pages are requested
+        with the endpoint's largest page size, from several threads at once.
+
+        The item lookups are what warm-up is for: pages are cached under that
+        page size only, so list calls with other ``page_size`` values, or none,
+        still go to the API. Targets with no cache policy for either endpoint
+        are skipped; the default `ResponseCache` only warms exercise templates.
+
+        Args:
+            targets: Names from `WARM_TARGETS`; by default exercise templates,
+                routine folders and routines.
+            max_concurrency: Maximum number of requests in flight.
+
+        Returns:
+            Number of items loaded per target, 0 for skipped targets.
+
+        Raises:
+            ValueError: If the client has no cache or a target is unknown.
+        """
+        names, resolved = self._warm_targets(targets)
+        counts = dict.fromkeys(names, 0)
+        with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="hevy-cache-warm") as pool:
+            first_pages = {name: pool.submit(self._warm_page, target, 1) for name, target in resolved.items()}
+            later_pages = []
+            for name, future in first_pages.items():
+                page_count, loaded = future.result()
+                counts[name] += loaded
+                later_pages += [
+                    (name, pool.submit(self._warm_page, resolved[name], p)) for p in range(2, page_count + 1)
+                ]
+            for name, future in later_pages:
+                counts[name] += future.result()[1]
+        return counts
+
+    def _warm_page(self, target: WarmTarget, page: int) -> Tuple[int, int]:
+        key, params = self._warm_params(target, page)
+        result = self._fetch(target.endpoint, key, target.url, params, self._model_type(target.response_type))
+        return result.page_count, self._seed_items(target, result)
+
+    def start_refresher(
+        self,
+        targets: Optional[Sequence[str]] = None,
+        *,
+        interval: Optional[float] = None,
+        ratio: float = 0.8,
+    ) -> CacheRefresher:
+        """Re-run `warm` periodically on a background thread so cached entries never expire.
+
+        Args:
+            targets: Names from `WARM_TARGETS` to keep warm; by default those
+                `warm` loads.
+            interval: Seconds between refreshes. Defaults to ``ratio`` times the
+                shortest TTL among the targets' cache policies.
+            ratio: Share of the TTL after which entries are renewed.
+
+        Returns:
+            The running refresher; it is stopped when the client is closed.
+
+        Raises:
+            ValueError: If the client has no cache, a target is unknown, or no
+                interval is given and the targets have no cache policy.
+        """
+        from .cache.warmup import CacheRefresher, refresh_interval
+
+        names, _ = self._warm_targets(targets)
+        assert self._cache is not None
+        period = interval if interval is not None else refresh_interval(self._cache, names, ratio)
+        refresher = CacheRefresher(lambda: self.warm(names), period)
+        self._refreshers.append(refresher)
+        return refresher
+
     def __enter__(self) -> "Client":
         return self
 
     def __exit__(self, exc_type, exc, tb) -> None:  # type: ignore[override]
         self.close()
 
-    def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
-        """Execute HTTP request with automatic retries for rate limits and server errors."""
+    def _request(
+        self, method: str, url: str, *, body: Any = None, exclude_none: bool = False, **kwargs: Any
+    ) -> httpx.Response:
+        """Execute HTTP request with automatic retries for rate limits and server errors.
+
+        A ``body`` model is serialized to JSON once, and the same bytes are sent
+        on every attempt; ``exclude_none`` leaves its unset optional fields out.
+        """
         headers = kwargs.pop("headers", {})
         merged_headers = {**self._build_headers(), **headers}
+        if body is not None:
+            kwargs["content"] = dump_json(body, exclude_none=exclude_none)
+            merged_headers["content-type"] = "application/json"
 
         retries = 0
         while True:
@@ -155,6 +424,77 @@ class Client(_BaseClient):
                 continue
             return resp
 
+    def _cached_get(
+        self,
+        endpoint: str,
+        url: str,
+        response_type: Type[T],
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> T:
+        """GET and decode a response, serving it from the cache when the endpoint is cached.
+
+        With ``fields``, the response is decoded into its projection (see
+        `projection.project`) and cached apart from the full response.
+        """
+        decode_type, key_suffix = self._decode_type(response_type, fields)
+        response_type = cast(Type[T], decode_type)
+        cache = self._cache
+        if cache is None or not cache.caches(endpoint):
+            return self._parse_response(self._request("GET", url, params=params), response_type)
+        key = self._cache_key(endpoint, url, params) + key_suffix
+        not_found = cache.get_not_found(endpoint, key)
+        if not_found is not None:
+            raise not_found
+        entry = cache.get(endpoint, key, response_type) if cache.policy(endpoint) is not None else None
+        if entry is not None:
+            now = time.time()
+            if entry.is_fresh(now):
+                return cast(T, entry.value)
+            if entry.is_servable_stale(now):
+                if cache.begin_refresh(key):
+                    threading.Thread(
+                        target=self._refresh,
+                        args=(endpoint, key, url, params, response_type, entry),
+                        name="hevy-cache-refresh",
+                        daemon=True,
+                    ).start()
+                return cast(T, entry.value)
+        return self._fetch(endpoint, key, url, params, response_type, entry)
+
+    def _fetch(
+        self,
+        endpoint: str,
+        key: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        response_type: Type[T],
+        entry: Optional[CacheEntry] = None,
+    ) -> T:
+        headers = entry.conditional_headers() if entry is not None else {}
+        resp = self._request("GET", url, params=params, headers=headers)
+        return self._store(endpoint, key, resp, response_type, entry)
+
+    def _refresh(
+        self,
+        endpoint: str,
+        key: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        response_type: Type[T],
+        entry: CacheEntry,
+    ) -> None:
+        """Replace a stale entry; runs on a background thread."""
+        assert self._cache is not None
+        try:
+            self._fetch(endpoint, key, url, params, response_type, entry)
+        except Exception:
+            # The stale entry keeps being served until its stale window ends.
+            pass
+        finally:
+            self._cache.end_refresh(key)
+
 
 class AsyncClient(_BaseClient):
     """Asynchronous Hevy API client.
@@ -180,6 +520,8 @@ class AsyncClient(_BaseClient):
         max_retries: int = 3,
         backoff_factor: float = 0.5,
         transport: Optional[httpx.AsyncBaseTransport] = None,
+        cache: Optional[ResponseCache] = None,
+        model_backend: str = "pydantic",
     ) -> None:
         """Initialize the asynchronous client.
 
@@ -191,6 +533,14 @@ class AsyncClient(_BaseClient):
             max_retries: Maximum number of retry attempts.
             backoff_factor: Multiplier for exponential backoff.
             transport: Optional custom httpx async transport.
+            cache: Optional response cache for GET endpoints.
+            model_backend: ``"compact"`` to return the slotted dataclasses of
+                `hevy_api_wrapper.compact` for workouts, routines and exercise
+                history instead of pydantic models, or ``"lazy"`` to return
+                workouts that parse their exercises on first access.
+
+        Raises:
+            ValueError: If ``model_backend`` is unknown.
         """
         super().__init__(
             config=ClientConfig(
@@ -200,13 +550,17 @@ class AsyncClient(_BaseClient):
                 timeout=timeout,
                 max_retries=max_retries,
                 backoff_factor=backoff_factor,
-            )
+                model_backend=model_backend,
+            ),
+            cache=cache,
         )
         self._client = httpx.AsyncClient(
             base_url=self.config.base_url,
             timeout=self.config.timeout,
             transport=transport,
         )
+        self._refresh_tasks: Set[asyncio.Task[None]] = set()
+        self._refreshers: List[AsyncCacheRefresher] = []
 
         self.workouts = _endpoints.WorkoutsAsync(self)
         self.routines = _endpoints.RoutinesAsync(self)
@@ -229,19 +583,114 @@ class AsyncClient(_BaseClient):
         return cls(api_key=token, **kwargs)
 
     async def aclose(self) -> None:
-        """Close the underlying async HTTP client."""
+        """Cancel background cache refreshes and close the underlying async HTTP client."""
+        for refresher in self._refreshers:
+            await refresher.stop()
+        for task in list(self._refresh_tasks):
+            task.cancel()
+        await asyncio.gather(*self._refresh_tasks, return_exceptions=True)
         await self._client.aclose()
 
+    async def warm(self, targets: Optional[Sequence[str]] = None, *, max_concurrency: int = 4) -> Dict[str, int]:
+        """Load list endpoints into the cache ahead of the first user request.
+
+        Every page of each target is fetched, replacing entries already cached,
+        and every listed item also answers the matching single-item lookup
+        (listing templates fills ``get_exercise_template``). Pages are requested
+        with the endpoint's largest page size, concurrently.
+
+        The item lookups are what warm-up is for: pages are cached under that
+        page size only, so list calls with other ``page_size`` values, or none,
+        still go to the API. Targets with no cache policy for either endpoint
+        are skipped; the default `ResponseCache` only warms exercise templates.
+
+        Args:
+            targets: Names from `WARM_TARGETS`; by default exercise templates,
+                routine folders and routines.
+            max_concurrency: Maximum number of requests in flight.
+
+        Returns:
+            Number of items loaded per target, 0 for skipped targets.
+
+        Raises:
+            ValueError: If the client has no cache or a target is unknown.
+        """
+        names, resolved = self._warm_targets(targets)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def load(target: WarmTarget, page: int) -> Tuple[int, int]:
+            async with semaphore:
+                return await self._warm_page(target, page)
+
+        counts = dict.fromkeys(names, 0)
+        first_pages = await asyncio.gather(*(load(target, 1) for target in resolved.values()))
+        later: List[Tuple[str, int]] = []
+        for name, (page_count, loaded) in zip(resolved, first_pages):
+            counts[name] += loaded
+            later += [(name, page) for page in range(2, page_count + 1)]
+        later_pages = await asyncio.gather(*(load(resolved[name], page) for name, page in later))
+        for (name, _), (_, loaded) in zip(later, later_pages):
+            counts[name] += loaded
+        return counts
+
+    async def _warm_page(self, target: WarmTarget, page: int) -> Tuple[int, int]:
+        key, params = self._warm_params(target, page)
+        result = await self._fetch(target.endpoint, key, target.url, params, self._model_type(target.response_type))
+        return result.page_count, self._seed_items(target, result)
+
+    def start_refresher(
+        self,
+        targets: Optional[Sequence[str]] = None,
+        *,
+        interval: Optional[float] = None,
+        ratio: float = 0.8,
+    ) -> AsyncCacheRefresher:
+        """Re-run `warm` periodically in a background task so cached entries never expire.
+
+        Must be called from a running event loop.
+
+        Args:
+            targets: Names from `WARM_TARGETS` to keep warm; by default those
+                `warm` loads.
+            interval: Seconds between refreshes. Defaults to ``ratio`` times the
+                shortest TTL among the targets' cache policies.
+            ratio: Share of the TTL after which entries are renewed.
+
+        Returns:
+            The running refresher; it is stopped when the client is closed.
+
+        Raises:
+            ValueError: If the client has no cache, a target is unknown, or no
+                interval is given and the targets have no cache policy.
+        """
+        from .cache.warmup import AsyncCacheRefresher, refresh_interval
+
+        names, _ = self._warm_targets(targets)
+        assert self._cache is not None
+        period = interval if interval is not None else refresh_interval(self._cache, names, ratio)
+        refresher = AsyncCacheRefresher(lambda: self.warm(names), period)
+        self._refreshers.append(refresher)
+        return refresher
+
     async def __aenter__(self) -> "AsyncClient":
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:  # type: ignore[override]
         await self.aclose()
 
-    async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
-        """Execute async HTTP request with automatic retries for rate limits and server errors."""
+    async def _request(
+        self, method: str, url: str, *, body: Any = None, exclude_none: bool = False, **kwargs: Any
+    ) -> httpx.Response:
+        """Execute async HTTP request with automatic retries for rate limits and server errors.
+
+        A ``body`` model is serialized to JSON once, and the same bytes are sent
+        on every attempt; ``exclude_none`` leaves its unset optional fields out.
+        """
         headers = kwargs.pop("headers", {})
         merged_headers = {**self._build_headers(), **headers}
+        if body is not None:
+            kwargs["content"] = dump_json(body, exclude_none=exclude_none)
+            merged_headers["content-type"] = "application/json"
 
         retries = 0
         while True:
@@ -255,3 +704,73 @@ class AsyncClient(_BaseClient):
                 await asyncio.sleep(sleep_time)
                 continue
             return resp
+
+    async def _cached_get(
+        self,
+        endpoint: str,
+        url: str,
+        response_type: Type[T],
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> T:
+        """GET and decode a response, serving it from the cache when the endpoint is cached.
+
+        With ``fields``, the response is decoded into its projection (see
+        `projection.project`) and cached apart from the full response.
+        """
+        decode_type, key_suffix = self._decode_type(response_type, fields)
+        response_type = cast(Type[T], decode_type)
+        cache = self._cache
+        if cache is None or not cache.caches(endpoint):
+            return self._parse_response(await self._request("GET", url, params=params), response_type)
+        key = self._cache_key(endpoint, url, params) + key_suffix
+        not_found = cache.get_not_found(endpoint, key)
+        if not_found is not None:
+            raise not_found
+        entry = cache.get(endpoint, key, response_type) if cache.policy(endpoint) is not None else None
+        if entry is not None:
+            now = time.time()
+            if entry.is_fresh(now):
+                return cast(T, entry.value)
+            if entry.is_servable_stale(now):
+                if cache.begin_refresh(key):
+                    task = asyncio.get_running_loop().create_task(
+                        self._refresh(endpoint, key, url, params, response_type, entry)
+                    )
+                    self._refresh_tasks.add(task)
+                    task.add_done_callback(self._refresh_tasks.discard)
+                return cast(T, entry.value)
+        return await self._fetch(endpoint, key, url, params, response_type, entry)
+
+    async def _fetch(
+        self,
+        endpoint: str,
+        key: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        response_type: Type[T],
+        entry: Optional[CacheEntry] = None,
+    ) -> T:
+        headers = entry.conditional_headers() if entry is not None else {}
+        resp = await self._request("GET", url, params=params, headers=headers)
+        return self._store(endpoint, key, resp, response_type, entry)
+
+    async def _refresh(
+        self,
+        endpoint: str,
+        key: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        response_type: Type[T],
+        entry: CacheEntry,
+    ) -> None:
+        """Replace a stale entry; runs as a background task."""
+        assert self._cache is not None
+        try:
+            await self._fetch(endpoint, key, url, params, response_type, entry)
+        except Exception:
+            # The stale entry keeps being served until its stale window ends.
+            pass
+        finally:
+            self._cache.end_refresh(key)
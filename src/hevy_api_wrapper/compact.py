@@ -0,0 +1,259 @@
+"""Compact read models: slotted dataclasses mirroring the bulkiest response models.
+
+A pydantic instance carries an attribute ``__dict__`` plus the bookkeeping
+of which fields were set, which adds up when hundreds of thousands of sets
+are kept in memory. The classes here hold the same fields in ``__slots__``
+and nothing else. They are plain dataclasses: attribute access and equality
+work the same, but there is no ``model_dump`` (use `dataclasses.asdict` or
+``pydantic_core.to_json``) and assignments are not validated.
+
+A client created with ``model_backend="compact"`` returns them instead of
+the pydantic models listed in `COMPACT_TYPES`; every other response keeps
+its pydantic model.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from .adapters import adapter
+from .models import (
+    ExerciseHistoryEntry,
+    ExerciseHistoryResponse,
+    PaginatedRoutines,
+    PaginatedWorkouts,
+    RepRange,
+    Routine,
+    RoutineExercise,
+    RoutineResponse,
+    RoutineSet,
+    Workout,
+    WorkoutExercise,
+    WorkoutSet,
+)
+from .timestamps import parse_timestamp
+
+__all__ = [
+    "CompactWorkoutSet",
+    "CompactWorkoutExercise",
+    "CompactWorkout",
+    "CompactPaginatedWorkouts",
+    "CompactRepRange",
+    "CompactRoutineSet",
+    "CompactRoutineExercise",
+    "CompactRoutine",
+    "CompactRoutineResponse",
+    "CompactPaginatedRoutines",
+    "CompactExerciseHistoryEntry",
+    "CompactExerciseHistoryResponse",
+    "COMPACT_TYPES",
+    "to_compact",
+]
+
+
+@dataclass(slots=True, kw_only=True)
+class CompactWorkoutSet:
+    """Compact `WorkoutSet`."""
+
+    index: int
+    type: str
+    weight_kg: Optional[float] = None
+    reps: Optional[int] = None
+    distance_meters: Optional[float] = None
+    duration_seconds: Optional[float] = None
+    rpe: Optional[float] = None
+    custom_metric: Optional[float] = None
+
+
+@dataclass(slots=True, kw_only=True)
+class CompactWorkoutExercise:
+    """Compact `WorkoutExercise`."""
+
+    index: int
+    title: str
+    notes: Optional[str] = None
+    exercise_template_id: str
+    supersets_id: Optional[int] = None
+    sets: List[CompactWorkoutSet]
+
+
+@dataclass(slots=True, kw_only=True)
+class CompactWorkout:
+    """Compact `Workout`."""
+
+    id: str
+    title: str
+    routine_id: Optional[str] = None
+    description: Optional[str] = None
+    start_time: str
+    end_time: str
+    updated_at: str
+    created_at: str
+    exercises: List[CompactWorkoutExercise]
+
+    @property
+    def start_datetime(self) -> datetime:
+        """``start_time`` as a timezone-aware datetime."""
+        return parse_timestamp(self.start_time)
+
+    @property
+    def end_datetime(self) -> datetime:
+        """``end_time`` as a timezone-aware datetime."""
+        return parse_timestamp(self.end_time)
+
+    @property
+    def updated_datetime(self) -> datetime:
+        """``updated_at`` as a timezone-aware datetime."""
+        return parse_timestamp(self.updated_at)
+
+    @property
+    def created_datetime(self) -> datetime:
+        """``created_at`` as a timezone-aware datetime."""
+        return parse_timestamp(self.created_at)
+
+
+@dataclass(slots=True, kw_only=True)
+class CompactPaginatedWorkouts:
+    """Compact `PaginatedWorkouts`."""
+
+    page: int
+    page_count: int
+    workouts: List[CompactWorkout]
+
+
+@dataclass(slots=True, kw_only=True)
+class CompactRepRange:
+    """Compact `RepRange`."""
+
+    start: Optional[float] = None
+    end: Optional[float] = None
+
+
+@dataclass(slots=True, kw_only=True)
+class CompactRoutineSet:
+    """Compact `RoutineSet`."""
+
+    index: int
+    type: str
+    weight_kg: Optional[float] = None
+    reps: Optional[int] = None
+    rep_range: Optional[CompactRepRange] = None
+    distance_meters: Optional[float] = None
+    duration_seconds: Optional[float] = None
+    rpe: Optional[float] = None
+    custom_metric: Optional[float] = None
+
+
+@dataclass(slots=True, kw_only=True)
+class CompactRoutineExercise:
+    """Compact `RoutineExercise`."""
+
+    index: int
+    title: str
+    rest_seconds: Optional[int] = None
+    notes: Optional[str] = None
+    exercise_template_id: str
+    supersets_id: Optional[int] = None
+    sets: List[CompactRoutineSet]
+
+
+@dataclass(slots=True, kw_only=True)
+class CompactRoutine:
+    """Compact `Routine`."""
+
+    id: str
+    title: str
+    folder_id: Optional[int] = None
+    updated_at: str
+    created_at: str
+    exercises: List[CompactRoutineExercise]
+
+    @property
+    def updated_datetime(self) -> datetime:
+        """``updated_at`` as a timezone-aware datetime."""
+        return parse_timestamp(self.updated_at)
+
+    @property
+    def created_datetime(self) -> datetime:
+        """``created_at`` as a timezone-aware datetime."""
+        return parse_timestamp(self.created_at)
+
+
+@dataclass(slots=True, kw_only=True)
+class CompactRoutineResponse:
+    """Compact `RoutineResponse`."""
+
+    routine: CompactRoutine
+
+
+@dataclass(slots=True, kw_only=True)
+class CompactPaginatedRoutines:
+    """Compact `PaginatedRoutines`."""
+
+    page: int
+    page_count: int
+    routines: List[CompactRoutine]
+
+
+@dataclass(slots=True, kw_only=True)
+class CompactExerciseHistoryEntry:
+    """Compact `ExerciseHistoryEntry`."""
+
+    workout_id: str
+    workout_title: str
+    workout_start_time: str
+    workout_end_time: str
+    exercise_template_id: str
+    weight_kg: Optional[float] = None
+    reps: Optional[int] = None
+    distance_meters: Optional[int] = None
+    duration_seconds: Optional[int] = None
+    rpe: Optional[float] = None
+    custom_metric: Optional[float] = None
+    set_type: str
+
+    @property
+    def workout_start_datetime(self) -> datetime:
+        """``workout_start_time`` as a timezone-aware datetime."""
+        return parse_timestamp(self.workout_start_time)
+
+    @property
+    def workout_end_datetime(self) -> datetime:
+        """``workout_end_time`` as a timezone-aware datetime."""
+        return parse_timestamp(self.workout_end_time)
+
+
+@dataclass(slots=True, kw_only=True)
+class CompactExerciseHistoryResponse:
+    """Compact `ExerciseHistoryResponse`."""
+
+    exercise_history: List[CompactExerciseHistoryEntry]
+
+
+COMPACT_TYPES: Dict[Any, Any] = {
+    WorkoutSet: CompactWorkoutSet,
+    WorkoutExercise: CompactWorkoutExercise,
+    Workout: CompactWorkout,
+    PaginatedWorkouts: CompactPaginatedWorkouts,
+    RepRange: CompactRepRange,
+    RoutineSet: CompactRoutineSet,
+    RoutineExercise: CompactRoutineExercise,
+    Routine: CompactRoutine,
+    RoutineResponse: CompactRoutineResponse,
+    PaginatedRoutines: CompactPaginatedRoutines,
+    ExerciseHistoryEntry: CompactExerciseHistoryEntry,
+    ExerciseHistoryResponse: CompactExerciseHistoryResponse,
+}
+
+
+def to_compact(value: Any) -> Any:
+    """Convert a pydantic model listed in `COMPACT_TYPES` to its compact class.
+
+    Other values, including compact instances, are returned unchanged.
+    """
+    compact_type = COMPACT_TYPES.get(type(value))
+    if compact_type is None:
+        return value
+    return adapter(compact_type).validate_python(value.model_dump())
@@ -1,12 +1,19 @@
-"""API endpoint operation classes (sync and async)."""
+"""API endpoint operation classes (sync and async).
+
+Each class is imported from its module on first access.
+"""
 
 from __future__ import annotations
 
-from .exercise_history import ExerciseHistoryAsync, ExerciseHistorySync
-from .exercise_templates import ExerciseTemplatesAsync, ExerciseTemplatesSync
-from .routine_folders import RoutineFoldersAsync, RoutineFoldersSync
-from .routines import RoutinesAsync, RoutinesSync
-from .workouts import WorkoutsAsync, WorkoutsSync
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .exercise_history import ExerciseHistoryAsync, ExerciseHistorySync
+    from .exercise_templates import ExerciseTemplatesAsync, ExerciseTemplatesSync
+    from .routine_folders import RoutineFoldersAsync, RoutineFoldersSync
+    from .routines import RoutinesAsync, RoutinesSync
+    from .workouts import WorkoutsAsync, WorkoutsSync
 
 __all__ = [
     "WorkoutsSync",
@@ -20,3 +27,29 @@ __all__ = [
     "ExerciseHistorySync",
     "ExerciseHistoryAsync",
 ]
+
+_MODULES = {
+    "WorkoutsSync": ".workouts",
+    "WorkoutsAsync": ".workouts",
+    "RoutinesSync": ".routines",
+    "RoutinesAsync": ".routines",
+    "ExerciseTemplatesSync": ".exercise_templates",
+    "ExerciseTemplatesAsync": ".exercise_templates",
+    "RoutineFoldersSync": ".routine_folders",
+    "RoutineFoldersAsync": ".routine_folders",
+    "ExerciseHistorySync": ".exercise_history",
+    "ExerciseHistoryAsync": ".exercise_history",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
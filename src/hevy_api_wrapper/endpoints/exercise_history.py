@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Sequence
 
-from ..errors import raise_for_status
 from ..models import ExerciseHistoryResponse
 
 
@@ -20,6 +19,7 @@ class ExerciseHistorySync:
         *,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> ExerciseHistoryResponse:
         """Get exercise history for a specific exercise template.
 
@@ -27,6 +27,10 @@ class ExerciseHistorySync:
             exercise_template_id: Unique exercise template identifier.
             start_date: Optional ISO 8601 start date filter.
             end_date: Optional ISO 8601 end date filter.
+            fields: Optional dotted paths of item fields to keep, e.g.
+                ``["workout_start_time", "weight_kg", "reps"]``; other fields are dropped
+                while decoding and the result is a projection of the model
+                (see `hevy_api_wrapper.projection`).
 
         Returns:
             Exercise history response with list of historical entries.
@@ -36,20 +40,13 @@ class ExerciseHistorySync:
             params["start_date"] = start_date
         if end_date is not None:
             params["end_date"] = end_date
-        resp = self._client._request("GET", f"/v1/exercise_history/{exercise_template_id}", params=params)
-
-        data = resp.json()
-        if resp.status_code >= 400:
-            message = (data.get("message") if isinstance(data, dict) else None) or resp.text
-            code = data.get("code") if isinstance(data, dict) else None
-            raise_for_status(
-                status_code=resp.status_code,
-                message=message,
-                error_code=code,
-                details=data,
-                request_id=None,
-            )
-        return ExerciseHistoryResponse(**data)
+        return self._client._cached_get(
+            "exercise_history.get_exercise_history",
+            f"/v1/exercise_history/{exercise_template_id}",
+            ExerciseHistoryResponse,
+            params=params,
+            fields=fields,
+        )
 
 
 class ExerciseHistoryAsync:
@@ -64,6 +61,7 @@ class ExerciseHistoryAsync:
         *,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> ExerciseHistoryResponse:
         """Get exercise history for a specific exercise template.
 
@@ -71,6 +69,10 @@ class ExerciseHistoryAsync:
             exercise_template_id: Unique exercise template identifier.
             start_date: Optional ISO 8601 start date filter.
             end_date: Optional ISO 8601 end date filter.
+            fields: Optional dotted paths of item fields to keep, e.g.
+                ``["workout_start_time", "weight_kg", "reps"]``; other fields are dropped
+                while decoding and the result is a projection of the model
+                (see `hevy_api_wrapper.projection`).
 
         Returns:
             Exercise history response with list of historical entries.
@@ -80,17 +82,10 @@ class ExerciseHistoryAsync:
             params["start_date"] = start_date
         if end_date is not None:
             params["end_date"] = end_date
-        resp = await self._client._request("GET", f"/v1/exercise_history/{exercise_template_id}", params=params)
-
-        data = resp.json()
-        if resp.status_code >= 400:
-            message = (data.get("message") if isinstance(data, dict) else None) or resp.text
-            code = data.get("code") if isinstance(data, dict) else None
-            raise_for_status(
-                status_code=resp.status_code,
-                message=message,
-                error_code=code,
-                details=data,
-                request_id=None,
-            )
-        return ExerciseHistoryResponse(**data)
+        return await self._client._cached_get(
+            "exercise_history.get_exercise_history",
+            f"/v1/exercise_history/{exercise_template_id}",
+            ExerciseHistoryResponse,
+            params=params,
+            fields=fields,
+        )
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Sequence
 
 from ..errors import raise_for_status
 from ..models import (
@@ -19,12 +19,18 @@ class ExerciseTemplatesSync:
     def __init__(self, client: Any) -> None:
         self._client = client
 
-    def get_exercise_templates(self, *, page: Optional[int] = None, page_size: int = 5) -> PaginatedExerciseTemplates:
+    def get_exercise_templates(
+        self, *, page: Optional[int] = None, page_size: int = 5, fields: Optional[Sequence[str]] = None
+    ) -> PaginatedExerciseTemplates:
         """List exercise templates with pagination.
 
         Args:
             page: Page number to retrieve (1-indexed).
             page_size: Number of templates per page (1-100).
+            fields: Optional dotted paths of item fields to keep, e.g.
+                ``["id", "title", "primary_muscle_group"]``; other fields are dropped
+                while decoding and the result is a projection of the model
+                (see `hevy_api_wrapper.projection`).
 
         Returns:
             Paginated list of exercise templates.
@@ -38,20 +44,13 @@ class ExerciseTemplatesSync:
                 raise ValueError("page_size must be between 1 and 100 inclusive")
             params["page"] = page
             params["pageSize"] = page_size
-        resp = self._client._request("GET", "/v1/exercise_templates", params=params)
-
-        data = resp.json()
-        if resp.status_code >= 400:
-            message = (data.get("message") if isinstance(data, dict) else None) or resp.text
-            code = data.get("code") if isinstance(data, dict) else None
-            raise_for_status(
-                status_code=resp.status_code,
-                message=message,
-                error_code=code,
-                details=data,
-                request_id=None,
-            )
-        return PaginatedExerciseTemplates(**data)
+        return self._client._cached_get(
+            "exercise_templates.get_exercise_templates",
+            "/v1/exercise_templates",
+            PaginatedExerciseTemplates,
+            params=params,
+            fields=fields,
+        )
 
     def create_custom_exercise(self, body: CreateCustomExerciseRequestBody) -> CreateCustomExerciseResponse:
         """Create a custom exercise template.
@@ -62,7 +61,7 @@ class ExerciseTemplatesSync:
         Returns:
             Response containing the ID of the created custom exercise.
         """
-        resp = self._client._request("POST", "/v1/exercise_templates", json=body.model_dump())
+        resp = self._client._request("POST", "/v1/exercise_templates", body=body)
 
         if resp.status_code >= 400:
             try:
@@ -85,9 +84,12 @@ class ExerciseTemplatesSync:
 
         if "application/json" in content_type:
             data = resp.json()
-            return CreateCustomExerciseResponse(**data)
+            created = CreateCustomExerciseResponse(**data)
         else:
-            return CreateCustomExerciseResponse(id=resp.text)
+            created = CreateCustomExerciseResponse(id=resp.text)
+        # Only the new ID is returned, so the template is read back on the next lookup.
+        self._client._write_through("exercise_templates.get_exercise_template", f"/v1/exercise_templates/{created.id}")
+        return created
 
     def get_exercise_template(self, exercise_template_id: str) -> ExerciseTemplate:
         """Get a single exercise template by ID.
@@ -98,20 +100,11 @@ class ExerciseTemplatesSync:
         Returns:
             The exercise template details.
         """
-        resp = self._client._request("GET", f"/v1/exercise_templates/{exercise_template_id}")
-
-        data = resp.json()
-        if resp.status_code >= 400:
-            message = (data.get("message") if isinstance(data, dict) else None) or resp.text
-            code = data.get("code") if isinstance(data, dict) else None
-            raise_for_status(
-                status_code=resp.status_code,
-                message=message,
-                error_code=code,
-                details=data,
-                request_id=None,
-            )
-        return ExerciseTemplate(**data)
+        return self._client._cached_get(
+            "exercise_templates.get_exercise_template",
+            f"/v1/exercise_templates/{exercise_template_id}",
+            ExerciseTemplate,
+        )
 
 
 class ExerciseTemplatesAsync:
@@ -121,13 +114,17 @@ class ExerciseTemplatesAsync:
         self._client = client
 
     async def get_exercise_templates(
-        self, *, page: Optional[int] = None, page_size: int = 5
+        self, *, page: Optional[int] = None, page_size: int = 5, fields: Optional[Sequence[str]] = None
     ) -> PaginatedExerciseTemplates:
         """List exercise templates with pagination.
 
         Args:
             page: Page number to retrieve (1-indexed).
             page_size: Number of templates per page (1-100).
+            fields: Optional dotted paths of item fields to keep, e.g.
+                ``["id", "title", "primary_muscle_group"]``; other fields are dropped
+                while decoding and the result is a projection of the model
+                (see `hevy_api_wrapper.projection`).
 
         Returns:
             Paginated list of exercise templates.
@@ -141,20 +138,13 @@ class ExerciseTemplatesAsync:
                 raise ValueError("page_size must be between 1 and 100 inclusive")
             params["page"] = page
             params["pageSize"] = page_size
-        resp = await self._client._request("GET", "/v1/exercise_templates", params=params)
-
-        data = resp.json()
-        if resp.status_code >= 400:
-            message = (data.get("message") if isinstance(data, dict) else None) or resp.text
-            code = data.get("code") if isinstance(data, dict) else None
-            raise_for_status(
-                status_code=resp.status_code,
-                message=message,
-                error_code=code,
-                details=data,
-                request_id=None,
-            )
-        return PaginatedExerciseTemplates(**data)
+        return await self._client._cached_get(
+            "exercise_templates.get_exercise_templates",
+            "/v1/exercise_templates",
+            PaginatedExerciseTemplates,
+            params=params,
+            fields=fields,
+        )
 
     async def create_custom_exercise(self, body: CreateCustomExerciseRequestBody) -> CreateCustomExerciseResponse:
         """Create a custom exercise template.
@@ -165,7 +155,7 @@ class ExerciseTemplatesAsync:
         Returns:
             Response containing the ID of the created custom exercise.
         """
-        resp = await self._client._request("POST", "/v1/exercise_templates", json=body.model_dump())
+        resp = await self._client._request("POST", "/v1/exercise_templates", body=body)
 
         if resp.status_code >= 400:
             try:
@@ -188,9 +178,12 @@ class ExerciseTemplatesAsync:
 
         if "application/json" in content_type:
             data = resp.json()
-            return CreateCustomExerciseResponse(**data)
+            created = CreateCustomExerciseResponse(**data)
         else:
-            return CreateCustomExerciseResponse(id=resp.text)
+            created = CreateCustomExerciseResponse(id=resp.text)
+        # Only the new ID is returned, so the template is read back on the next lookup.
+        self._client._write_through("exercise_templates.get_exercise_template", f"/v1/exercise_templates/{created.id}")
+        return created
 
     async def get_exercise_template(self, exercise_template_id: str) -> ExerciseTemplate:
         """Get a single exercise template by ID.
@@ -201,16 +194,8 @@ class ExerciseTemplatesAsync:
         Returns:
             The exercise template details.
         """
-        resp = await self._client._request("GET", f"/v1/exercise_templates/{exercise_template_id}")
-        data = resp.json()
-        if resp.status_code >= 400:
-            message = (data.get("message") if isinstance(data, dict) else None) or resp.text
-            code = data.get("code") if isinstance(data, dict) else None
-            raise_for_status(
-                status_code=resp.status_code,
-                message=message,
-                error_code=code,
-                details=data,
-                request_id=None,
-            )
-        return ExerciseTemplate(**data)
+        return await self._client._cached_get(
+            "exercise_templates.get_exercise_template",
+            f"/v1/exercise_templates/{exercise_template_id}",
+            ExerciseTemplate,
+        )
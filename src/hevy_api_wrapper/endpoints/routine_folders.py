@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Sequence
 
 from ..errors import raise_for_status
 from ..models import PaginatedRoutineFolders, PostRoutineFolderRequestBody, RoutineFolder, RoutineFolderResponse
@@ -14,12 +14,18 @@ class RoutineFoldersSync:
     def __init__(self, client: Any) -> None:
         self._client = client
 
-    def get_routine_folders(self, *, page: Optional[int] = None, page_size: int = 5) -> PaginatedRoutineFolders:
+    def get_routine_folders(
+        self, *, page: Optional[int] = None, page_size: int = 5, fields: Optional[Sequence[str]] = None
+    ) -> PaginatedRoutineFolders:
         """List routine folders with pagination.
 
         Args:
             page: Page number to retrieve (1-indexed).
             page_size: Number of folders per page (1-10).
+            fields: Optional dotted paths of item fields to keep, e.g.
+                ``["id", "title"]``; other fields are dropped
+                while decoding and the result is a projection of the model
+                (see `hevy_api_wrapper.projection`).
 
         Returns:
             Paginated list of routine folders.
@@ -33,20 +39,13 @@ class RoutineFoldersSync:
                 raise ValueError("page_size must be between 1 and 10 inclusive")
             params["page"] = page
             params["pageSize"] = page_size
-        resp = self._client._request("GET", "/v1/routine_folders", params=params)
-
-        data = resp.json()
-        if resp.status_code >= 400:
-            message = (data.get("message") if isinstance(data, dict) else None) or resp.text
-            code = data.get("code") if isinstance(data, dict) else None
-            raise_for_status(
-                status_code=resp.status_code,
-                message=message,
-                error_code=code,
-                details=data,
-                request_id=None,
-            )
-        return PaginatedRoutineFolders(**data)
+        return self._client._cached_get(
+            "routine_folders.get_routine_folders",
+            "/v1/routine_folders",
+            PaginatedRoutineFolders,
+            params=params,
+            fields=fields,
+        )
 
     def create_routine_folder(self, body: PostRoutineFolderRequestBody) -> RoutineFolder:
         """Create a new routine folder.
@@ -57,7 +56,7 @@ class RoutineFoldersSync:
         Returns:
             The created routine folder.
         """
-        resp = self._client._request("POST", "/v1/routine_folders", json=body.model_dump())
+        resp = self._client._request("POST", "/v1/routine_folders", body=body)
 
         data = resp.json()
         if resp.status_code >= 400:
@@ -70,7 +69,9 @@ class RoutineFoldersSync:
                 details=data,
                 request_id=None,
             )
-        return RoutineFolderResponse(**data).routine_folder
+        folder = RoutineFolderResponse(**data).routine_folder
+        self._client._write_through("routine_folders.get_routine_folder", f"/v1/routine_folders/{folder.id}", folder)
+        return folder
 
     def get_routine_folder(self, folder_id: int) -> RoutineFolder:
         """Get a single routine folder by ID.
@@ -81,20 +82,9 @@ class RoutineFoldersSync:
         Returns:
             The routine folder details.
         """
-        resp = self._client._request("GET", f"/v1/routine_folders/{folder_id}")
-
-        data = resp.json()
-        if resp.status_code >= 400:
-            message = (data.get("message") if isinstance(data, dict) else None) or resp.text
-            code = data.get("code") if isinstance(data, dict) else None
-            raise_for_status(
-                status_code=resp.status_code,
-                message=message,
-                error_code=code,
-                details=data,
-                request_id=None,
-            )
-        return RoutineFolder(**data)
+        return self._client._cached_get(
+            "routine_folders.get_routine_folder", f"/v1/routine_folders/{folder_id}", RoutineFolder
+        )
 
 
 class RoutineFoldersAsync:
@@ -103,12 +93,18 @@ class RoutineFoldersAsync:
     def __init__(self, client: Any) -> None:
         self._client = client
 
-    async def get_routine_folders(self, *, page: Optional[int] = None, page_size: int = 5) -> PaginatedRoutineFolders:
+    async def get_routine_folders(
+        self, *, page: Optional[int] = None, page_size: int = 5, fields: Optional[Sequence[str]] = None
+    ) -> PaginatedRoutineFolders:
         """List routine folders with pagination.
 
         Args:
             page: Page number to retrieve (1-indexed).
             page_size: Number of folders per page (1-10).
+            fields: Optional dotted paths of item fields to keep, e.g.
+                ``["id", "title"]``; other fields are dropped
+                while decoding and the result is a projection of the model
+                (see `hevy_api_wrapper.projection`).
 
         Returns:
             Paginated list of routine folders.
@@ -122,20 +118,13 @@ class RoutineFoldersAsync:
                 raise ValueError("page_size must be between 1 and 10 inclusive")
             params["page"] = page
             params["pageSize"] = page_size
-        resp = await self._client._request("GET", "/v1/routine_folders", params=params)
-
-        data = resp.json()
-        if resp.status_code >= 400:
-            message = (data.get("message") if isinstance(data, dict) else None) or resp.text
-            code = data.get("code") if isinstance(data, dict) else None
-            raise_for_status(
-                status_code=resp.status_code,
-                message=message,
-                error_code=code,
-                details=data,
-                request_id=None,
-            )
-        return PaginatedRoutineFolders(**data)
+        return await self._client._cached_get(
+            "routine_folders.get_routine_folders",
+            "/v1/routine_folders",
+            PaginatedRoutineFolders,
+            params=params,
+            fields=fields,
+        )
 
     async def create_routine_folder(self, body: PostRoutineFolderRequestBody) -> RoutineFolder:
         """Create a new routine folder.
@@ -146,7 +135,7 @@ class RoutineFoldersAsync:
         Returns:
             The created routine folder.
         """
-        resp = await self._client._request("POST", "/v1/routine_folders", json=body.model_dump())
+        resp = await self._client._request("POST", "/v1/routine_folders", body=body)
 
         data = resp.json()
         if resp.status_code >= 400:
@@ -159,7 +148,9 @@ class RoutineFoldersAsync:
                 details=data,
                 request_id=None,
             )
-        return RoutineFolderResponse(**data).routine_folder
+        folder = RoutineFolderResponse(**data).routine_folder
+        self._client._write_through("routine_folders.get_routine_folder", f"/v1/routine_folders/{folder.id}", folder)
+        return folder
 
     async def get_routine_folder(self, folder_id: int) -> RoutineFolder:
         """Get a single routine folder by ID.
@@ -170,17 +161,6 @@ class RoutineFoldersAsync:
         Returns:
             The routine folder details.
         """
-        resp = await self._client._request("GET", f"/v1/routine_folders/{folder_id}")
-
-        data = resp.json()
-        if resp.status_code >= 400:
-            message = (data.get("message") if isinstance(data, dict) else None) or resp.text
-            code = data.get("code") if isinstance(data, dict) else None
-            raise_for_status(
-                status_code=resp.status_code,
-                message=message,
-                error_code=code,
-                details=data,
-                request_id=None,
-            )
-        return RoutineFolder(**data)
+        return await self._client._cached_get(
+            "routine_folders.get_routine_folder", f"/v1/routine_folders/{folder_id}", RoutineFolder
+        )
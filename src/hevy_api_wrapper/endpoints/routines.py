@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Sequence
 
 from ..errors import raise_for_status
 from ..models import (
@@ -21,12 +21,18 @@ class RoutinesSync:
     def __init__(self, client: Any) -> None:
         self._client = client
 
-    def get_routines(self, *, page: Optional[int] = None, page_size: int = 5) -> PaginatedRoutines:
+    def get_routines(
+        self, *, page: Optional[int] = None, page_size: int = 5, fields: Optional[Sequence[str]] = None
+    ) -> PaginatedRoutines:
         """List routines with pagination.
 
         Args:
             page: Page number to retrieve (1-indexed).
             page_size: Number of routines per page (1-10).
+            fields: Optional dotted paths of item fields to keep, e.g.
+                ``["id", "title", "exercises.exercise_template_id"]``; other fields are dropped
+                while decoding and the result is a projection of the model
+                (see `hevy_api_wrapper.projection`).
 
         Returns:
             Paginated list of routines.
@@ -40,20 +46,9 @@ class RoutinesSync:
                 raise ValueError("page_size must be between 1 and 10 inclusive")
             params["page"] = page
             params["pageSize"] = page_size
-        resp = self._client._request("GET", "/v1/routines", params=params)
-
-        data = resp.json()
-        if resp.status_code >= 400:
-            message = (data.get("message") if isinstance(data, dict) else None) or resp.text
-            code = data.get("code") if isinstance(data, dict) else None
-            raise_for_status(
-                status_code=resp.status_code,
-                message=message,
-                error_code=code,
-                details=data,
-                request_id=None,
-            )
-        return PaginatedRoutines(**data)
+        return self._client._cached_get(
+            "routines.get_routines", "/v1/routines", PaginatedRoutines, params=params, fields=fields
+        )
 
     def create_routine(self, body: PostRoutinesRequestBody) -> Routine:
         """Create a new routine.
@@ -64,7 +59,7 @@ class RoutinesSync:
         Returns:
             The created routine.
         """
-        resp = self._client._request("POST", "/v1/routines", json=body.model_dump())
+        resp = self._client._request("POST", "/v1/routines", body=body)
 
         data = resp.json()
         if resp.status_code >= 400:
@@ -77,7 +72,11 @@ class RoutinesSync:
                 details=data,
                 request_id=None,
             )
-        return RoutineArrayResponse(**data).routine[0]
+        routine = RoutineArrayResponse(**data).routine[0]
+        self._client._write_through(
+            "routines.get_routine", f"/v1/routines/{routine.id}", RoutineResponse(routine=routine)
+        )
+        return routine
 
     def get_routine(self, routine_id: str) -> RoutineResponse:
         """Get a single routine by ID.
@@ -88,20 +87,7 @@ class RoutinesSync:
         Returns:
             The routine details wrapped in a response object.
         """
-        resp = self._client._request("GET", f"/v1/routines/{routine_id}")
-
-        data = resp.json()
-        if resp.status_code >= 400:
-            message = (data.get("message") if isinstance(data, dict) else None) or resp.text
-            code = data.get("code") if isinstance(data, dict) else None
-            raise_for_status(
-                status_code=resp.status_code,
-                message=message,
-                error_code=code,
-                details=data,
-                request_id=None,
-            )
-        return RoutineResponse(**data)
+        return self._client._cached_get("routines.get_routine", f"/v1/routines/{routine_id}", RoutineResponse)
 
     def update_routine(self, routine_id: str, body: PutRoutinesRequestBody) -> Routine:
         """Update an existing routine.
@@ -113,7 +99,7 @@ class RoutinesSync:
         Returns:
             The updated routine.
         """
-        resp = self._client._request("PUT", f"/v1/routines/{routine_id}", json=body.model_dump())
+        resp = self._client._request("PUT", f"/v1/routines/{routine_id}", body=body)
 
         data = resp.json()
         if resp.status_code >= 400:
@@ -126,7 +112,11 @@ class RoutinesSync:
                 details=data,
                 request_id=None,
             )
-        return RoutineArrayResponse(**data).routine[0]
+        routine = RoutineArrayResponse(**data).routine[0]
+        self._client._write_through(
+            "routines.get_routine", f"/v1/routines/{routine.id}", RoutineResponse(routine=routine)
+        )
+        return routine
 
 
 class RoutinesAsync:
@@ -135,12 +125,18 @@ class RoutinesAsync:
     def __init__(self, client: Any) -> None:
         self._client = client
 
-    async def get_routines(self, *, page: Optional[int] = None, page_size: int = 5) -> PaginatedRoutines:
+    async def get_routines(
+        self, *, page: Optional[int] = None, page_size: int = 5, fields: Optional[Sequence[str]] = None
+    ) -> PaginatedRoutines:
         """List routines with pagination.
 
         Args:
             page: Page number to retrieve (1-indexed).
             page_size: Number of routines per page (1-10).
+            fields: Optional dotted paths of item fields to keep, e.g.
+                ``["id", "title", "exercises.exercise_template_id"]``; other fields are dropped
+                while decoding and the result is a projection of the model
+                (see `hevy_api_wrapper.projection`).
 
         Returns:
             Paginated list of routines.
@@ -154,20 +150,9 @@ class RoutinesAsync:
                 raise ValueError("page_size must be between 1 and 10 inclusive")
             params["page"] = page
             params["pageSize"] = page_size
-        resp = await self._client._request("GET", "/v1/routines", params=params)
-
-        data = resp.json()
-        if resp.status_code >= 400:
-            message = (data.get("message") if isinstance(data, dict) else None) or resp.text
-            code = data.get("code") if isinstance(data, dict) else None
-            raise_for_status(
-                status_code=resp.status_code,
-                message=message,
-                error_code=code,
-                details=data,
-                request_id=None,
-            )
-        return PaginatedRoutines(**data)
+        return await self._client._cached_get(
+            "routines.get_routines", "/v1/routines", PaginatedRoutines, params=params, fields=fields
+        )
 
     async def create_routine(self, body: PostRoutinesRequestBody) -> Routine:
         """Create a new routine.
@@ -178,7 +163,7 @@ class RoutinesAsync:
         Returns:
             The created routine.
         """
-        resp = await self._client._request("POST", "/v1/routines", json=body.model_dump())
+        resp = await self._client._request("POST", "/v1/routines", body=body)
 
         data = resp.json()
         if resp.status_code >= 400:
@@ -191,7 +176,11 @@ class RoutinesAsync:
                 details=data,
                 request_id=None,
             )
-        return RoutineArrayResponse(**data).routine[0]
+        routine = RoutineArrayResponse(**data).routine[0]
+        self._client._write_through(
+            "routines.get_routine", f"/v1/routines/{routine.id}", RoutineResponse(routine=routine)
+        )
+        return routine
 
     async def get_routine(self, routine_id: str) -> RoutineResponse:
         """Get a single routine by ID.
@@ -202,20 +191,7 @@ class RoutinesAsync:
         Returns:
             The routine details wrapped in a response object.
         """
-        resp = await self._client._request("GET", f"/v1/routines/{routine_id}")
-
-        data = resp.json()
-        if resp.status_code >= 400:
-            message = (data.get("message") if isinstance(data, dict) else None) or resp.text
-            code = data.get("code") if isinstance(data, dict) else None
-            raise_for_status(
-                status_code=resp.status_code,
-                message=message,
-                error_code=code,
-                details=data,
-                request_id=None,
-            )
-        return RoutineResponse(**data)
+        return await self._client._cached_get("routines.get_routine", f"/v1/routines/{routine_id}", RoutineResponse)
 
     async def update_routine(self, routine_id: str, body: PutRoutinesRequestBody) -> Routine:
         """Update an existing routine.
@@ -227,7 +203,7 @@ class RoutinesAsync:
         Returns:
             The updated routine.
         """
-        resp = await self._client._request("PUT", f"/v1/routines/{routine_id}", json=body.model_dump())
+        resp = await self._client._request("PUT", f"/v1/routines/{routine_id}", body=body)
 
         data = resp.json()
         if resp.status_code >= 400:
@@ -240,4 +216,8 @@ class RoutinesAsync:
                 details=data,
                 request_id=None,
             )
-        return RoutineArrayResponse(**data).routine[0]
+        routine = RoutineArrayResponse(**data).routine[0]
+        self._client._write_through(
+            "routines.get_routine", f"/v1/routines/{routine.id}", RoutineResponse(routine=routine)
+        )
+        return routine
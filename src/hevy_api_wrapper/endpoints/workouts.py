@@ -2,10 +2,34 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Sequence
 
 from ..errors import raise_for_status
-from ..models import PaginatedWorkoutEvents, PaginatedWorkouts, PostWorkoutsRequestBody, Workout
+from ..models import (
+    PaginatedWorkoutEvents,
+    PaginatedWorkouts,
+    PostWorkoutsRequestBody,
+    UpdatedWorkout,
+    Workout,
+    WorkoutCount,
+)
+
+
+def _parse_workout(data: Any) -> Workout:
+    """Build a workout from a create/update response, which may wrap it in a list."""
+    if isinstance(data, dict) and "workout" in data:
+        workout_data = data["workout"]
+        if isinstance(workout_data, list) and len(workout_data) > 0:
+            return Workout(**workout_data[0])
+        return Workout(**workout_data)
+    return Workout(**data)
+
+
+def _forget_event_workouts(client: Any, events: PaginatedWorkoutEvents) -> None:
+    """Forget cached lookups of workouts that changed according to an events page."""
+    for event in events.events:
+        workout_id = event.workout.id if isinstance(event, UpdatedWorkout) else event.id
+        client._invalidate_item("workouts.get_workout", f"/v1/workouts/{workout_id}")
 
 
 class WorkoutsSync:
@@ -14,12 +38,18 @@ class WorkoutsSync:
     def __init__(self, client: Any) -> None:
         self._client = client
 
-    def get_workouts(self, *, page: Optional[int] = None, page_size: int = 5) -> PaginatedWorkouts:
+    def get_workouts(
+        self, *, page: Optional[int] = None, page_size: int = 5, fields: Optional[Sequence[str]] = None
+    ) -> PaginatedWorkouts:
         """List workouts with pagination.
 
         Args:
             page: Page number to retrieve (1-indexed).
             page_size: Number of workouts per page (1-10).
+            fields: Optional dotted paths of item fields to keep, e.g.
+                ``["id", "start_time", "exercises.sets.weight_kg"]``; other fields are dropped
+                while decoding and the result is a projection of the model
+                (see `hevy_api_wrapper.projection`).
 
         Returns:
             Paginated list of workouts.
@@ -33,20 +63,9 @@ class WorkoutsSync:
                 raise ValueError("page_size must be between 1 and 10 inclusive")
             params["page"] = page
             params["pageSize"] = page_size
-        resp = self._client._request("GET", "/v1/workouts", params=params)
-
-        data = resp.json()
-        if resp.status_code >= 400:
-            message = (data.get("message") if isinstance(data, dict) else None) or resp.text
-            code = data.get("code") if isinstance(data, dict) else None
-            raise_for_status(
-                status_code=resp.status_code,
-                message=message,
-                error_code=code,
-                details=data,
-                request_id=None,
-            )
-        return PaginatedWorkouts(**data)
+        return self._client._cached_get(
+            "workouts.get_workouts", "/v1/workouts", PaginatedWorkouts, params=params, fields=fields
+        )
 
     def create_workout(self, body: PostWorkoutsRequestBody) -> Workout:
         """Create a new workout.
@@ -57,7 +76,7 @@ class WorkoutsSync:
         Returns:
             The created workout.
         """
-        resp = self._client._request("POST", "/v1/workouts", json=body.model_dump(exclude_none=True))
+        resp = self._client._request("POST", "/v1/workouts", body=body, exclude_none=True)
 
         data = resp.json()
         if resp.status_code >= 400:
@@ -70,12 +89,9 @@ class WorkoutsSync:
                 details=data,
                 request_id=None,
             )
-        if isinstance(data, dict) and "workout" in data:
-            workout_data = data["workout"]
-            if isinstance(workout_data, list) and len(workout_data) > 0:
-                return Workout(**workout_data[0])
-            return Workout(**workout_data)
-        return Workout(**data)
+        workout = _parse_workout(data)
+        self._client._write_through("workouts.get_workout", f"/v1/workouts/{workout.id}", workout)
+        return workout
 
     def get_workout(self, workout_id: str) -> Workout:
         """Get a single workout by ID.
@@ -86,20 +102,7 @@ class WorkoutsSync:
         Returns:
             The workout details.
         """
-        resp = self._client._request("GET", f"/v1/workouts/{workout_id}")
-
-        data = resp.json()
-        if resp.status_code >= 400:
-            message = (data.get("message") if isinstance(data, dict) else None) or resp.text
-            code = data.get("code") if isinstance(data, dict) else None
-            raise_for_status(
-                status_code=resp.status_code,
-                message=message,
-                error_code=code,
-                details=data,
-                request_id=None,
-            )
-        return Workout(**data)
+        return self._client._cached_get("workouts.get_workout", f"/v1/workouts/{workout_id}", Workout)
 
     def update_workout(self, workout_id: str, body: PostWorkoutsRequestBody) -> Workout:
         """Update an existing workout.
@@ -111,7 +114,7 @@ class WorkoutsSync:
         Returns:
             The updated workout.
         """
-        resp = self._client._request("PUT", f"/v1/workouts/{workout_id}", json=body.model_dump(exclude_none=True))
+        resp = self._client._request("PUT", f"/v1/workouts/{workout_id}", body=body, exclude_none=True)
 
         data = resp.json()
         if resp.status_code >= 400:
@@ -124,12 +127,9 @@ class WorkoutsSync:
                 details=data,
                 request_id=None,
             )
-        if isinstance(data, dict) and "workout" in data:
-            workout_data = data["workout"]
-            if isinstance(workout_data, list) and len(workout_data) > 0:
-                return Workout(**workout_data[0])
-            return Workout(**workout_data)
-        return Workout(**data)
+        workout = _parse_workout(data)
+        self._client._write_through("workouts.get_workout", f"/v1/workouts/{workout.id}", workout)
+        return workout
 
     def get_events(
         self,
@@ -158,20 +158,11 @@ class WorkoutsSync:
             params["page"] = page
             params["pageSize"] = page_size
         params["since"] = since
-        resp = self._client._request("GET", "/v1/workouts/events", params=params)
-
-        data = resp.json()
-        if resp.status_code >= 400:
-            message = (data.get("message") if isinstance(data, dict) else None) or resp.text
-            code = data.get("code") if isinstance(data, dict) else None
-            raise_for_status(
-                status_code=resp.status_code,
-                message=message,
-                error_code=code,
-                details=data,
-                request_id=None,
-            )
-        return PaginatedWorkoutEvents(**data)
+        events = self._client._cached_get(
+            "workouts.get_events", "/v1/workouts/events", PaginatedWorkoutEvents, params=params
+        )
+        _forget_event_workouts(self._client, events)
+        return events
 
     def get_count(self) -> int:
         """Get the total count of workouts for the user.
@@ -179,20 +170,8 @@ class WorkoutsSync:
         Returns:
             Total number of workouts.
         """
-        resp = self._client._request("GET", "/v1/workouts/count")
-
-        data = resp.json()
-        if resp.status_code >= 400:
-            message = (data.get("message") if isinstance(data, dict) else None) or resp.text
-            code = data.get("code") if isinstance(data, dict) else None
-            raise_for_status(
-                status_code=resp.status_code,
-                message=message,
-                error_code=code,
-                details=data,
-                request_id=None,
-            )
-        return int(data.get("workout_count", 0))
+        count = self._client._cached_get("workouts.get_count", "/v1/workouts/count", WorkoutCount)
+        return count.workout_count
 
 
 class WorkoutsAsync:
@@ -201,12 +180,18 @@ class WorkoutsAsync:
     def __init__(self, client: Any) -> None:
         self._client = client
 
-    async def get_workouts(self, *, page: Optional[int] = None, page_size: int = 5) -> PaginatedWorkouts:
+    async def get_workouts(
+        self, *, page: Optional[int] = None, page_size: int = 5, fields: Optional[Sequence[str]] = None
+    ) -> PaginatedWorkouts:
         """List workouts with pagination.
 
         Args:
             page: Page number to retrieve (1-indexed).
             page_size: Number of workouts per page (1-10).
+            fields: Optional dotted paths of item fields to keep, e.g.
+                ``["id", "start_time", "exercises.sets.weight_kg"]``; other fields are dropped
+                while decoding and the result is a projection of the model
+                (see `hevy_api_wrapper.projection`).
 
         Returns:
             Paginated list of workouts.
@@ -220,20 +205,9 @@ class WorkoutsAsync:
                 raise ValueError("page_size must be between 1 and 10 inclusive")
             params["page"] = page
             params["pageSize"] = page_size
-        resp = await self._client._request("GET", "/v1/workouts", params=params)
-
-        data = resp.json()
-        if resp.status_code >= 400:
-            message = (data.get("message") if isinstance(data, dict) else None) or resp.text
-            code = data.get("code") if isinstance(data, dict) else None
-            raise_for_status(
-                status_code=resp.status_code,
-                message=message,
-                error_code=code,
-                details=data,
-                request_id=None,
-            )
-        return PaginatedWorkouts(**data)
+        return await self._client._cached_get(
+            "workouts.get_workouts", "/v1/workouts", PaginatedWorkouts, params=params, fields=fields
+        )
 
     async def create_workout(self, body: PostWorkoutsRequestBody) -> Workout:
         """Create a new workout.
@@ -244,7 +218,7 @@ class WorkoutsAsync:
         Returns:
             The created workout.
         """
-        resp = await self._client._request("POST", "/v1/workouts", json=body.model_dump(exclude_none=True))
+        resp = await self._client._request("POST", "/v1/workouts", body=body, exclude_none=True)
 
         data = resp.json()
         if resp.status_code >= 400:
@@ -257,12 +231,9 @@ class WorkoutsAsync:
                 details=data,
                 request_id=None,
             )
-        if isinstance(data, dict) and "workout" in data:
-            workout_data = data["workout"]
-            if isinstance(workout_data, list) and len(workout_data) > 0:
-                return Workout(**workout_data[0])
-            return Workout(**workout_data)
-        return Workout(**data)
+        workout = _parse_workout(data)
+        self._client._write_through("workouts.get_workout", f"/v1/workouts/{workout.id}", workout)
+        return workout
 
     async def get_workout(self, workout_id: str) -> Workout:
         """Get a single workout by ID.
@@ -273,20 +244,7 @@ class WorkoutsAsync:
         Returns:
             The workout details.
         """
-        resp = await self._client._request("GET", f"/v1/workouts/{workout_id}")
-
-        data = resp.json()
-        if resp.status_code >= 400:
-            message = (data.get("message") if isinstance(data, dict) else None) or resp.text
-            code = data.get("code") if isinstance(data, dict) else None
-            raise_for_status(
-                status_code=resp.status_code,
-                message=message,
-                error_code=code,
-                details=data,
-                request_id=None,
-            )
-        return Workout(**data)
+        return await self._client._cached_get("workouts.get_workout", f"/v1/workouts/{workout_id}", Workout)
 
     async def update_workout(self, workout_id: str, body: PostWorkoutsRequestBody) -> Workout:
         """Update an existing workout.
@@ -298,7 +256,7 @@ class WorkoutsAsync:
         Returns:
             The updated workout.
         """
-        resp = await self._client._request("PUT", f"/v1/workouts/{workout_id}", json=body.model_dump(exclude_none=True))
+        resp = await self._client._request("PUT", f"/v1/workouts/{workout_id}", body=body, exclude_none=True)
 
         data = resp.json()
         if resp.status_code >= 400:
@@ -311,12 +269,9 @@ class WorkoutsAsync:
                 details=data,
                 request_id=None,
             )
-        if isinstance(data, dict) and "workout" in data:
-            workout_data = data["workout"]
-            if isinstance(workout_data, list) and len(workout_data) > 0:
-                return Workout(**workout_data[0])
-            return Workout(**workout_data)
-        return Workout(**data)
+        workout = _parse_workout(data)
+        self._client._write_through("workouts.get_workout", f"/v1/workouts/{workout.id}", workout)
+        return workout
 
     async def get_events(
         self,
@@ -345,20 +300,11 @@ class WorkoutsAsync:
             params["page"] = page
             params["pageSize"] = page_size
         params["since"] = since
-        resp = await self._client._request("GET", "/v1/workouts/events", params=params)
-
-        data = resp.json()
-        if resp.status_code >= 400:
-            message = (data.get("message") if isinstance(data, dict) else None) or resp.text
-            code = data.get("code") if isinstance(data, dict) else None
-            raise_for_status(
-                status_code=resp.status_code,
-                message=message,
-                error_code=code,
-                details=data,
-                request_id=None,
-            )
-        return PaginatedWorkoutEvents(**data)
+        events = await self._client._cached_get(
+            "workouts.get_events", "/v1/workouts/events", PaginatedWorkoutEvents, params=params
+        )
+        _forget_event_workouts(self._client, events)
+        return events
 
     async def get_count(self) -> int:
         """Get the total count of workouts for the user.
@@ -366,17 +312,5 @@ class WorkoutsAsync:
         Returns:
             Total number of workouts.
         """
-        resp = await self._client._request("GET", "/v1/workouts/count")
-
-        data = resp.json()
-        if resp.status_code >= 400:
-            message = (data.get("message") if isinstance(data, dict) else None) or resp.text
-            code = data.get("code") if isinstance(data, dict) else None
-            raise_for_status(
-                status_code=resp.status_code,
-                message=message,
-                error_code=code,
-                details=data,
-                request_id=None,
-            )
-        return int(data.get("workout_count", 0))
+        count = await self._client._cached_get("workouts.get_count", "/v1/workouts/count", WorkoutCount)
+        return count.workout_count
@@ -0,0 +1,315 @@
+"""In-process fan-out of workout change events to multiple subscribers."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .models import Event, UpdatedWorkout
+from .timestamps import parse_timestamp
+
+__all__ = ["DropPolicy", "EventSubscription", "WorkoutEventHub", "compact_events"]
+
+DEFAULT_SINCE = "1970-01-01T00:00:00Z"
+
+
+class DropPolicy(str, Enum):
+    """What a subscription does with a new event when its queue is full.
+
+    Attributes:
+        block: Wait until the subscriber makes room, pausing the poller (backpressure).
+        drop_oldest: Discard the oldest queued event to make room for the new one.
+        drop_newest: Discard the incoming event and keep the queue as it is.
+    """
+
+    block = "block"
+    drop_oldest = "drop_oldest"
+    drop_newest = "drop_newest"
+
+
+def _event_time(event: Event) -> str:
+    """Return the raw timestamp at which an event happened."""
+    if isinstance(event, UpdatedWorkout):
+        return event.workout.updated_at
+    return event.deleted_at
+
+
+def _event_workout_id(event: Event) -> str:
+    """Return the ID of the workout an event refers to."""
+    if isinstance(event, UpdatedWorkout):
+        return event.workout.id
+    return event.id
+
+
+def _event_key(event: Event) -> Tuple[str, str, str]:
+    return (event.type, _event_workout_id(event), _event_time(event))
+
+
+def compact_events(events: Iterable[Event]) -> List[Event]:
+    """Collapse a burst of events to the latest state of each workout.
+
+    Only the newest event per workout ID is kept, so five updates of the same
+    workout turn into a single `UpdatedWorkout` carrying its final state. A
+    delete overrides every earlier update; when an update and a delete share a
+    timestamp the delete wins.
+
+    Args:
+        events: Events in any order, e.g. one or more `PaginatedWorkoutEvents` pages.
+
+    Returns:
+        One event per workout, ordered oldest first.
+    """
+    latest: Dict[str, Tuple[datetime, Event]] = {}
+    for event in events:
+        workout_id = _event_workout_id(event)
+        happened_at = parse_timestamp(_event_time(event))
+        current = latest.get(workout_id)
+        if current is not None:
+            if happened_at < current[0]:
+                continue
+            if happened_at == current[0] and current[1].type == "deleted":
+                continue
+        latest[workout_id] = (happened_at, event)
+    return [event for _, event in sorted(latest.values(), key=lambda item: item[0])]
+
+
+class EventSubscription:
+    """A subscriber's bounded view of the events published by a `WorkoutEventHub`.
+
+    Iterate with ``async for`` or call `get()`. Iteration ends once the subscription
+    is closed and every queued event has been consumed.
+
+    Attributes:
+        drop_policy: How events are handled when the queue is full.
+        dropped: Number of events discarded because the queue was full.
+    """
+
+    def __init__(self, *, maxsize: int, drop_policy: DropPolicy) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self._queue: asyncio.Queue[Optional[Event]] = asyncio.Queue(maxsize=maxsize)
+        self._closed = False
+        self._pending_put: Optional[asyncio.Future[None]] = None
+        self.drop_policy = DropPolicy(drop_policy)
+        self.dropped = 0
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def qsize(self) -> int:
+        """Return the number of events waiting to be consumed."""
+        return self._queue.qsize()
+
+    async def get(self) -> Event:
+        """Wait for the next event.
+
+        Raises:
+            StopAsyncIteration: If the subscription is closed and drained.
+        """
+        if self._closed and self._queue.empty():
+            raise StopAsyncIteration
+        event = await self._queue.get()
+        if event is None:
+            raise StopAsyncIteration
+        return event
+
+    def __aiter__(self) -> "EventSubscription":
+        return self
+
+    async def __anext__(self) -> Event:
+        return await self.get()
+
+    async def _deliver(self, event: Event) -> None:
+        if self._closed:
+            return
+        if self.drop_policy is DropPolicy.block:
+            # Closing cancels a put still waiting for room, so a subscriber
+            # that leaves never blocks the hub.
+            put = self._pending_put = asyncio.ensure_future(self._queue.put(event))
+            try:
+                await asyncio.wait((put,))
+            finally:
+                put.cancel()
+                self._pending_put = None
+            return
+        if self._queue.full():
+            self.dropped += 1
+            if self.drop_policy is DropPolicy.drop_newest:
+                return
+            self._queue.get_nowait()
+        self._queue.put_nowait(event)
+
+    def _close(self, *, discard: bool) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._pending_put is not None:
+            self._pending_put.cancel()
+        if discard:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+        if not self._queue.full():
+            self._queue.put_nowait(None)
+
+
+class WorkoutEventHub:
+    """Polls workout events for one account and fans them out to subscribers.
+
+    A single hub issues one stream of `get_events` calls no matter how many
+    subscribers are attached, so share one hub per account instead of polling
+    from every consumer. Events are published oldest first and the ``since``
+    cursor advances to the newest event seen after each poll.
+
+    A subscriber using `DropPolicy.block` applies backpressure to the whole hub:
+    the poller waits for it before publishing the next event.
+
+    With ``compact=True`` each poll is passed through `compact_events` first, so
+    subscribers receive at most one event per workout per poll.
+
+    Attributes:
+        poll_interval: Seconds to wait between polls when running in the background.
+        page_size: Number of events requested per page (1-10).
+        compact: Whether each poll is compacted before publishing.
+        last_error: The error raised by the most recent failed background poll, if any.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        since: str = DEFAULT_SINCE,
+        poll_interval: float = 60.0,
+        page_size: int = 10,
+        compact: bool = False,
+    ) -> None:
+        """Initialize the hub.
+
+        Args:
+            client: An `AsyncClient` used to fetch events.
+            since: ISO 8601 timestamp to start polling from (defaults to epoch).
+            poll_interval: Seconds to wait between background polls.
+            page_size: Number of events requested per page (1-10).
+            compact: Publish only the latest event per workout from each poll.
+        """
+        self._client = client
+        self._since = since
+        self._seen_at_cursor: Set[Tuple[str, str, str]] = set()
+        self._subscriptions: List[EventSubscription] = []
+        self._task: Optional[asyncio.Task[None]] = None
+        self.poll_interval = poll_interval
+        self.page_size = page_size
+        self.compact = compact
+        self.last_error: Optional[BaseException] = None
+
+    @property
+    def since(self) -> str:
+        """Timestamp the next poll fetches events from."""
+        return self._since
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def subscribe(self, *, maxsize: int = 100, drop_policy: DropPolicy = DropPolicy.block) -> EventSubscription:
+        """Attach a new subscriber.
+
+        Args:
+            maxsize: Maximum number of events buffered for this subscriber.
+            drop_policy: What to do with new events once the buffer is full.
+
+        Returns:
+            The subscription to consume events from.
+        """
+        subscription = EventSubscription(maxsize=maxsize, drop_policy=drop_policy)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: EventSubscription) -> None:
+        """Detach a subscriber and discard its pending events."""
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+        subscription._close(discard=True)
+
+    async def poll_once(self) -> int:
+        """Fetch all events since the current cursor and publish them.
+
+        Returns:
+            Number of events published.
+        """
+        since = parse_timestamp(self._since)
+        events = [
+            event
+            for event in await self._fetch_events()
+            if _event_key(event) not in self._seen_at_cursor and parse_timestamp(_event_time(event)) >= since
+        ]
+        published = compact_events(events) if self.compact else events
+        for event in published:
+            await self._publish(event)
+        if events:
+            # The API may return events stamped exactly at ``since`` again on the
+            # next poll; remember them so they are not published twice.
+            cursor = _event_time(events[-1])
+            if cursor != self._since:
+                self._seen_at_cursor.clear()
+            self._since = cursor
+            self._seen_at_cursor.update(_event_key(event) for event in events if _event_time(event) == cursor)
+        return len(published)
+
+    def start(self) -> None:
+        """Start polling in a background task."""
+        if self.running:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop background polling and close every subscription.
+
+        Events already queued stay available to subscribers until consumed.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for subscription in self._subscriptions:
+            subscription._close(discard=False)
+        self._subscriptions.clear()
+
+    async def __aenter__(self) -> "WorkoutEventHub":
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.stop()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.poll_once()
+                self.last_error = None
+            except Exception as exc:
+                # Keep polling whatever went wrong; a dead poller would leave
+                # every subscriber waiting forever.
+                self.last_error = exc
+            await asyncio.sleep(self.poll_interval)
+
+    async def _fetch_events(self) -> List[Event]:
+        events: List[Event] = []
+        page = 1
+        while True:
+            result = await self._client.workouts.get_events(page=page, page_size=self.page_size, since=self._since)
+            events.extend(result.events)
+            if page >= result.page_count or not result.events:
+                break
+            page += 1
+        events.sort(key=lambda event: parse_timestamp(_event_time(event)))
+        return events
+
+    async def _publish(self, event: Event) -> None:
+        for subscription in list(self._subscriptions):
+            await subscription._deliver(event)
@@ -0,0 +1,277 @@
+"""Full-account snapshot export to compressed JSON Lines files.
+
+`AccountExporter` crawls every workout, routine, routine folder, custom
+exercise template and the exercise history of each template used in a
+workout. Pages are fetched concurrently and streamed to disk as they arrive,
+so memory use is bounded by the number of pages in flight rather than the size
+of the account. A ``manifest.json`` describing every file is written last; an
+export without a manifest is incomplete.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hashlib
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Any, Awaitable, Callable, Dict, Iterable, Optional, Set, Union
+
+import pydantic_core
+
+__all__ = ["AccountExporter", "ExportFile", "ExportManifest", "export_account"]
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_FORMAT_VERSION = 1
+
+_EXTENSIONS = {"gzip": ".jsonl.gz", "zstd": ".jsonl.zst", "none": ".jsonl"}
+
+
+def _open_zstd(path: Path) -> IO[bytes]:
+    try:
+        from compression import zstd  # type: ignore[import-not-found]
+
+        return zstd.open(path, "wb")  # type: ignore[no-any-return]
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError as exc:  # pragma: no cover - depends on the environment
+        raise ImportError(
+            "zstd compression requires the 'zstandard' package: pip install 'hevy-api-wrapper[zstd]'"
+        ) from exc
+    return zstandard.ZstdCompressor().stream_writer(open(path, "wb"), closefd=True)  # type: ignore[no-any-return]
+
+
+async def _gather_or_cancel(coros: Iterable[Awaitable[Any]]) -> None:
+    """Run coroutines concurrently; if one fails, cancel the others before re-raising."""
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+@dataclass
+class ExportFile:
+    """One exported resource file.
+
+    Attributes:
+        path: File name relative to the export directory.
+        records: Number of JSON lines written.
+        bytes: Size of the file on disk.
+        sha256: SHA-256 of the file on disk.
+    """
+
+    path: str
+    records: int = 0
+    bytes: int = 0
+    sha256: str = ""
+
+
+@dataclass
+class ExportManifest:
+    """Description of a completed export.
+
+    Attributes:
+        created_at: ISO 8601 timestamp at which the export started.
+        compression: Compression used for every file (``gzip``, ``zstd`` or ``none``).
+        files: Exported file per resource name.
+    """
+
+    created_at: str
+    compression: str
+    files: Dict[str, ExportFile] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "format_version": MANIFEST_FORMAT_VERSION,
+            "created_at": self.created_at,
+            "compression": self.compression,
+            "files": {name: vars(f) for name, f in self.files.items()},
+        }
+
+    @classmethod
+    def load(cls, directory: Union[str, Path]) -> "ExportManifest":
+        """Read the manifest of an export directory."""
+        data = json.loads((Path(directory) / MANIFEST_NAME).read_text(encoding="utf-8"))
+        return cls(
+            created_at=data["created_at"],
+            compression=data["compression"],
+            files={name: ExportFile(**f) for name, f in data["files"].items()},
+        )
+
+
+class _JsonlWriter:
+    def __init__(self, directory: Path, name: str, compression: str) -> None:
+        self.path = directory / f"{name}{_EXTENSIONS[compression]}"
+        self.records = 0
+        self._file: IO[bytes]
+        if compression == "gzip":
+            self._file = gzip.open(self.path, "wb")
+        elif compression == "zstd":
+            self._file = _open_zstd(self.path)
+        else:
+            self._file = open(self.path, "wb")
+
+    def write(self, records: Iterable[Any]) -> None:
+        for record in records:
+            self._file.write(pydantic_core.to_json(record))
+            self._file.write(b"\n")
+            self.records += 1
+
+    def close(self) -> ExportFile:
+        self._file.close()
+        hasher = hashlib.sha256()
+        with open(self.path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                hasher.update(chunk)
+        return ExportFile(
+            path=self.path.name, records=self.records, bytes=self.path.stat().st_size, sha256=hasher.hexdigest()
+        )
+
+
+class AccountExporter:
+    """Exports a whole account concurrently to compressed JSON Lines.
+
+    Every request goes through one semaphore, so at most ``max_concurrency``
+    calls are in flight at any time; rate-limited responses are retried by the
+    client as usual.
+
+    Example:
+        async with AsyncClient.from_env() as client:
+            manifest = await AccountExporter(client, "backup/").run()
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        directory: Union[str, Path],
+        *,
+        compression: str = "gzip",
+        max_concurrency: int = 4,
+        include_history: bool = True,
+    ) -> None:
+        """Initialize the exporter.
+
+        Args:
+            client: An `AsyncClient` for the account to export.
+            directory: Directory the files and manifest are written to (created if missing).
+            compression: ``gzip``, ``zstd`` or ``none``.
+            max_concurrency: Maximum number of requests in flight.
+            include_history: Also export the exercise history of every template used in a workout.
+
+        Raises:
+            ValueError: If compression or max_concurrency is invalid.
+        """
+        if compression not in _EXTENSIONS:
+            raise ValueError(f"compression must be one of {', '.join(_EXTENSIONS)}")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._client = client
+        self._directory = Path(directory)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._template_ids: Set[str] = set()
+        self.compression = compression
+        self.max_concurrency = max_concurrency
+        self.include_history = include_history
+
+    async def run(self) -> ExportManifest:
+        """Crawl every endpoint and write the export.
+
+        Returns:
+            The manifest that was written next to the exported files.
+        """
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._template_ids = set()
+        manifest = ExportManifest(
+            created_at=datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            compression=self.compression,
+        )
+        names = ["workouts", "routines", "routine_folders", "custom_exercise_templates"]
+        if self.include_history:
+            names.append("exercise_history")
+        writers = {name: _JsonlWriter(self._directory, name, self.compression) for name in names}
+        try:
+            await _gather_or_cancel(
+                [
+                    self._crawl(self._fetch_workouts, writers["workouts"], page_size=10),
+                    self._crawl(self._fetch_routines, writers["routines"], page_size=10),
+                    self._crawl(self._fetch_routine_folders, writers["routine_folders"], page_size=10),
+                    self._crawl(self._fetch_custom_templates, writers["custom_exercise_templates"], page_size=100),
+                ]
+            )
+            if self.include_history:
+                history = writers["exercise_history"]
+                await _gather_or_cancel(
+                    self._export_history(template_id, history) for template_id in sorted(self._template_ids)
+                )
+        finally:
+            for name, writer in writers.items():
+                manifest.files[name] = writer.close()
+        manifest_path = self._directory / MANIFEST_NAME
+        manifest_path.write_text(json.dumps(manifest.to_dict(), indent=2), encoding="utf-8")
+        return manifest
+
+    async def _call(self, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        assert self._semaphore is not None
+        async with self._semaphore:
+            return await fetch()
+
+    async def _crawl(
+        self,
+        fetch_page: Callable[[int, int], Awaitable[Any]],
+        writer: _JsonlWriter,
+        *,
+        page_size: int,
+    ) -> None:
+        """Fetch page 1 to learn the page count, then the rest with a bounded worker pool."""
+        page_count = await self._call(lambda: self._write_page(fetch_page, 1, page_size, writer))
+        pages = iter(range(2, page_count + 1))
+
+        async def worker() -> None:
+            for page in pages:
+                await self._call(lambda: self._write_page(fetch_page, page, page_size, writer))
+
+        await _gather_or_cancel(worker() for _ in range(min(self.max_concurrency, max(page_count - 1, 0))))
+
+    async def _write_page(
+        self, fetch_page: Callable[[int, int], Awaitable[Any]], page: int, page_size: int, writer: _JsonlWriter
+    ) -> int:
+        page_count, records = await fetch_page(page, page_size)
+        writer.write(records)
+        return int(page_count)
+
+    async def _fetch_workouts(self, page: int, page_size: int) -> Any:
+        result = await self._client.workouts.get_workouts(page=page, page_size=page_size)
+        if self.include_history:
+            for workout in result.workouts:
+                self._template_ids.update(exercise.exercise_template_id for exercise in workout.exercises)
+        return result.page_count, result.workouts
+
+    async def _fetch_routines(self, page: int, page_size: int) -> Any:
+        result = await self._client.routines.get_routines(page=page, page_size=page_size)
+        return result.page_count, result.routines
+
+    async def _fetch_routine_folders(self, page: int, page_size: int) -> Any:
+        result = await self._client.routine_folders.get_routine_folders(page=page, page_size=page_size)
+        return result.page_count, result.routine_folders
+
+    async def _fetch_custom_templates(self, page: int, page_size: int) -> Any:
+        result = await self._client.exercise_templates.get_exercise_templates(page=page, page_size=page_size)
+        return result.page_count, [template for template in result.exercise_templates if template.is_custom]
+
+    async def _export_history(self, template_id: str, writer: _JsonlWriter) -> None:
+        result = await self._call(lambda: self._client.exercise_history.get_exercise_history(template_id))
+        writer.write(result.exercise_history)
+
+
+async def export_account(client: Any, directory: Union[str, Path], **kwargs: Any) -> ExportManifest:
+    """Export a whole account; see `AccountExporter` for the available options."""
+    return await AccountExporter(client, directory, **kwargs).run()
@@ -1,66 +1,62 @@
-"""Pydantic models for Hevy API request and response schemas."""
+"""Pydantic models for Hevy API request and response schemas.
 
-from __future__ import annotations
-
-# Create custom exercise
-from .create_custom_exercise import CreateCustomExercise
-from .create_custom_exercise_request_body import CreateCustomExerciseRequestBody
-from .create_custom_exercise_response import CreateCustomExerciseResponse
-from .custom_exercise_type import CustomExerciseType
-from .deleted_workout import DeletedWorkout
-from .equipment_category import EquipmentCategory
-from .event import Event
-from .exercise_history_entry import ExerciseHistoryEntry
-
-# Exercise history response
-from .exercise_history_response import ExerciseHistoryResponse
-from .exercise_model import Exercise
-from .exercise_template import ExerciseTemplate
-from .muscle_group import MuscleGroup
-from .paginated_exercise_templates import PaginatedExerciseTemplates
-from .paginated_routine_folders import PaginatedRoutineFolders
-from .paginated_routines import PaginatedRoutines
-from .paginated_workout_events import PaginatedWorkoutEvents
-from .paginated_workouts import PaginatedWorkouts
-
-# Routine folder create
-from .post_routine_folder import PostRoutineFolder
-from .post_routine_folder_request_body import PostRoutineFolderRequestBody
-from .post_routines_request_body import PostRoutinesRequestBody
-from .post_routines_request_body_routine import PostRoutinesRequestBodyRoutine
-from .post_routines_request_exercise import PostRoutinesRequestExercise
-
-# Routines: requests (POST/PUT)
-from .post_routines_request_set import PostRoutinesRequestSet
-from .post_workouts_request_body import PostWorkoutsRequestBody
-from .post_workouts_request_body_workout import PostWorkoutsRequestBodyWorkout
-from .post_workouts_request_exercise import PostWorkoutsRequestExercise
-
-# Workouts: requests and entities
-from .post_workouts_request_set import PostWorkoutsRequestSet
-from .put_routines_request_body import PutRoutinesRequestBody
-from .put_routines_request_body_routine import PutRoutinesRequestBodyRoutine
-from .put_routines_request_exercise import PutRoutinesRequestExercise
-from .put_routines_request_set import PutRoutinesRequestSet
+Each model lives in its own module, imported on first access to its name
+here; importing this package does not build any model.
+"""
 
-# Shared / exercise-related
-from .rep_range import RepRange
-from .routine import Routine
-from .routine_array_response import RoutineArrayResponse
-from .routine_exercise import RoutineExercise
+from __future__ import annotations
 
-# Routine entities
-from .routine_folder import RoutineFolder
-from .routine_folder_response import RoutineFolderResponse
-from .routine_response import RoutineResponse
-from .routine_set import RoutineSet
-from .set_model import Set
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
-# Events
-from .updated_workout import UpdatedWorkout
-from .workout import Workout
-from .workout_exercise import WorkoutExercise
-from .workout_set import WorkoutSet
+if TYPE_CHECKING:
+    from .create_custom_exercise import CreateCustomExercise
+    from .create_custom_exercise_request_body import CreateCustomExerciseRequestBody
+    from .create_custom_exercise_response import CreateCustomExerciseResponse
+    from .custom_exercise_type import CustomExerciseType
+    from .deleted_workout import DeletedWorkout
+    from .equipment_category import EquipmentCategory
+    from .event import Event
+    from .exercise_history_entry import ExerciseHistoryEntry
+    from .exercise_history_response import ExerciseHistoryResponse
+    from .exercise_model import Exercise
+    from .exercise_template import ExerciseTemplate
+    from .lazy_paginated_workouts import LazyPaginatedWorkouts
+    from .lazy_workout import LazyWorkout
+    from .muscle_group import MuscleGroup
+    from .paginated_exercise_templates import PaginatedExerciseTemplates
+    from .paginated_routine_folders import PaginatedRoutineFolders
+    from .paginated_routines import PaginatedRoutines
+    from .paginated_workout_events import PaginatedWorkoutEvents
+    from .paginated_workouts import PaginatedWorkouts
+    from .post_routine_folder import PostRoutineFolder
+    from .post_routine_folder_request_body import PostRoutineFolderRequestBody
+    from .post_routines_request_body import PostRoutinesRequestBody
+    from .post_routines_request_body_routine import PostRoutinesRequestBodyRoutine
+    from .post_routines_request_exercise import PostRoutinesRequestExercise
+    from .post_routines_request_set import PostRoutinesRequestSet
+    from .post_workouts_request_body import PostWorkoutsRequestBody
+    from .post_workouts_request_body_workout import PostWorkoutsRequestBodyWorkout
+    from .post_workouts_request_exercise import PostWorkoutsRequestExercise
+    from .post_workouts_request_set import PostWorkoutsRequestSet
+    from .put_routines_request_body import PutRoutinesRequestBody
+    from .put_routines_request_body_routine import PutRoutinesRequestBodyRoutine
+    from .put_routines_request_exercise import PutRoutinesRequestExercise
+    from .put_routines_request_set import PutRoutinesRequestSet
+    from .rep_range import RepRange
+    from .routine import Routine
+    from .routine_array_response import RoutineArrayResponse
+    from .routine_exercise import RoutineExercise
+    from .routine_folder import RoutineFolder
+    from .routine_folder_response import RoutineFolderResponse
+    from .routine_response import RoutineResponse
+    from .routine_set import RoutineSet
+    from .set_model import Set
+    from .updated_workout import UpdatedWorkout
+    from .workout import Workout
+    from .workout_count import WorkoutCount
+    from .workout_exercise import WorkoutExercise
+    from .workout_set import WorkoutSet
 
 __all__ = [
     # Enums
@@ -103,6 +99,9 @@ __all__ = [
     "WorkoutExercise",
     "Workout",
     "PaginatedWorkouts",
+    "LazyWorkout",
+    "LazyPaginatedWorkouts",
+    "WorkoutCount",
     # Events
     "UpdatedWorkout",
     "DeletedWorkout",
@@ -117,3 +116,75 @@ __all__ = [
     # Exercise history response
     "ExerciseHistoryResponse",
 ]
+
+_MODULES = {
+    # Enums
+    "CustomExerciseType": ".custom_exercise_type",
+    "MuscleGroup": ".muscle_group",
+    "EquipmentCategory": ".equipment_category",
+    # Shared
+    "RepRange": ".rep_range",
+    "Set": ".set_model",
+    "Exercise": ".exercise_model",
+    "ExerciseHistoryEntry": ".exercise_history_entry",
+    "ExerciseTemplate": ".exercise_template",
+    # Create custom exercise
+    "CreateCustomExercise": ".create_custom_exercise",
+    "CreateCustomExerciseRequestBody": ".create_custom_exercise_request_body",
+    "CreateCustomExerciseResponse": ".create_custom_exercise_response",
+    # Routines request bodies
+    "PostRoutinesRequestSet": ".post_routines_request_set",
+    "PostRoutinesRequestExercise": ".post_routines_request_exercise",
+    "PostRoutinesRequestBodyRoutine": ".post_routines_request_body_routine",
+    "PostRoutinesRequestBody": ".post_routines_request_body",
+    "PutRoutinesRequestSet": ".put_routines_request_set",
+    "PutRoutinesRequestExercise": ".put_routines_request_exercise",
+    "PutRoutinesRequestBodyRoutine": ".put_routines_request_body_routine",
+    "PutRoutinesRequestBody": ".put_routines_request_body",
+    # Routine entities
+    "RoutineFolder": ".routine_folder",
+    "RoutineFolderResponse": ".routine_folder_response",
+    "RoutineSet": ".routine_set",
+    "RoutineExercise": ".routine_exercise",
+    "Routine": ".routine",
+    "RoutineResponse": ".routine_response",
+    "RoutineArrayResponse": ".routine_array_response",
+    # Workouts request/response
+    "PostWorkoutsRequestSet": ".post_workouts_request_set",
+    "PostWorkoutsRequestExercise": ".post_workouts_request_exercise",
+    "PostWorkoutsRequestBodyWorkout": ".post_workouts_request_body_workout",
+    "PostWorkoutsRequestBody": ".post_workouts_request_body",
+    "WorkoutSet": ".workout_set",
+    "WorkoutExercise": ".workout_exercise",
+    "Workout": ".workout",
+    "PaginatedWorkouts": ".paginated_workouts",
+    "LazyWorkout": ".lazy_workout",
+    "LazyPaginatedWorkouts": ".lazy_paginated_workouts",
+    "WorkoutCount": ".workout_count",
+    # Events
+    "UpdatedWorkout": ".updated_workout",
+    "DeletedWorkout": ".deleted_workout",
+    "Event": ".event",
+    "PaginatedWorkoutEvents": ".paginated_workout_events",
+    # Routine folder create
+    "PostRoutineFolder": ".post_routine_folder",
+    "PostRoutineFolderRequestBody": ".post_routine_folder_request_body",
+    "PaginatedRoutineFolders": ".paginated_routine_folders",
+    "PaginatedExerciseTemplates": ".paginated_exercise_templates",
+    "PaginatedRoutines": ".paginated_routines",
+    # Exercise history response
+    "ExerciseHistoryResponse": ".exercise_history_response",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Literal
 
 from pydantic import BaseModel
 
+from ..timestamps import parse_timestamp
+
 __all__ = ["DeletedWorkout"]
 
 
@@ -11,3 +14,8 @@ class DeletedWorkout(BaseModel):
     type: Literal["deleted"]
     id: str
     deleted_at: str
+
+    @property
+    def deleted_datetime(self) -> datetime:
+        """``deleted_at`` as a timezone-aware datetime."""
+        return parse_timestamp(self.deleted_at)
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Optional
 
 from pydantic import BaseModel
 
+from ..timestamps import parse_timestamp
+
 __all__ = ["ExerciseHistoryEntry"]
 
 
@@ -20,3 +23,13 @@ class ExerciseHistoryEntry(BaseModel):
     rpe: Optional[float] = None
     custom_metric: Optional[float] = None
     set_type: str  # 'warmup' | 'normal' | 'failure' | 'dropset'
+
+    @property
+    def workout_start_datetime(self) -> datetime:
+        """``workout_start_time`` as a timezone-aware datetime."""
+        return parse_timestamp(self.workout_start_time)
+
+    @property
+    def workout_end_datetime(self) -> datetime:
+        """``workout_end_time`` as a timezone-aware datetime."""
+        return parse_timestamp(self.workout_end_time)
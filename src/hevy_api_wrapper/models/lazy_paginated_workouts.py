@@ -0,0 +1,25 @@
+"""Paginated workouts response model with lazily parsed exercises."""
+
+from __future__ import annotations
+
+from typing import List
+
+from pydantic import BaseModel
+
+from .lazy_workout import LazyWorkout
+
+__all__ = ["LazyPaginatedWorkouts"]
+
+
+class LazyPaginatedWorkouts(BaseModel):
+    """Paginated response for workout list queries, holding `LazyWorkout` items.
+
+    Attributes:
+        page: Current page number (1-indexed).
+        page_count: Total number of pages available.
+        workouts: List of workouts in the current page.
+    """
+
+    page: int
+    page_count: int
+    workouts: List[LazyWorkout]
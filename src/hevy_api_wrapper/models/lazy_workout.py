@@ -0,0 +1,77 @@
+"""Workout model that parses its exercises on first access."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from functools import cached_property
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, computed_field
+
+from ..timestamps import parse_timestamp
+from .workout_exercise import WorkoutExercise
+
+__all__ = ["LazyWorkout"]
+
+_EXERCISES = TypeAdapter(List[WorkoutExercise])
+
+
+class LazyWorkout(BaseModel):
+    """A `Workout` whose exercises and sets are built only when first read.
+
+    The top-level fields are validated like `Workout`'s. The ``exercises``
+    JSON is kept as decoded dicts in ``raw_exercises`` and validated into
+    `WorkoutExercise` models the first time ``exercises`` is accessed, so
+    scanning ids, titles and times of many workouts skips the nested models.
+    Serializing the workout builds them too; the output is the same as
+    `Workout`'s.
+
+    Attributes:
+        id: Unique workout identifier.
+        title: Workout title/name.
+        routine_id: Associated routine ID (if any).
+        description: Optional workout description.
+        start_time: ISO 8601 timestamp when workout started.
+        end_time: ISO 8601 timestamp when workout ended.
+        updated_at: ISO 8601 timestamp of last update.
+        created_at: ISO 8601 timestamp of creation.
+        raw_exercises: The unparsed ``exercises`` JSON.
+    """
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    id: str
+    title: str
+    routine_id: Optional[str] = None
+    description: Optional[str] = None
+    start_time: str
+    end_time: str
+    updated_at: str
+    created_at: str
+    raw_exercises: List[Dict[str, Any]] = Field(alias="exercises", exclude=True, repr=False)
+
+    @computed_field(repr=False)  # type: ignore[prop-decorator]
+    @cached_property
+    def exercises(self) -> List[WorkoutExercise]:
+        """Exercises performed in the workout, validated on first access."""
+        return _EXERCISES.validate_python(self.raw_exercises)
+
+    @property
+    def start_datetime(self) -> datetime:
+        """``start_time`` as a timezone-aware datetime."""
+        return parse_timestamp(self.start_time)
+
+    @property
+    def end_datetime(self) -> datetime:
+        """``end_time`` as a timezone-aware datetime."""
+        return parse_timestamp(self.end_time)
+
+    @property
+    def updated_datetime(self) -> datetime:
+        """``updated_at`` as a timezone-aware datetime."""
+        return parse_timestamp(self.updated_at)
+
+    @property
+    def created_datetime(self) -> datetime:
+        """``created_at`` as a timezone-aware datetime."""
+        return parse_timestamp(self.created_at)
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import List, Optional
 
 from pydantic import BaseModel
 
+from ..timestamps import parse_timestamp
 from .routine_exercise import RoutineExercise
 
 __all__ = ["Routine"]
@@ -29,3 +31,13 @@ class Routine(BaseModel):
     updated_at: str
     created_at: str
     exercises: List[RoutineExercise]
+
+    @property
+    def updated_datetime(self) -> datetime:
+        """``updated_at`` as a timezone-aware datetime."""
+        return parse_timestamp(self.updated_at)
+
+    @property
+    def created_datetime(self) -> datetime:
+        """``created_at`` as a timezone-aware datetime."""
+        return parse_timestamp(self.created_at)
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+from datetime import datetime
+
 from pydantic import BaseModel
 
+from ..timestamps import parse_timestamp
+
 __all__ = ["RoutineFolder"]
 
 
@@ -11,3 +15,13 @@ class RoutineFolder(BaseModel):
     title: str
     updated_at: str
     created_at: str
+
+    @property
+    def updated_datetime(self) -> datetime:
+        """``updated_at`` as a timezone-aware datetime."""
+        return parse_timestamp(self.updated_at)
+
+    @property
+    def created_datetime(self) -> datetime:
+        """``created_at`` as a timezone-aware datetime."""
+        return parse_timestamp(self.created_at)
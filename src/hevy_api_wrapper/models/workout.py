@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import List, Optional
 
 from pydantic import BaseModel
 
+from ..timestamps import parse_timestamp
 from .workout_exercise import WorkoutExercise
 
 __all__ = ["Workout"]
@@ -35,3 +37,23 @@ class Workout(BaseModel):
     updated_at: str
     created_at: str
     exercises: List[WorkoutExercise]
+
+    @property
+    def start_datetime(self) -> datetime:
+        """``start_time`` as a timezone-aware datetime."""
+        return parse_timestamp(self.start_time)
+
+    @property
+    def end_datetime(self) -> datetime:
+        """``end_time`` as a timezone-aware datetime."""
+        return parse_timestamp(self.end_time)
+
+    @property
+    def updated_datetime(self) -> datetime:
+        """``updated_at`` as a timezone-aware datetime."""
+        return parse_timestamp(self.updated_at)
+
+    @property
+    def created_datetime(self) -> datetime:
+        """``created_at`` as a timezone-aware datetime."""
+        return parse_timestamp(self.created_at)
@@ -0,0 +1,17 @@
+"""Workout count model."""
+
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+__all__ = ["WorkoutCount"]
+
+
+class WorkoutCount(BaseModel):
+    """Response of the workout count endpoint.
+
+    Attributes:
+        workout_count: Total number of workouts for the user.
+    """
+
+    workout_count: int = 0
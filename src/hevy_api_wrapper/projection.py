@@ -0,0 +1,136 @@
+"""Field projections: response models keeping only the fields a caller asked for.
+
+List and history endpoints accept ``fields``, a sequence of dotted paths into
+the listed items (``"start_time"``, ``"exercises.sets.reps"``). `project`
+turns the response model into a model holding just those fields, and only
+that model is validated from the response bytes: the JSON decoder skips the
+other keys without creating Python objects for them, so memory and object
+counts follow the fields used rather than the payload size.
+
+Projected models are ordinary pydantic models created once per response
+type and projection. Page fields such as ``page`` and ``page_count`` are
+always kept.
+"""
+
+from __future__ import annotations
+
+import typing
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple, Type, Union
+
+from pydantic import BaseModel, Field, create_model
+
+__all__ = ["project", "projection_key"]
+
+
+def project(response_type: Type[BaseModel], fields: Iterable[str]) -> Type[BaseModel]:
+    """Return the model of ``response_type`` keeping only ``fields`` of its items.
+
+    Args:
+        response_type: A list or history response model, e.g. `PaginatedWorkouts`.
+        fields: Dotted paths into one listed item, e.g. ``"id"`` or
+            ``"exercises.sets.weight_kg"``. Naming a nested model keeps all of it.
+
+    Returns:
+        The projected response model.
+
+    Raises:
+        ValueError: If ``response_type`` has no list of items or a path names
+            an unknown field.
+    """
+    return _projected_response(response_type, frozenset(fields))
+
+
+def projection_key(fields: Optional[Iterable[str]]) -> str:
+    """Return the cache key suffix telling projections of one response apart."""
+    return "" if not fields else "#fields=" + ",".join(sorted(set(fields)))
+
+
+@lru_cache(maxsize=256)
+def _projected_response(response_type: Type[BaseModel], fields: FrozenSet[str]) -> Type[BaseModel]:
+    items = [name for name, field in response_type.model_fields.items() if _list_item_model(field.annotation)]
+    if len(items) != 1:
+        raise ValueError(f"{response_type.__name__} has no list of items to project")
+    keep: Dict[str, Any] = {name: _definition(field) for name, field in response_type.model_fields.items()}
+    item_type = _list_item_model(response_type.model_fields[items[0]].annotation)
+    assert item_type is not None
+    keep[items[0]] = (List[_projected(item_type, _tree(fields))], ...)  # type: ignore[valid-type]
+    return create_model(f"{response_type.__name__}Projection", **keep)  # type: ignore[call-overload, no-any-return]
+
+
+def _tree(paths: Iterable[str]) -> Tuple[Tuple[str, Any], ...]:
+    """Turn dotted paths into a hashable tree; an empty subtree keeps the whole field."""
+    tree: Dict[str, Any] = {}
+    for path in paths:
+        node = tree
+        for part in path.split("."):
+            child = node.get(part)
+            if child is None:
+                child = node[part] = {}
+            elif not child:
+                break
+            node = child
+        else:
+            node.clear()
+    return _freeze(tree)
+
+
+def _freeze(tree: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+    return tuple(sorted((name, _freeze(child)) for name, child in tree.items()))
+
+
+@lru_cache(maxsize=256)
+def _projected(model_type: Type[BaseModel], tree: Tuple[Tuple[str, Any], ...]) -> Type[BaseModel]:
+    subtrees = dict(tree)
+    unknown = sorted(set(subtrees) - set(model_type.model_fields))
+    if unknown:
+        raise ValueError(f"{model_type.__name__} has no field {unknown[0]!r}")
+    keep: Dict[str, Any] = {}
+    for name, field in model_type.model_fields.items():
+        if name not in subtrees:
+            continue
+        subtree = subtrees[name]
+        if not subtree:
+            keep[name] = _definition(field)
+            continue
+        nested = _nested_model(field.annotation)
+        if nested is None:
+            raise ValueError(f"{model_type.__name__}.{name} has no fields to select")
+        annotation = _replace_model(field.annotation, nested, _projected(nested, subtree))
+        keep[name] = (annotation, field) if not field.is_required() else (annotation, ...)
+    return create_model(f"{model_type.__name__}Projection", **keep)  # type: ignore[call-overload, no-any-return]
+
+
+def _definition(field: Any) -> Tuple[Any, Any]:
+    """The ``create_model`` definition copying a field as is."""
+    return (field.annotation, field if not field.is_required() else Field(...))
+
+
+def _list_item_model(annotation: Any) -> Optional[Type[BaseModel]]:
+    if typing.get_origin(annotation) is list:
+        (item,) = typing.get_args(annotation)
+        if isinstance(item, type) and issubclass(item, BaseModel):
+            return item
+    return None
+
+
+def _nested_model(annotation: Any) -> Optional[Type[BaseModel]]:
+    """The model inside a ``Model``, ``List[Model]`` or ``Optional[Model]`` annotation."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    args: Sequence[Any] = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+    if typing.get_origin(annotation) in (list, Union) and len(args) == 1:
+        return _nested_model(args[0])
+    return None
+
+
+def _replace_model(annotation: Any, model_type: Any, replacement: Any) -> Any:
+    if annotation is model_type:
+        return replacement
+    origin = typing.get_origin(annotation)
+    if origin is list:
+        return List[_replace_model(typing.get_args(annotation)[0], model_type, replacement)]  # type: ignore[misc]
+    if origin is Union:
+        (arg,) = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        return Optional[_replace_model(arg, model_type, replacement)]
+    return annotation
@@ -0,0 +1,313 @@
+"""Differential sync for routines and routine folders.
+
+Routines and routine folders have no events feed, so changes are detected by
+fingerprinting what the list endpoints return. Each page gets a cheap
+fingerprint over its ``(id, updated_at)`` pairs; pages whose fingerprint is
+unchanged since the previous sync are skipped without hashing their contents.
+Items on changed pages are compared by ``updated_at`` plus a content hash.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, Generic, Hashable, List, Optional, Sequence, Tuple, TypeVar
+
+import pydantic_core
+
+from .models import Routine, RoutineFolder
+
+__all__ = [
+    "Fingerprint",
+    "RoutineSyncState",
+    "RoutineChanges",
+    "RoutineChangeTracker",
+    "AsyncRoutineChangeTracker",
+]
+
+ModelT = TypeVar("ModelT", Routine, RoutineFolder)
+KeyT = TypeVar("KeyT", bound=Hashable)
+
+
+@dataclass(frozen=True)
+class Fingerprint:
+    """Identity of one item's state.
+
+    Attributes:
+        updated_at: The item's ``updated_at`` timestamp.
+        digest: SHA-256 of the item's JSON representation.
+    """
+
+    updated_at: str
+    digest: str
+
+    @classmethod
+    def of(cls, item: Any) -> "Fingerprint":
+        """Fingerprint a routine or routine folder."""
+        digest = hashlib.sha256(pydantic_core.to_json(item)).hexdigest()
+        return cls(updated_at=getattr(item, "updated_at"), digest=digest)
+
+
+def _page_digest(items: Sequence[Any]) -> str:
+    hasher = hashlib.sha256()
+    for item in items:
+        hasher.update(f"{item.id}\0{item.updated_at}\n".encode())
+    return hasher.hexdigest()
+
+
+@dataclass
+class RoutineSyncState:
+    """Fingerprints remembered between syncs.
+
+    Persist it with `to_dict()` and restore it with `from_dict()` to carry
+    change detection across processes.
+
+    Attributes:
+        routines: Fingerprint per routine ID.
+        folders: Fingerprint per routine folder ID.
+        routine_pages: Page fingerprint per routines page number.
+        folder_pages: Page fingerprint per routine folders page number.
+    """
+
+    routines: Dict[str, Fingerprint] = field(default_factory=dict)
+    folders: Dict[int, Fingerprint] = field(default_factory=dict)
+    routine_pages: Dict[int, str] = field(default_factory=dict)
+    folder_pages: Dict[int, str] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable representation of the state."""
+        return {
+            "routines": {k: [v.updated_at, v.digest] for k, v in self.routines.items()},
+            "folders": {str(k): [v.updated_at, v.digest] for k, v in self.folders.items()},
+            "routine_pages": {str(k): v for k, v in self.routine_pages.items()},
+            "folder_pages": {str(k): v for k, v in self.folder_pages.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RoutineSyncState":
+        """Rebuild a state previously produced by `to_dict()`."""
+        return cls(
+            routines={k: Fingerprint(*v) for k, v in data.get("routines", {}).items()},
+            folders={int(k): Fingerprint(*v) for k, v in data.get("folders", {}).items()},
+            routine_pages={int(k): v for k, v in data.get("routine_pages", {}).items()},
+            folder_pages={int(k): v for k, v in data.get("folder_pages", {}).items()},
+        )
+
+
+@dataclass
+class RoutineChanges:
+    """Differences found by a sync.
+
+    Attributes:
+        added_routines: Routines not present in the previous sync.
+        changed_routines: Routines whose ``updated_at`` or content changed.
+        removed_routine_ids: IDs of routines that no longer exist.
+        added_folders: Routine folders not present in the previous sync.
+        changed_folders: Routine folders whose ``updated_at`` or content changed.
+        removed_folder_ids: IDs of routine folders that no longer exist.
+        skipped_pages: Number of pages skipped because their fingerprint matched.
+    """
+
+    added_routines: List[Routine] = field(default_factory=list)
+    changed_routines: List[Routine] = field(default_factory=list)
+    removed_routine_ids: List[str] = field(default_factory=list)
+    added_folders: List[RoutineFolder] = field(default_factory=list)
+    changed_folders: List[RoutineFolder] = field(default_factory=list)
+    removed_folder_ids: List[int] = field(default_factory=list)
+    skipped_pages: int = 0
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(
+            self.added_routines
+            or self.changed_routines
+            or self.removed_routine_ids
+            or self.added_folders
+            or self.changed_folders
+            or self.removed_folder_ids
+        )
+
+
+class _Differ(Generic[KeyT, ModelT]):
+    """Compares pages of one resource against the fingerprints of the previous sync."""
+
+    def __init__(self, previous: Dict[KeyT, Fingerprint], previous_pages: Dict[int, str]) -> None:
+        self._previous = previous
+        self._previous_pages = previous_pages
+        self.fingerprints: Dict[KeyT, Fingerprint] = {}
+        self.pages: Dict[int, str] = {}
+        self.added: List[ModelT] = []
+        self.changed: List[ModelT] = []
+        self.skipped_pages = 0
+
+    def add_page(self, page: int, items: Sequence[ModelT]) -> None:
+        digest = _page_digest(items)
+        self.pages[page] = digest
+        if self._previous_pages.get(page) == digest and all(item.id in self._previous for item in items):
+            self.skipped_pages += 1
+            for item in items:
+                self.fingerprints[item.id] = self._previous[item.id]
+            return
+        for item in items:
+            if item.id in self.fingerprints:
+                # Items shift between pages when something is inserted mid-listing.
+                continue
+            fingerprint = Fingerprint.of(item)
+            self.fingerprints[item.id] = fingerprint
+            old = self._previous.get(item.id)
+            if old is None:
+                self.added.append(item)
+            elif old != fingerprint:
+                self.changed.append(item)
+
+    def removed(self) -> List[KeyT]:
+        return [key for key in self._previous if key not in self.fingerprints]
+
+
+class _BaseTracker:
+    def __init__(self, client: Any, *, state: Optional[RoutineSyncState], page_size: int, fetch_details: bool) -> None:
+        if page_size < 1 or page_size > 10:
+            raise ValueError("page_size must be between 1 and 10 inclusive")
+        self._client = client
+        self._state = state or RoutineSyncState()
+        self.page_size = page_size
+        self.fetch_details = fetch_details
+
+    @property
+    def state(self) -> RoutineSyncState:
+        """Fingerprints from the last completed sync."""
+        return self._state
+
+    def _differs(self) -> Tuple[_Differ[str, Routine], _Differ[int, RoutineFolder]]:
+        return (
+            _Differ(self._state.routines, self._state.routine_pages),
+            _Differ(self._state.folders, self._state.folder_pages),
+        )
+
+    def _finish(self, routines: _Differ[str, Routine], folders: _Differ[int, RoutineFolder]) -> RoutineChanges:
+        changes = RoutineChanges(
+            added_routines=routines.added,
+            changed_routines=routines.changed,
+            removed_routine_ids=routines.removed(),
+            added_folders=folders.added,
+            changed_folders=folders.changed,
+            removed_folder_ids=folders.removed(),
+            skipped_pages=routines.skipped_pages + folders.skipped_pages,
+        )
+        self._state = RoutineSyncState(
+            routines=routines.fingerprints,
+            folders=folders.fingerprints,
+            routine_pages=routines.pages,
+            folder_pages=folders.pages,
+        )
+        return changes
+
+
+class RoutineChangeTracker(_BaseTracker):
+    """Detects added, changed and removed routines and routine folders (sync).
+
+    Example:
+        tracker = RoutineChangeTracker(client)
+        tracker.sync()  # first run reports everything as added
+        changes = tracker.sync()  # later runs report only differences
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        state: Optional[RoutineSyncState] = None,
+        page_size: int = 10,
+        fetch_details: bool = False,
+    ) -> None:
+        """Initialize the tracker.
+
+        Args:
+            client: A `Client` used to list routines and folders.
+            state: Fingerprints from an earlier sync to diff against.
+            page_size: Number of items requested per page (1-10).
+            fetch_details: Re-fetch added and changed items from their single-item
+                endpoints instead of using the list payload.
+        """
+        super().__init__(client, state=state, page_size=page_size, fetch_details=fetch_details)
+
+    def sync(self) -> RoutineChanges:
+        """List all routines and folders and diff them against the stored state.
+
+        Returns:
+            The changes since the previous sync. The tracker's state is only
+            updated when the whole listing succeeds.
+        """
+        routines, folders = self._differs()
+        page = 1
+        while True:
+            result = self._client.routines.get_routines(page=page, page_size=self.page_size)
+            routines.add_page(page, result.routines)
+            if page >= result.page_count or not result.routines:
+                break
+            page += 1
+        page = 1
+        while True:
+            folder_page = self._client.routine_folders.get_routine_folders(page=page, page_size=self.page_size)
+            folders.add_page(page, folder_page.routine_folders)
+            if page >= folder_page.page_count or not folder_page.routine_folders:
+                break
+            page += 1
+        if self.fetch_details:
+            routines.added = [self._client.routines.get_routine(r.id).routine for r in routines.added]
+            routines.changed = [self._client.routines.get_routine(r.id).routine for r in routines.changed]
+            folders.added = [self._client.routine_folders.get_routine_folder(f.id) for f in folders.added]
+            folders.changed = [self._client.routine_folders.get_routine_folder(f.id) for f in folders.changed]
+        return self._finish(routines, folders)
+
+
+class AsyncRoutineChangeTracker(_BaseTracker):
+    """Detects added, changed and removed routines and routine folders (async)."""
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        state: Optional[RoutineSyncState] = None,
+        page_size: int = 10,
+        fetch_details: bool = False,
+    ) -> None:
+        """Initialize the tracker.
+
+        Args:
+            client: An `AsyncClient` used to list routines and folders.
+            state: Fingerprints from an earlier sync to diff against.
+            page_size: Number of items requested per page (1-10).
+            fetch_details: Re-fetch added and changed items from their single-item
+                endpoints instead of using the list payload.
+        """
+        super().__init__(client, state=state, page_size=page_size, fetch_details=fetch_details)
+
+    async def sync(self) -> RoutineChanges:
+        """List all routines and folders and diff them against the stored state.
+
+        Returns:
+            The changes since the previous sync. The tracker's state is only
+            updated when the whole listing succeeds.
+        """
+        routines, folders = self._differs()
+        page = 1
+        while True:
+            result = await self._client.routines.get_routines(page=page, page_size=self.page_size)
+            routines.add_page(page, result.routines)
+            if page >= result.page_count or not result.routines:
+                break
+            page += 1
+        page = 1
+        while True:
+            folder_page = await self._client.routine_folders.get_routine_folders(page=page, page_size=self.page_size)
+            folders.add_page(page, folder_page.routine_folders)
+            if page >= folder_page.page_count or not folder_page.routine_folders:
+                break
+            page += 1
+        if self.fetch_details:
+            routines.added = [(await self._client.routines.get_routine(r.id)).routine for r in routines.added]
+            routines.changed = [(await self._client.routines.get_routine(r.id)).routine for r in routines.changed]
+            folders.added = [await self._client.routine_folders.get_routine_folder(f.id) for f in folders.added]
+            folders.changed = [await self._client.routine_folders.get_routine_folder(f.id) for f in folders.changed]
+        return self._finish(routines, folders)
@@ -0,0 +1,279 @@
+"""Columnar table of workout sets for analytics.
+
+`SetTable` flattens ``Workout -> WorkoutExercise -> WorkoutSet`` into one
+row per set, stored column by column in `array.array` buffers instead of a
+Python object per set:
+
+- ``weight_kg``, ``reps``, ``distance_meters``, ``duration_seconds``,
+  ``rpe`` and ``custom_metric`` are float64 columns; a missing value is NaN.
+- ``workout_start`` is the workout's start time in seconds since the epoch.
+- ``exercise_index`` and ``set_index`` are the positions within the workout
+  and the exercise.
+- ``workout``, ``exercise_template`` and ``set_type`` are dictionary-encoded:
+  each row holds a code indexing `SetTable.workout_ids`,
+  `SetTable.exercise_template_ids` or `SetTable.set_types`.
+
+Columns are read as `memoryview` objects or, with NumPy installed, as arrays
+sharing the same memory (`SetTable.to_numpy`). Slicing a table returns a
+`SetTableView` over the same memory without copying. Like any buffer, a
+table cannot grow or shrink while views or NumPy arrays of it are alive; release
+them first (``view.release()``, ``del``).
+
+Example:
+    table = SetTable()
+    for page in pages:
+        table.append_page(page)
+    weights = table.to_numpy()["weight_kg"]
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from itertools import compress
+from typing import Any, Dict, Iterable, List, Mapping
+
+from .timestamps import parse_timestamps
+
+__all__ = ["SetTable", "SetTableView", "SET_COLUMNS"]
+
+# Column name -> array typecode.
+SET_COLUMNS: Dict[str, str] = {
+    "workout": "I",
+    "workout_start": "d",
+    "exercise_index": "H",
+    "exercise_template": "I",
+    "set_index": "H",
+    "set_type": "B",
+    "weight_kg": "d",
+    "reps": "d",
+    "distance_meters": "d",
+    "duration_seconds": "d",
+    "rpe": "d",
+    "custom_metric": "d",
+}
+
+_NAN = math.nan
+
+_MEASURES = ("weight_kg", "reps", "distance_meters", "duration_seconds", "rpe", "custom_metric")
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as exc:  # pragma: no cover - depends on the environment
+        raise ImportError("to_numpy() requires NumPy: pip install 'hevy-api-wrapper[numpy]'") from exc
+    return numpy
+
+
+class _Columns:
+    """Read access shared by tables and views."""
+
+    _columns: Mapping[str, Any]
+    workout_ids: List[str]
+    exercise_template_ids: List[str]
+    set_types: List[str]
+
+    def __len__(self) -> int:
+        return len(self._columns["workout"])
+
+    def column(self, name: str) -> memoryview:
+        """Return a column as a memoryview sharing the table's memory.
+
+        Raises:
+            KeyError: If ``name`` is not one of `SET_COLUMNS`.
+        """
+        return memoryview(self._columns[name])
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Return every column as a NumPy array sharing the table's memory.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        numpy = _numpy()
+        return {name: numpy.frombuffer(self.column(name), dtype=typecode) for name, typecode in SET_COLUMNS.items()}
+
+    def __getitem__(self, index: slice) -> "SetTableView":
+        """Return the rows selected by a slice, without copying them."""
+        if not isinstance(index, slice):
+            raise TypeError("SetTable rows are selected with a slice")
+        return SetTableView(
+            {name: self.column(name)[index] for name in SET_COLUMNS},
+            self.workout_ids,
+            self.exercise_template_ids,
+            self.set_types,
+        )
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Return one set as a dict, with ids and set types decoded."""
+        values = {name: self._columns[name][index] for name in SET_COLUMNS}
+        values["workout"] = self.workout_ids[values["workout"]]
+        values["exercise_template"] = self.exercise_template_ids[values["exercise_template"]]
+        values["set_type"] = self.set_types[values["set_type"]]
+        return values
+
+
+class SetTableView(_Columns):
+    """A slice of a `SetTable`, sharing its memory.
+
+    The dictionaries (``workout_ids``, ...) are the table's own lists, so
+    codes decode the same way in the view and in the table.
+    """
+
+    def __init__(
+        self,
+        columns: Dict[str, memoryview],
+        workout_ids: List[str],
+        exercise_template_ids: List[str],
+        set_types: List[str],
+    ) -> None:
+        self._columns = columns
+        self.workout_ids = workout_ids
+        self.exercise_template_ids = exercise_template_ids
+        self.set_types = set_types
+
+    def release(self) -> None:
+        """Release the view's buffers so the table can grow again."""
+        for view in self._columns.values():
+            view.release()
+
+
+class SetTable(_Columns):
+    """Workout sets stored column by column.
+
+    Build it from workout pages or workout event streams; rows are appended
+    in the order the sets arrive. Workouts may be pydantic, compact or lazy
+    models.
+
+    Attributes:
+        workout_ids: Workout id of each ``workout`` code.
+        exercise_template_ids: Template id of each ``exercise_template`` code.
+        set_types: Set type of each ``set_type`` code.
+    """
+
+    def __init__(self) -> None:
+        self._columns: Dict[str, array] = {name: array(typecode) for name, typecode in SET_COLUMNS.items()}
+        self.workout_ids: List[str] = []
+        self.exercise_template_ids: List[str] = []
+        self.set_types: List[str] = []
+        self._workout_codes: Dict[str, int] = {}
+        self._template_codes: Dict[str, int] = {}
+        self._set_type_codes: Dict[str, int] = {}
+
+    @classmethod
+    def from_workouts(cls, workouts: Iterable[Any]) -> "SetTable":
+        """Return a table holding the sets of ``workouts``."""
+        table = cls()
+        table.append_workouts(workouts)
+        return table
+
+    def append_page(self, page: Any) -> None:
+        """Append the sets of a `PaginatedWorkouts` page."""
+        self.append_workouts(page.workouts)
+
+    def append_events(self, events: Iterable[Any]) -> None:
+        """Apply workout events, such as those of `PaginatedWorkoutEvents`.
+
+        An updated workout replaces the rows it had in the table; a deleted
+        workout's rows are removed.
+
+        Raises:
+            BufferError: If views or NumPy arrays of the table are still alive;
+                the table is left unchanged.
+        """
+        updated: Dict[str, Any] = {}
+        removed = set()
+        for event in events:
+            workout_id = event.workout.id if event.type == "updated" else event.id
+            removed.add(workout_id)
+            if event.type == "updated":
+                updated[workout_id] = event.workout
+            else:
+                updated.pop(workout_id, None)
+        self._check_resizable()
+        self._remove({self._workout_codes[id] for id in removed if id in self._workout_codes})
+        self.append_workouts(updated.values())
+
+    def append_workouts(self, workouts: Iterable[Any]) -> None:
+        """Append the sets of ``workouts``.
+
+        Raises:
+            BufferError: If views or NumPy arrays of the table are still alive.
+        """
+        workouts = list(workouts)
+        starts = [moment.timestamp() for moment in parse_timestamps(workout.start_time for workout in workouts)]
+        sets: List[Any] = []
+        workout_codes: List[int] = []
+        workout_starts: List[float] = []
+        exercise_indexes: List[int] = []
+        template_codes: List[int] = []
+        for workout, start in zip(workouts, starts):
+            workout_code = _code(self._workout_codes, self.workout_ids, workout.id)
+            for exercise in workout.exercises:
+                count = len(exercise.sets)
+                sets += exercise.sets
+                workout_codes += [workout_code] * count
+                workout_starts += [start] * count
+                exercise_indexes += [exercise.index] * count
+                template_code = _code(self._template_codes, self.exercise_template_ids, exercise.exercise_template_id)
+                template_codes += [template_code] * count
+        set_type_codes = self._set_type_codes
+        for set_type in dict.fromkeys(workout_set.type for workout_set in sets):
+            _code(set_type_codes, self.set_types, set_type)
+        values: Dict[str, List[Any]] = {
+            "workout": workout_codes,
+            "workout_start": workout_starts,
+            "exercise_index": exercise_indexes,
+            "exercise_template": template_codes,
+            "set_index": [workout_set.index for workout_set in sets],
+            "set_type": [set_type_codes[workout_set.type] for workout_set in sets],
+        }
+        for name in _MEASURES:
+            column = [getattr(workout_set, name) for workout_set in sets]
+            values[name] = [_NAN if value is None else value for value in column]
+        self._extend(values)
+
+    def _extend(self, values: Mapping[str, List[Any]]) -> None:
+        """Append to every column, or to none if one of them cannot grow."""
+        length = len(self)
+        extended = []
+        try:
+            for name, typecode in SET_COLUMNS.items():
+                self._columns[name].extend(array(typecode, values[name]))
+                extended.append(name)
+        except BufferError:
+            for name in extended:
+                del self._columns[name][length:]
+            raise
+
+    def _check_resizable(self) -> None:
+        """Raise `BufferError` if a column is exporting its buffer."""
+        for column in self._columns.values():
+            del column[len(column) :]
+
+    def _remove(self, workout_codes: Iterable[int]) -> None:
+        """Drop the rows of the given workouts, keeping the others in order.
+
+        Columns are rewritten in place, so call `_check_resizable` first.
+        """
+        codes = set(workout_codes)
+        if not codes:
+            return
+        keep = [code not in codes for code in self._columns["workout"]]
+        for name, typecode in SET_COLUMNS.items():
+            column = self._columns[name]
+            column[:] = array(typecode, compress(column, keep))
+
+    def memory_usage(self) -> int:
+        """Bytes held by the column buffers."""
+        return sum(column.buffer_info()[1] * column.itemsize for column in self._columns.values())
+
+
+def _code(codes: Dict[str, int], values: List[str], value: str) -> int:
+    """Return the dictionary code of ``value``, adding it if new."""
+    code = codes.get(value)
+    if code is None:
+        code = codes[value] = len(values)
+        values.append(value)
+    return code
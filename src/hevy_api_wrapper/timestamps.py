@@ -0,0 +1,61 @@
+"""Parsing of the ISO 8601 timestamps the API returns as strings.
+
+Models keep timestamps as the strings the API sent; their ``*_datetime``
+properties parse them on each access with `parse_timestamp`, which caches
+recent values, so they always match the strings. To sort or filter a whole
+page at once, `parse_timestamps` parses each distinct value a single time,
+which matters because many entries share a timestamp (every set of a workout
+carries the workout's start time).
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, Iterable, List
+
+__all__ = ["parse_timestamp", "parse_timestamps"]
+
+
+@lru_cache(maxsize=4096)
+def parse_timestamp(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, treating naive values as UTC.
+
+    Args:
+        value: A timestamp such as ``"2024-01-01T18:00:00Z"``.
+
+    Returns:
+        A timezone-aware datetime.
+
+    Raises:
+        ValueError: If ``value`` is not an ISO 8601 timestamp.
+    """
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def parse_timestamps(values: Iterable[str]) -> List[datetime]:
+    """Parse many timestamps, each distinct value only once.
+
+    Example:
+        starts = parse_timestamps(entry.workout_start_time for entry in history.exercise_history)
+
+    Args:
+        values: ISO 8601 timestamps.
+
+    Returns:
+        The parsed datetimes, in the order of ``values``.
+    """
+    parsed: Dict[str, datetime] = {}
+    result = []
+    for value in values:
+        moment = parsed.get(value)
+        if moment is None:
+            # Bypass the shared cache, which a large page would flush.
+            moment = parsed[value] = parse_timestamp.__wrapped__(value)
+        result.append(moment)
+    return result
@@ -0,0 +1,32 @@
+"""Sample API payloads shared by the test modules."""
+
+import pytest
+
+
+def _sample_workout_json(id: str = "w-1", updated_at: str = "2021-09-14T12:31:00Z", template_id: str = "05293BCA"):
+    return {
+        "id": id,
+        "title": "Morning Workout",
+        "routine_id": "r-1",
+        "description": "desc",
+        "start_time": "2021-09-14T12:00:00Z",
+        "end_time": "2021-09-14T12:30:00Z",
+        "updated_at": updated_at,
+        "created_at": "2021-09-14T12:00:00Z",
+        "exercises": [
+            {
+                "index": 0,
+                "title": "Bench Press (Barbell)",
+                "notes": "",
+                "exercise_template_id": template_id,
+                "supersets_id": None,
+                "sets": [{"index": 0, "type": "normal", "weight_kg": 100, "reps": 10, "rpe": 9.5}],
+            }
+        ],
+    }
+
+
+@pytest.fixture
+def sample_workout_json():
+    """Build the JSON of a workout with one exercise and one set."""
+    return _sample_workout_json
@@ -0,0 +1,29 @@
+from typing import List
+
+from hevy_api_wrapper.adapters import adapter, validate_json
+from hevy_api_wrapper.models import ExerciseTemplate, MuscleGroup, PaginatedRoutineFolders
+
+
+def test_adapter_is_built_once_per_type():
+    assert adapter(PaginatedRoutineFolders) is adapter(PaginatedRoutineFolders)
+    assert adapter(List[ExerciseTemplate]) is adapter(List[ExerciseTemplate])
+
+
+def test_validate_json_matches_keyword_construction():
+    data = {
+        "page": 1,
+        "page_count": 1,
+        "routine_folders": [
+            {"id": 42, "index": 0, "title": "Push Pull", "updated_at": "2021-09-14T12:31:00Z", "created_at": "x"}
+        ],
+    }
+    raw = b'{"page":1,"page_count":1,"routine_folders":[{"id":42,"index":0,"title":"Push Pull",' + (
+        b'"updated_at":"2021-09-14T12:31:00Z","created_at":"x"}]}'
+    )
+
+    assert validate_json(PaginatedRoutineFolders, raw) == PaginatedRoutineFolders(**data)
+    templates = validate_json(
+        List[ExerciseTemplate],
+        '[{"id":"T-1","title":"Bench","type":"weight_reps","primary_muscle_group":"chest","is_custom":false}]',
+    )
+    assert templates[0].primary_muscle_group is MuscleGroup.chest
@@ -0,0 +1,465 @@
+import asyncio
+import json
+import multiprocessing
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+import respx
+
+from hevy_api_wrapper import AsyncClient, Client
+from hevy_api_wrapper.cache import (
+    CacheBackend,
+    CachePolicy,
+    MemoryCache,
+    ResponseCache,
+    SharedMemoryCache,
+    SQLiteCache,
+)
+from hevy_api_wrapper.cache.base import CacheEntry
+from hevy_api_wrapper.cache.shared_memory import _SEQ
+from hevy_api_wrapper.errors import NotFoundError
+from hevy_api_wrapper.models import (
+    PostRoutineFolder,
+    PostRoutineFolderRequestBody,
+    PostWorkoutsRequestBody,
+    PostWorkoutsRequestBodyWorkout,
+)
+
+BASE = "https://api.hevyapp.com"
+
+
+def sample_exercise_template_json(id: str = "T-1"):
+    return {
+        "id": id,
+        "title": "Bench Press (Barbell)",
+        "type": "weight_reps",
+        "primary_muscle_group": "chest",
+        "secondary_muscle_groups": ["triceps"],
+        "is_custom": False,
+    }
+
+
+@respx.mock
+def test_exercise_templates_are_cached_by_default():
+    single = respx.get(f"{BASE}/v1/exercise_templates/T-1").respond(200, json=sample_exercise_template_json())
+    listing = respx.get(f"{BASE}/v1/exercise_templates").respond(
+        200, json={"page": 1, "page_count": 1, "exercise_templates": [sample_exercise_template_json()]}
+    )
+    cache = ResponseCache()
+
+    with Client(api_key="test-key", cache=cache) as c:
+        assert c.exercise_templates.get_exercise_template("T-1").id == "T-1"
+        assert c.exercise_templates.get_exercise_template("T-1").id == "T-1"
+        c.exercise_templates.get_exercise_templates(page=1, page_size=100)
+        c.exercise_templates.get_exercise_templates(page=1, page_size=100)
+        c.exercise_templates.get_exercise_templates(page=1, page_size=50)
+
+    assert single.call_count == 1
+    assert listing.call_count == 2
+    stats = cache.stats
+    assert stats["exercise_templates.get_exercise_template"].hits == 1
+    assert stats["exercise_templates.get_exercise_template"].misses == 1
+    assert stats["exercise_templates.get_exercise_templates"].hit_ratio == pytest.approx(1 / 3)
+
+
+@respx.mock
+def test_cache_keys_are_scoped_by_api_key_and_policy():
+    route = respx.get(f"{BASE}/v1/workouts/count").respond(200, json={"workout_count": 42})
+    cache = ResponseCache(policies={"workouts.get_count": 60})
+
+    with Client(api_key="key-a", cache=cache) as a, Client(api_key="key-b", cache=cache) as b:
+        assert a.workouts.get_count() == 42
+        assert a.workouts.get_count() == 42
+        assert b.workouts.get_count() == 42
+
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_uncached_endpoints_always_hit_the_network():
+    route = respx.get(f"{BASE}/v1/workouts/count").respond(200, json={"workout_count": 1})
+    cache = ResponseCache(policies={"exercise_templates.get_exercise_template": CachePolicy(ttl=0)})
+
+    with Client(api_key="test-key", cache=cache) as c:
+        c.workouts.get_count()
+        c.workouts.get_count()
+
+    assert route.call_count == 2
+    assert cache.policy("exercise_templates.get_exercise_template") is None
+
+
+def test_unknown_endpoint_policy_is_rejected():
+    with pytest.raises(ValueError):
+        ResponseCache(policies={"workouts.delete_workout": 60})
+
+
+def test_memory_cache_ttl_and_lru_eviction():
+    cache = MemoryCache(max_entries=2)
+    cache.set("a", CacheEntry(value=1, stored_at=0, expires_at=float("inf")))
+    cache.set("b", CacheEntry(value=2, stored_at=0, expires_at=float("inf")))
+    assert cache.get("a").value == 1  # "b" is now least recently used
+    cache.set("c", CacheEntry(value=3, stored_at=0, expires_at=float("inf")))
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+    cache.set("expired", CacheEntry(value=4, stored_at=0, expires_at=0))
+    assert cache.get("expired") is None
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_client_uses_cache():
+    route = respx.get(f"{BASE}/v1/exercise_templates/T-1").respond(200, json=sample_exercise_template_json())
+
+    async with AsyncClient(api_key="test-key", cache=ResponseCache()) as c:
+        first = await c.exercise_templates.get_exercise_template("T-1")
+        second = await c.exercise_templates.get_exercise_template("T-1")
+
+    assert first is second
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_sqlite_cache_persists_across_instances(tmp_path):
+    route = respx.get(f"{BASE}/v1/exercise_templates/T-1").respond(200, json=sample_exercise_template_json())
+    path = tmp_path / "cache.db"
+
+    with Client(api_key="test-key", cache=ResponseCache(backend=SQLiteCache(path))) as c:
+        c.exercise_templates.get_exercise_template("T-1")
+    with Client(api_key="test-key", cache=ResponseCache(backend=SQLiteCache(path))) as c:
+        template = c.exercise_templates.get_exercise_template("T-1")
+
+    assert template.title == "Bench Press (Barbell)"
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_stale_entries_are_served_while_refreshing():
+    route = respx.get(f"{BASE}/v1/workouts/count").mock(
+        side_effect=[
+            httpx.Response(200, json={"workout_count": 1}),
+            httpx.Response(200, json={"workout_count": 2}),
+        ]
+    )
+    cache = ResponseCache(policies={"workouts.get_count": CachePolicy(ttl=0.01, stale_ttl=60)})
+
+    with Client(api_key="test-key", cache=cache) as c:
+        assert c.workouts.get_count() == 1
+        time.sleep(0.02)
+        assert c.workouts.get_count() == 1  # stale, refresh starts in the background
+        for thread in threading.enumerate():
+            if thread.name == "hevy-cache-refresh":
+                thread.join()
+        assert c.workouts.get_count() == 2
+
+    assert route.call_count == 2
+    stats = cache.stats["workouts.get_count"]
+    assert (stats.misses, stats.stale_hits, stats.hits) == (1, 1, 1)
+
+
+class _TemplatesHandler(BaseHTTPRequestHandler):
+    """Stand-in API answering conditional requests for the template list."""
+
+    etag = '"v1"'
+    requests: list = []
+
+    def do_GET(self):
+        type(self).requests.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.send_header("ETag", self.etag)
+            self.end_headers()
+            return
+        body = json.dumps(
+            {"page": 1, "page_count": 1, "exercise_templates": [sample_exercise_template_json()]}
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", self.etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def templates_server():
+    _TemplatesHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _TemplatesHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+def test_expired_entries_are_revalidated_with_etag(templates_server):
+    cache = ResponseCache(policies={"exercise_templates.get_exercise_templates": CachePolicy(ttl=0.01)})
+
+    with Client(base_url=templates_server, api_key="test-key", cache=cache) as c:
+        first = c.exercise_templates.get_exercise_templates(page=1, page_size=100)
+        time.sleep(0.02)
+        second = c.exercise_templates.get_exercise_templates(page=1, page_size=100)
+
+    assert second is first
+    assert [r.get("If-None-Match") for r in _TemplatesHandler.requests] == [None, '"v1"']
+    stats = c.cache_stats()["exercise_templates.get_exercise_templates"]
+    assert (stats.misses, stats.revalidations, stats.round_trips_saved) == (2, 1, 0)
+    assert stats.bytes_saved > 0
+
+
+@pytest.mark.asyncio
+async def test_async_revalidation_with_sqlite_backend(templates_server, tmp_path):
+    cache = ResponseCache(
+        policies={"exercise_templates.get_exercise_templates": CachePolicy(ttl=0.01)},
+        backend=SQLiteCache(tmp_path / "cache.db"),
+    )
+
+    async with AsyncClient(base_url=templates_server, api_key="test-key", cache=cache) as c:
+        await c.exercise_templates.get_exercise_templates(page=1, page_size=100)
+        await asyncio.sleep(0.02)
+        page = await c.exercise_templates.get_exercise_templates(page=1, page_size=100)
+
+    assert page.exercise_templates[0].id == "T-1"
+    assert len(_TemplatesHandler.requests) == 2
+    assert _TemplatesHandler.requests[1].get("If-None-Match") == '"v1"'
+
+
+@respx.mock
+def test_not_found_lookups_are_negatively_cached_until_an_update(sample_workout_json):
+    route = respx.get(f"{BASE}/v1/workouts/w-1").mock(
+        side_effect=[
+            httpx.Response(404, json={"message": "Workout not found"}),
+            httpx.Response(200, json=sample_workout_json()),
+        ]
+    )
+    respx.put(f"{BASE}/v1/workouts/w-1").respond(200, json={"workout": [sample_workout_json()]})
+    cache = ResponseCache(negative_ttl=60)
+    body = PostWorkoutsRequestBody(
+        workout=PostWorkoutsRequestBodyWorkout(
+            title="Morning Workout",
+            start_time="2021-09-14T12:00:00Z",
+            end_time="2021-09-14T12:30:00Z",
+            is_private=False,
+            exercises=[],
+        )
+    )
+
+    with Client(api_key="test-key", cache=cache) as c:
+        for _ in range(3):
+            with pytest.raises(NotFoundError, match="Workout not found"):
+                c.workouts.get_workout("w-1")
+        assert route.call_count == 1
+
+        c.workouts.update_workout("w-1", body)
+        assert c.workouts.get_workout("w-1").id == "w-1"
+
+    assert route.call_count == 2
+    assert cache.stats["workouts.get_workout"].hits == 2
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_workout_events_forget_negative_entries(sample_workout_json):
+    route = respx.get(f"{BASE}/v1/routines/r-9").respond(404, json={"message": "Routine not found"})
+    workout = respx.get(f"{BASE}/v1/workouts/w-1").mock(
+        side_effect=[
+            httpx.Response(404, json={"message": "Workout not found"}),
+            httpx.Response(200, json=sample_workout_json()),
+        ]
+    )
+    respx.get(f"{BASE}/v1/workouts/events").respond(
+        200,
+        json={"page": 1, "page_count": 1, "events": [{"type": "updated", "workout": sample_workout_json()}]},
+    )
+
+    async with AsyncClient(api_key="test-key", cache=ResponseCache(negative_ttl=60)) as c:
+        for _ in range(2):
+            with pytest.raises(NotFoundError):
+                await c.routines.get_routine("r-9")
+            with pytest.raises(NotFoundError):
+                await c.workouts.get_workout("w-1")
+        await c.workouts.get_events(page=1, page_size=5)
+        assert (await c.workouts.get_workout("w-1")).id == "w-1"
+
+    assert route.call_count == 1
+    assert workout.call_count == 2
+
+
+@respx.mock
+def test_writes_seed_lookups_and_invalidate_lists(sample_workout_json):
+    single = respx.get(f"{BASE}/v1/workouts/w-2").respond(200, json=sample_workout_json("w-2"))
+    listing = respx.get(f"{BASE}/v1/workouts").respond(
+        200, json={"page": 1, "page_count": 1, "workouts": [sample_workout_json()]}
+    )
+    count = respx.get(f"{BASE}/v1/workouts/count").respond(200, json={"workout_count": 1})
+    respx.post(f"{BASE}/v1/workouts").respond(201, json={"workout": [sample_workout_json("w-2")]})
+    cache = ResponseCache(
+        policies={"workouts.get_workout": 60, "workouts.get_workouts": 60, "workouts.get_count": 60},
+    )
+    body = PostWorkoutsRequestBody(
+        workout=PostWorkoutsRequestBodyWorkout(
+            title="Morning Workout",
+            start_time="2021-09-14T12:00:00Z",
+            end_time="2021-09-14T12:30:00Z",
+            is_private=False,
+            exercises=[],
+        )
+    )
+
+    with Client(api_key="test-key", cache=cache) as c, Client(api_key="other-key", cache=cache) as other:
+        c.workouts.get_workouts(page=1, page_size=5)
+        c.workouts.get_count()
+        other.workouts.get_count()
+
+        created = c.workouts.create_workout(body)
+        assert c.workouts.get_workout("w-2") is created
+        c.workouts.get_workouts(page=1, page_size=5)
+        c.workouts.get_count()
+        other.workouts.get_count()
+
+    assert single.call_count == 0
+    assert listing.call_count == 2
+    assert count.call_count == 3  # the other account's count stays cached
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_folder_creation_is_written_through():
+    folder_json = {
+        "id": 42,
+        "index": 0,
+        "title": "Push Pull",
+        "updated_at": "2021-09-14T12:00:00Z",
+        "created_at": "2021-09-14T12:00:00Z",
+    }
+    single = respx.get(f"{BASE}/v1/routine_folders/42").respond(200, json=folder_json)
+    listing = respx.get(f"{BASE}/v1/routine_folders").respond(
+        200, json={"page": 1, "page_count": 1, "routine_folders": []}
+    )
+    respx.post(f"{BASE}/v1/routine_folders").respond(201, json={"routine_folder": folder_json})
+    cache = ResponseCache(
+        policies={"routine_folders.get_routine_folder": 60, "routine_folders.get_routine_folders": 60},
+    )
+
+    async with AsyncClient(api_key="test-key", cache=cache) as c:
+        await c.routine_folders.get_routine_folders(page=1, page_size=5)
+        await c.routine_folders.create_routine_folder(
+            PostRoutineFolderRequestBody(routine_folder=PostRoutineFolder(title="Push Pull"))
+        )
+        assert (await c.routine_folders.get_routine_folder(42)).title == "Push Pull"
+        await c.routine_folders.get_routine_folders(page=1, page_size=5)
+
+    assert single.call_count == 0
+    assert listing.call_count == 2
+
+
+@pytest.fixture
+def shared_cache():
+    backend = SharedMemoryCache(f"hevy-test-{uuid.uuid4().hex[:8]}", slots=64, slot_size=1024)
+    yield backend
+    backend.unlink()
+    backend.close()
+
+
+def _store_in_shared_cache(name: str, key: str, value: bytes) -> None:
+    backend = SharedMemoryCache(name, slots=64, slot_size=1024)
+    backend.set(key, CacheEntry(value=value, stored_at=time.time(), expires_at=float("inf"), etag='"e"'))
+    backend.close()
+
+
+def test_backends_implement_the_protocol(tmp_path, shared_cache):
+    for backend in (MemoryCache(), SQLiteCache(tmp_path / "cache.db"), shared_cache):
+        assert isinstance(backend, CacheBackend)
+
+
+def test_shared_memory_cache_is_shared_across_processes(shared_cache):
+    process = multiprocessing.get_context("spawn").Process(
+        target=_store_in_shared_cache, args=(shared_cache.name, "scope|a", b'{"workout_count":3}')
+    )
+    process.start()
+    process.join(timeout=30)
+
+    entry = shared_cache.get("scope|a")
+    assert entry.value == b'{"workout_count":3}'
+    assert entry.etag == '"e"'
+    assert entry.last_modified is None
+
+
+def test_shared_memory_cache_eviction_and_prefix_delete(shared_cache):
+    for i in range(200):
+        shared_cache.set(f"a|{i}", CacheEntry(value=b"1", stored_at=i, expires_at=float("inf")))
+    assert len(shared_cache) == 64
+    assert shared_cache.get("a|199").value == b"1"
+
+    shared_cache.set("b|big", CacheEntry(value=b"x" * 2048, stored_at=0, expires_at=float("inf")))
+    assert shared_cache.get("b|big") is None
+    shared_cache.set("b|expired", CacheEntry(value=b"1", stored_at=0, expires_at=0))
+    assert shared_cache.get("b|expired") is None
+
+    shared_cache.delete_prefix("a|")
+    assert shared_cache.get("a|199") is None
+    assert len(shared_cache) == 1  # the expired entry, until its slot is reused
+
+    with pytest.raises(ValueError):
+        SharedMemoryCache(shared_cache.name, slots=128, slot_size=1024)
+
+
+def test_shared_memory_slots_recover_from_a_crashed_writer(shared_cache):
+    # A writer that died mid-write leaves every slot it touched with an odd sequence number.
+    for index in range(shared_cache.slots):
+        _SEQ.pack_into(shared_cache._buf, shared_cache._offset(index), 7)
+
+    shared_cache.set("a|1", CacheEntry(value=b"1", stored_at=0, expires_at=float("inf")))
+
+    assert shared_cache.get("a|1").value == b"1"
+    seqs = [_SEQ.unpack_from(shared_cache._buf, shared_cache._offset(index))[0] for index in range(shared_cache.slots)]
+    assert sorted(set(seqs)) == [7, 10]
+
+
+@respx.mock
+def test_client_with_shared_memory_backend(shared_cache):
+    route = respx.get(f"{BASE}/v1/exercise_templates/T-1").respond(200, json=sample_exercise_template_json())
+
+    with Client(api_key="test-key", cache=ResponseCache(backend=shared_cache)) as c:
+        c.exercise_templates.get_exercise_template("T-1")
+    with Client(api_key="test-key", cache=ResponseCache(backend=shared_cache)) as c:
+        assert c.exercise_templates.get_exercise_template("T-1").title == "Bench Press (Barbell)"
+
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_cache_stats_and_metrics_hook():
+    body = sample_exercise_template_json()
+    respx.get(f"{BASE}/v1/exercise_templates/T-1").respond(200, json=body)
+    respx.get(f"{BASE}/v1/exercise_templates/T-2").respond(200, json=sample_exercise_template_json("T-2"))
+    events = []
+    cache = ResponseCache(max_entries=1, metrics_hook=lambda *event: events.append(event))
+
+    with Client(api_key="test-key", cache=cache) as c:
+        c.exercise_templates.get_exercise_template("T-1")
+        c.exercise_templates.get_exercise_template("T-1")
+        c.exercise_templates.get_exercise_template("T-2")
+        stats = c.cache_stats()["exercise_templates.get_exercise_template"]
+
+    body_size = len(json.dumps(body, separators=(",", ":")))
+    assert (stats.hits, stats.misses, stats.evictions, stats.round_trips_saved) == (1, 2, 1, 1)
+    assert stats.bytes_saved == body_size
+    assert stats.hit_ratio == pytest.approx(1 / 3)
+    endpoint = "exercise_templates.get_exercise_template"
+    assert events == [
+        (endpoint, "misses", 1),
+        (endpoint, "hits", 1),
+        (endpoint, "bytes_saved", body_size),
+        (endpoint, "round_trips_saved", 1),
+        (endpoint, "misses", 1),
+        (endpoint, "evictions", 1),
+    ]
+    assert Client(api_key="test-key").cache_stats() == {}
@@ -0,0 +1,111 @@
+import httpx
+import pytest
+import respx
+
+from hevy_api_wrapper import AsyncClient, Client
+from hevy_api_wrapper.catalog import ExerciseTemplateCatalog
+from hevy_api_wrapper.models import CustomExerciseType, ExerciseTemplate, MuscleGroup
+
+BASE = "https://api.hevyapp.com"
+
+
+def template_json(id, title, primary="chest", secondary=(), type="weight_reps", is_custom=False):
+    return {
+        "id": id,
+        "title": title,
+        "type": type,
+        "primary_muscle_group": primary,
+        "secondary_muscle_groups": list(secondary),
+        "is_custom": is_custom,
+    }
+
+
+TEMPLATES = [
+    template_json("T-1", "Bench Press (Barbell)", secondary=["triceps", "shoulders"]),
+    template_json("T-2", "Incline Bench Press (Dumbbell)", secondary=["shoulders"]),
+    template_json("T-3", "Squat (Barbell)", primary="quadriceps", secondary=["glutes"]),
+    template_json("T-4", "Push Up", type="bodyweight_reps", secondary=["triceps"]),
+    template_json("C-1", "Sled Push", primary="full_body", type="distance_duration", is_custom=True),
+]
+
+
+def make_catalog():
+    return ExerciseTemplateCatalog(ExerciseTemplate(**t) for t in TEMPLATES)
+
+
+def test_lookups_and_filters():
+    catalog = make_catalog()
+
+    assert len(catalog) == 5 and "T-3" in catalog
+    assert catalog.title("T-3") == "Squat (Barbell)"
+    assert catalog.primary_muscle_group("T-3") is MuscleGroup.quadriceps
+    assert catalog.get("missing") is None
+    assert [t.id for t in catalog.filter(primary_muscle_group=MuscleGroup.chest)] == ["T-1", "T-2", "T-4"]
+    assert [t.id for t in catalog.filter(secondary_muscle_group="triceps", type=CustomExerciseType.weight_reps)] == [
+        "T-1"
+    ]
+    assert [t.id for t in catalog.filter(is_custom=True)] == ["C-1"]
+    assert catalog.filter(primary_muscle_group="neck") == []
+
+    catalog.add(ExerciseTemplate(**template_json("T-1", "Floor Press (Barbell)")))
+    assert catalog.title("T-1") == "Floor Press (Barbell)"
+    assert [t.id for t in catalog.filter(secondary_muscle_group="triceps")] == ["T-4"]
+    catalog.remove("T-1")
+    assert "T-1" not in catalog
+
+
+def test_trigram_search_ranks_titles():
+    catalog = make_catalog()
+
+    assert [t.id for t in catalog.search("bench press", limit=2)] == ["T-1", "T-2"]
+    assert catalog.search("press bench")[0].id == "T-1"
+    assert catalog.search("squaat")[0].id == "T-3"
+    assert catalog.search("push")[0].id in {"T-4", "C-1"}
+    assert catalog.search("deadlift") == []
+    assert catalog.search("") == []
+
+
+def test_snapshot_round_trip(tmp_path):
+    path = tmp_path / "templates.json"
+    make_catalog().save_snapshot(path)
+
+    restored = ExerciseTemplateCatalog.from_snapshot(path)
+
+    assert len(restored) == 5
+    assert restored["C-1"].type is CustomExerciseType.distance_duration
+    assert restored["T-1"].secondary_muscle_groups == ["triceps", "shoulders"]
+    assert restored.search("sled")[0].id == "C-1"
+
+    (tmp_path / "other.json").write_text("[]")
+    with pytest.raises(ValueError):
+        ExerciseTemplateCatalog.from_snapshot(tmp_path / "other.json")
+
+
+@respx.mock
+def test_catalog_loads_every_page():
+    def pages(request):
+        page = int(request.url.params["page"])
+        return httpx.Response(
+            200, json={"page": page, "page_count": 2, "exercise_templates": TEMPLATES[(page - 1) * 3 : page * 3]}
+        )
+
+    route = respx.get(f"{BASE}/v1/exercise_templates").mock(side_effect=pages)
+
+    with Client(api_key="test-key") as c:
+        catalog = ExerciseTemplateCatalog.from_client(c)
+
+    assert len(catalog) == 5
+    assert route.call_count == 2
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_catalog_loads_with_async_client():
+    respx.get(f"{BASE}/v1/exercise_templates").respond(
+        200, json={"page": 1, "page_count": 1, "exercise_templates": TEMPLATES}
+    )
+
+    async with AsyncClient(api_key="test-key") as c:
+        catalog = await ExerciseTemplateCatalog.from_async_client(c)
+
+    assert catalog.title("T-4") == "Push Up"
@@ -0,0 +1,137 @@
+import dataclasses
+
+import pytest
+import respx
+
+from hevy_api_wrapper import AsyncClient, Client
+from hevy_api_wrapper.cache import ExerciseHistoryCache, ResponseCache
+from hevy_api_wrapper.compact import (
+    CompactExerciseHistoryResponse,
+    CompactPaginatedWorkouts,
+    CompactRoutineResponse,
+    CompactWorkout,
+    CompactWorkoutSet,
+    to_compact,
+)
+from hevy_api_wrapper.models import (
+    ExerciseTemplate,
+    PaginatedWorkouts,
+    PostWorkoutsRequestBody,
+    PostWorkoutsRequestBodyWorkout,
+    PostWorkoutsRequestExercise,
+    PostWorkoutsRequestSet,
+    Workout,
+)
+
+BASE = "https://api.hevyapp.com"
+
+
+def sample_routine_json(id: str = "r-1"):
+    return {
+        "id": id,
+        "title": "Upper Body",
+        "folder_id": None,
+        "updated_at": "2021-09-14T12:31:00Z",
+        "created_at": "2021-09-14T12:00:00Z",
+        "exercises": [],
+    }
+
+
+@respx.mock
+def test_compact_client_returns_slotted_models(sample_workout_json):
+    page = {"page": 1, "page_count": 1, "workouts": [sample_workout_json()]}
+    respx.get(f"{BASE}/v1/workouts").respond(200, json=page)
+
+    with Client(api_key="test-key", model_backend="compact") as c:
+        result = c.workouts.get_workouts(page=1)
+
+    assert isinstance(result, CompactPaginatedWorkouts)
+    workout_set = result.workouts[0].exercises[0].sets[0]
+    assert isinstance(workout_set, CompactWorkoutSet)
+    assert not hasattr(workout_set, "__dict__")
+    assert result == to_compact(PaginatedWorkouts(**page))
+
+
+def test_to_compact_round_trips_pydantic_models(sample_workout_json):
+    workout = Workout(**sample_workout_json())
+
+    compact = to_compact(workout)
+
+    assert isinstance(compact, CompactWorkout)
+    assert isinstance(compact.exercises[0].sets[0], CompactWorkoutSet)
+    assert Workout.model_validate(dataclasses.asdict(compact)) == workout
+    assert to_compact(compact) is compact
+    template = ExerciseTemplate(
+        id="T-1", title="Bench", type="weight_reps", primary_muscle_group="chest", is_custom=False
+    )
+    assert to_compact(template) is template
+
+
+@respx.mock
+def test_compact_client_caches_compact_values(sample_workout_json):
+    respx.post(f"{BASE}/v1/workouts").respond(201, json={"workout": [sample_workout_json()]})
+    respx.get(f"{BASE}/v1/routines").respond(
+        200, json={"page": 1, "page_count": 1, "routines": [sample_routine_json()]}
+    )
+    cache = ResponseCache(
+        policies={"workouts.get_workout": 60, "routines.get_routines": 60, "routines.get_routine": 60}
+    )
+    body = PostWorkoutsRequestBody(
+        workout=PostWorkoutsRequestBodyWorkout(
+            title="Morning Workout",
+            start_time="2021-09-14T12:00:00Z",
+            end_time="2021-09-14T12:30:00Z",
+            is_private=False,
+            exercises=[
+                PostWorkoutsRequestExercise(
+                    exercise_template_id="05293BCA", sets=[PostWorkoutsRequestSet(type="normal", reps=10)]
+                )
+            ],
+        )
+    )
+
+    with Client(api_key="test-key", cache=cache, model_backend="compact") as c:
+        c.workouts.create_workout(body)
+        c.warm(["routines"])
+        workout = c.workouts.get_workout("w-1")
+        routine = c.routines.get_routine("r-1")
+
+    assert isinstance(workout, CompactWorkout)
+    assert isinstance(routine, CompactRoutineResponse)
+    assert routine.routine.id == "r-1"
+
+
+@respx.mock
+def test_history_cache_with_compact_client():
+    entry = {
+        "workout_id": "w-1",
+        "workout_title": "Push",
+        "workout_start_time": "2021-09-14T12:00:00Z",
+        "workout_end_time": "2021-09-14T13:00:00Z",
+        "exercise_template_id": "05293BCA",
+        "reps": 10,
+        "set_type": "normal",
+    }
+    respx.get(f"{BASE}/v1/exercise_history/05293BCA").respond(200, json={"exercise_history": [entry]})
+
+    with Client(api_key="test-key", model_backend="compact") as c:
+        history = ExerciseHistoryCache(c).get_exercise_history("05293BCA", end_date="2022-01-01T00:00:00Z")
+
+    assert isinstance(history, CompactExerciseHistoryResponse)
+    assert history.exercise_history[0].reps == 10
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_compact_async_client(sample_workout_json):
+    respx.get(f"{BASE}/v1/workouts/w-1").respond(200, json=sample_workout_json())
+
+    async with AsyncClient(api_key="test-key", model_backend="compact") as c:
+        workout = await c.workouts.get_workout("w-1")
+
+    assert isinstance(workout, CompactWorkout)
+
+
+def test_unknown_model_backend():
+    with pytest.raises(ValueError, match="model_backend"):
+        Client(api_key="test-key", model_backend="msgspec")
@@ -1,3 +1,6 @@
+import json
+
+import httpx
 import pytest
 import respx
 
@@ -371,6 +374,27 @@ def test_exercise_history_endpoint_sync():
     c.close()
 
 
+@respx.mock
+def test_exercise_history_entries_share_repeated_strings():
+    entry = sample_exercise_history_json()["exercise_history"][0]
+    respx.get(f"{BASE}/v1/exercise_history/05293BCA").respond(
+        200, json={"exercise_history": [dict(entry, reps=reps) for reps in (10, 8, 6)]}
+    )
+
+    with Client(api_key="test-key") as c:
+        first, *rest = c.exercise_history.get_exercise_history("05293BCA").exercise_history
+
+    for name in (
+        "workout_id",
+        "workout_title",
+        "workout_start_time",
+        "workout_end_time",
+        "exercise_template_id",
+        "set_type",
+    ):
+        assert all(getattr(other, name) is getattr(first, name) for other in rest), name
+
+
 @respx.mock
 def test_not_found_raises_error_sync():
     respx.get(f"{BASE}/v1/workouts/does-not-exist").respond(404, json={"message": "not found"})
@@ -479,3 +503,41 @@ def test_exercise_template_with_bodyweight_assisted_sync():
     assert page.exercise_templates[0].type == CustomExerciseType.bodyweight_assisted
 
     c.close()
+
+
+@respx.mock
+def test_request_body_is_encoded_once_and_resent_on_retry():
+    workout_json = {
+        "id": "w-1",
+        "title": "Morning Workout",
+        "start_time": "2021-09-14T12:00:00Z",
+        "end_time": "2021-09-14T12:30:00Z",
+        "updated_at": "2021-09-14T12:31:00Z",
+        "created_at": "2021-09-14T12:00:00Z",
+        "exercises": [],
+    }
+    route = respx.post(f"{BASE}/v1/workouts").mock(
+        side_effect=[httpx.Response(503), httpx.Response(201, json={"workout": [workout_json]})]
+    )
+    body = PostWorkoutsRequestBody(
+        workout=PostWorkoutsRequestBodyWorkout(
+            title="Morning Workout",
+            start_time="2021-09-14T12:00:00Z",
+            end_time="2021-09-14T12:30:00Z",
+            is_private=False,
+            exercises=[
+                PostWorkoutsRequestExercise(
+                    exercise_template_id="05293BCA",
+                    sets=[PostWorkoutsRequestSet(type="normal", weight_kg=100, reps=10, rpe=8.5)],
+                )
+            ],
+        )
+    )
+
+    with Client(api_key="test-key", backoff_factor=0) as c:
+        c.workouts.create_workout(body)
+
+    first, second = (call.request for call in route.calls)
+    assert first.content == second.content
+    assert first.headers["content-type"] == "application/json"
+    assert json.loads(first.content) == body.model_dump(exclude_none=True)
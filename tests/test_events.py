@@ -0,0 +1,195 @@
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from hevy_api_wrapper import AsyncClient
+from hevy_api_wrapper.events import DropPolicy, WorkoutEventHub, compact_events
+from hevy_api_wrapper.models import PaginatedWorkoutEvents
+
+BASE = "https://api.hevyapp.com"
+
+
+def events_page(events, page: int = 1, page_count: int = 1):
+    return {"page": page, "page_count": page_count, "events": events}
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_hub_fans_out_events_in_order(sample_workout_json):
+    route = respx.get(f"{BASE}/v1/workouts/events").respond(
+        200,
+        json=events_page(
+            [
+                {"type": "deleted", "id": "w-2", "deleted_at": "2021-09-14T12:40:00Z"},
+                {"type": "updated", "workout": sample_workout_json()},
+            ]
+        ),
+    )
+
+    async with AsyncClient(api_key="test-key") as c:
+        hub = WorkoutEventHub(c)
+        first = hub.subscribe()
+        second = hub.subscribe()
+
+        published = await hub.poll_once()
+        assert published == 2
+        assert route.call_count == 1
+        assert hub.since == "2021-09-14T12:40:00Z"
+
+        for sub in (first, second):
+            assert (await sub.get()).type == "updated"
+            assert (await sub.get()).type == "deleted"
+
+        # Events stamped exactly at the cursor are not published twice.
+        assert await hub.poll_once() == 0
+        assert route.calls.last.request.url.params["since"] == "2021-09-14T12:40:00Z"
+
+        await hub.stop()
+        assert [event async for event in first] == []
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_hub_drop_policies(sample_workout_json):
+    respx.get(f"{BASE}/v1/workouts/events").respond(
+        200,
+        json=events_page(
+            [
+                {"type": "updated", "workout": sample_workout_json("w-1", "2021-09-14T12:31:00Z")},
+                {"type": "updated", "workout": sample_workout_json("w-2", "2021-09-14T12:32:00Z")},
+                {"type": "updated", "workout": sample_workout_json("w-3", "2021-09-14T12:33:00Z")},
+            ]
+        ),
+    )
+
+    async with AsyncClient(api_key="test-key") as c:
+        hub = WorkoutEventHub(c)
+        newest = hub.subscribe(maxsize=2, drop_policy=DropPolicy.drop_newest)
+        oldest = hub.subscribe(maxsize=2, drop_policy=DropPolicy.drop_oldest)
+
+        await hub.poll_once()
+
+        assert newest.dropped == 1 and oldest.dropped == 1
+        assert [(await newest.get()).workout.id for _ in range(2)] == ["w-1", "w-2"]
+        assert [(await oldest.get()).workout.id for _ in range(2)] == ["w-2", "w-3"]
+
+        hub.unsubscribe(newest)
+        assert newest.closed
+        await hub.stop()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_hub_pages_through_events(sample_workout_json):
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        workout = sample_workout_json(f"w-{page}", f"2021-09-14T12:3{page}:00Z")
+        return httpx.Response(200, json=events_page([{"type": "updated", "workout": workout}], page, 2))
+
+    respx.get(f"{BASE}/v1/workouts/events").mock(side_effect=handler)
+
+    async with AsyncClient(api_key="test-key") as c:
+        hub = WorkoutEventHub(c)
+        sub = hub.subscribe()
+        assert await hub.poll_once() == 2
+        assert (await sub.get()).workout.id == "w-1"
+        assert (await sub.get()).workout.id == "w-2"
+        await hub.stop()
+
+
+def test_compact_events_keeps_latest_state_per_workout(sample_workout_json):
+    page = PaginatedWorkoutEvents(
+        **events_page(
+            [
+                {"type": "updated", "workout": sample_workout_json("w-1", "2021-09-14T12:35:00Z")},
+                {"type": "updated", "workout": sample_workout_json("w-1", "2021-09-14T12:31:00Z")},
+                {"type": "updated", "workout": sample_workout_json("w-2", "2021-09-14T12:32:00Z")},
+                {"type": "deleted", "id": "w-2", "deleted_at": "2021-09-14T12:33:00Z"},
+                {"type": "updated", "workout": sample_workout_json("w-3", "2021-09-14T12:34:00Z")},
+                {"type": "deleted", "id": "w-3", "deleted_at": "2021-09-14T12:34:00Z"},
+            ]
+        )
+    )
+
+    compacted = compact_events(page.events)
+
+    assert [(e.type, getattr(e, "id", None) or e.workout.id) for e in compacted] == [
+        ("deleted", "w-2"),
+        ("deleted", "w-3"),
+        ("updated", "w-1"),
+    ]
+    assert compacted[-1].workout.updated_at == "2021-09-14T12:35:00Z"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_hub_compacts_each_poll(sample_workout_json):
+    respx.get(f"{BASE}/v1/workouts/events").respond(
+        200,
+        json=events_page(
+            [
+                {"type": "updated", "workout": sample_workout_json("w-1", "2021-09-14T12:31:00Z")},
+                {"type": "updated", "workout": sample_workout_json("w-1", "2021-09-14T12:32:00Z")},
+                {"type": "deleted", "id": "w-1", "deleted_at": "2021-09-14T12:33:00Z"},
+            ]
+        ),
+    )
+
+    async with AsyncClient(api_key="test-key") as c:
+        hub = WorkoutEventHub(c, compact=True)
+        sub = hub.subscribe()
+        assert await hub.poll_once() == 1
+        assert (await sub.get()).type == "deleted"
+        assert hub.since == "2021-09-14T12:33:00Z"
+        await hub.stop()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_unsubscribing_a_blocked_subscriber_releases_the_hub(sample_workout_json):
+    respx.get(f"{BASE}/v1/workouts/events").respond(
+        200,
+        json=events_page(
+            [
+                {"type": "updated", "workout": sample_workout_json("w-1", "2021-09-14T12:31:00Z")},
+                {"type": "updated", "workout": sample_workout_json("w-2", "2021-09-14T12:32:00Z")},
+            ]
+        ),
+    )
+
+    async with AsyncClient(api_key="test-key") as c:
+        hub = WorkoutEventHub(c)
+        sub = hub.subscribe(maxsize=1, drop_policy=DropPolicy.block)
+        poll = asyncio.ensure_future(hub.poll_once())
+        while sub.qsize() < 1:
+            await asyncio.sleep(0)
+        # Let the poller block on the second event.
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        hub.unsubscribe(sub)
+
+        assert await asyncio.wait_for(poll, timeout=1) == 2
+        assert [event async for event in sub] == []
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_background_poller_survives_unexpected_errors(sample_workout_json):
+    respx.get(f"{BASE}/v1/workouts/events").mock(
+        side_effect=[
+            httpx.Response(200, json=events_page([{"type": "unknown"}])),
+            httpx.Response(200, json=events_page([{"type": "updated", "workout": sample_workout_json()}])),
+        ]
+    )
+
+    async with AsyncClient(api_key="test-key") as c:
+        hub = WorkoutEventHub(c, poll_interval=0)
+        sub = hub.subscribe()
+        async with hub:
+            event = await asyncio.wait_for(sub.get(), timeout=1)
+            assert hub.running
+
+    assert event.workout.id == "w-1"
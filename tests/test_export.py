@@ -0,0 +1,85 @@
+import gzip
+import json
+
+import httpx
+import pytest
+import respx
+
+from hevy_api_wrapper import AsyncClient
+from hevy_api_wrapper.export import AccountExporter, ExportManifest
+
+BASE = "https://api.hevyapp.com"
+
+
+def read_jsonl_gz(path):
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_account_export_writes_compressed_jsonl_and_manifest(tmp_path, sample_workout_json):
+    def workouts(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        items = [sample_workout_json(f"w-{page}", template_id=f"T-{page % 2}")]
+        return httpx.Response(200, json={"page": page, "page_count": 3, "workouts": items})
+
+    respx.get(f"{BASE}/v1/workouts").mock(side_effect=workouts)
+    respx.get(f"{BASE}/v1/routines").respond(200, json={"page": 1, "page_count": 1, "routines": []})
+    respx.get(f"{BASE}/v1/routine_folders").respond(200, json={"page": 1, "page_count": 1, "routine_folders": []})
+    respx.get(f"{BASE}/v1/exercise_templates").respond(
+        200,
+        json={
+            "page": 1,
+            "page_count": 1,
+            "exercise_templates": [
+                {
+                    "id": "T-0",
+                    "title": "Mine",
+                    "type": "weight_reps",
+                    "primary_muscle_group": "chest",
+                    "is_custom": True,
+                },
+                {
+                    "id": "T-1",
+                    "title": "Lib",
+                    "type": "weight_reps",
+                    "primary_muscle_group": "chest",
+                    "is_custom": False,
+                },
+            ],
+        },
+    )
+    history = respx.get(url__regex=rf"{BASE}/v1/exercise_history/T-\d").respond(
+        200,
+        json={
+            "exercise_history": [
+                {
+                    "workout_id": "w-1",
+                    "workout_title": "Morning Workout",
+                    "workout_start_time": "2021-09-14T12:00:00Z",
+                    "workout_end_time": "2021-09-14T12:30:00Z",
+                    "exercise_template_id": "T-1",
+                    "set_type": "normal",
+                }
+            ]
+        },
+    )
+
+    async with AsyncClient(api_key="test-key") as c:
+        manifest = await AccountExporter(c, tmp_path, max_concurrency=2).run()
+
+    assert manifest.files["workouts"].records == 3
+    assert sorted(w["id"] for w in read_jsonl_gz(tmp_path / "workouts.jsonl.gz")) == ["w-1", "w-2", "w-3"]
+    assert [t["id"] for t in read_jsonl_gz(tmp_path / "custom_exercise_templates.jsonl.gz")] == ["T-0"]
+    assert history.call_count == 2
+    assert manifest.files["exercise_history"].records == 2
+
+    loaded = ExportManifest.load(tmp_path)
+    assert loaded.files["workouts"].sha256 == manifest.files["workouts"].sha256
+    assert loaded.compression == "gzip"
+
+
+def test_account_export_rejects_unknown_compression(tmp_path):
+    with pytest.raises(ValueError):
+        AccountExporter(object(), tmp_path, compression="lz4")
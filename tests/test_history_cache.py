@@ -0,0 +1,128 @@
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+import respx
+
+from hevy_api_wrapper import AsyncClient, Client
+from hevy_api_wrapper.cache import AsyncExerciseHistoryCache, ExerciseHistoryCache
+
+BASE = "https://api.hevyapp.com"
+NOW = datetime.now(timezone.utc).replace(microsecond=0)
+
+
+def iso(moment):
+    return moment.isoformat().replace("+00:00", "Z")
+
+
+def entry_json(days_ago, reps=10):
+    start = NOW - timedelta(days=days_ago)
+    return {
+        "workout_id": f"w-{days_ago}",
+        "workout_title": "Push",
+        "workout_start_time": iso(start),
+        "workout_end_time": iso(start + timedelta(hours=1)),
+        "exercise_template_id": "05293BCA",
+        "weight_kg": 100,
+        "reps": reps,
+        "set_type": "normal",
+    }
+
+
+HISTORY = [entry_json(days, reps) for days in (400, 200, 60, 20, 20, 1) for reps in (10,)]
+
+
+def mock_history():
+    """Serve HISTORY filtered like the API, recording the requested ranges."""
+    requested = []
+
+    def respond(request):
+        params = request.url.params
+        start = params.get("start_date")
+        end = params.get("end_date")
+        requested.append((start, end))
+        entries = [
+            e
+            for e in HISTORY
+            if (start is None or e["workout_start_time"] >= start) and (end is None or e["workout_start_time"] <= end)
+        ]
+        return httpx.Response(200, json={"exercise_history": entries})
+
+    respx.get(f"{BASE}/v1/exercise_history/05293BCA").mock(side_effect=respond)
+    return requested
+
+
+@respx.mock
+def test_overlapping_ranges_fetch_only_missing_parts():
+    requested = mock_history()
+
+    with Client(api_key="test-key") as c:
+        history = ExerciseHistoryCache(c)
+        last = {
+            days: history.get_exercise_history("05293BCA", start_date=iso(NOW - timedelta(days=days)))
+            for days in (30, 90, 365)
+        }
+
+    assert [len(last[days].exercise_history) for days in (30, 90, 365)] == [3, 4, 5]
+    assert [e["workout_id"] for e in HISTORY[1:]] == [e.workout_id for e in last[365].exercise_history]
+    assert requested[0] == (iso(NOW - timedelta(days=30)), None)
+    assert requested[1] == (iso(NOW - timedelta(days=90)), iso(NOW - timedelta(days=30)))
+    assert requested[2] == (iso(NOW - timedelta(days=365)), iso(NOW - timedelta(days=90)))
+
+
+@respx.mock
+def test_covered_ranges_are_served_from_the_cache():
+    requested = mock_history()
+
+    with Client(api_key="test-key") as c:
+        history = ExerciseHistoryCache(c)
+        full = history.get_exercise_history(
+            "05293BCA", start_date=iso(NOW - timedelta(days=500)), end_date=iso(NOW - timedelta(days=10))
+        )
+        inner = history.get_exercise_history(
+            "05293BCA", start_date=iso(NOW - timedelta(days=100)), end_date=iso(NOW - timedelta(days=15))
+        )
+        assert len(requested) == 1
+
+        history.invalidate("05293BCA")
+        history.get_exercise_history("05293BCA", end_date=iso(NOW - timedelta(days=15)))
+
+    assert [e.workout_id for e in full.exercise_history] == ["w-400", "w-200", "w-60", "w-20", "w-20"]
+    assert [e.workout_id for e in inner.exercise_history] == ["w-60", "w-20", "w-20"]
+    assert requested[1] == (None, iso(NOW - timedelta(days=15)))
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_history_cache_fills_gaps_between_ranges():
+    requested = mock_history()
+
+    async with AsyncClient(api_key="test-key") as c:
+        history = AsyncExerciseHistoryCache(c)
+        await history.get_exercise_history(
+            "05293BCA", start_date=iso(NOW - timedelta(days=450)), end_date=iso(NOW - timedelta(days=300))
+        )
+        await history.get_exercise_history(
+            "05293BCA", start_date=iso(NOW - timedelta(days=100)), end_date=iso(NOW - timedelta(days=50))
+        )
+        merged = await history.get_exercise_history("05293BCA", start_date=iso(NOW - timedelta(days=450)))
+
+    assert [e.workout_id for e in merged.exercise_history] == ["w-400", "w-200", "w-60", "w-20", "w-20", "w-1"]
+    assert requested[2:] == [
+        (iso(NOW - timedelta(days=300)), iso(NOW - timedelta(days=100))),
+        (iso(NOW - timedelta(days=50)), None),
+    ]
+
+
+@respx.mock
+def test_open_ended_ranges_refetch_the_tail_once_stale():
+    requested = mock_history()
+
+    with Client(api_key="test-key") as c:
+        history = ExerciseHistoryCache(c, max_staleness=0)
+        history.get_exercise_history("05293BCA", start_date=iso(NOW - timedelta(days=30)))
+        latest = history.get_exercise_history("05293BCA", start_date=iso(NOW - timedelta(days=30)))
+
+    assert len(requested) == 2
+    assert requested[1][0] > iso(NOW - timedelta(seconds=1)) and requested[1][1] is None
+    assert [e.workout_id for e in latest.exercise_history] == ["w-20", "w-20", "w-1"]
@@ -0,0 +1,44 @@
+import json
+import subprocess
+import sys
+
+HEAVY_MODULES = ["httpx", "pydantic", "hevy_api_wrapper.client", "hevy_api_wrapper.models.workout", "sqlite3"]
+
+# Loaded by the clients that use them rather than by importing the client.
+CLIENT_DEFERRED_MODULES = [
+    "hevy_api_wrapper.models.workout",
+    "hevy_api_wrapper.models.lazy_workout",
+    "hevy_api_wrapper.compact",
+    "hevy_api_wrapper.cache.warmup",
+    "hevy_api_wrapper.projection",
+]
+
+
+# Timing lives in benchmarks/import_time.py; these only check what gets loaded.
+def loaded_modules(statement: str) -> set:
+    probe = f"import json, sys; {statement}; print(json.dumps(sorted(sys.modules)))"
+    result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+    return set(json.loads(result.stdout))
+
+
+def test_package_import_loads_no_clients_or_models():
+    assert not set(HEAVY_MODULES) & loaded_modules("import hevy_api_wrapper")
+
+
+def test_client_import_loads_no_models_or_optional_features():
+    modules = loaded_modules("from hevy_api_wrapper import Client")
+
+    assert "hevy_api_wrapper.client" in modules
+    assert not set(CLIENT_DEFERRED_MODULES) & modules
+
+
+def test_lazy_names_resolve_on_first_access():
+    import hevy_api_wrapper
+    from hevy_api_wrapper import models
+    from hevy_api_wrapper.client import Client
+    from hevy_api_wrapper.models.workout import Workout
+
+    assert hevy_api_wrapper.Client is Client
+    assert models.Workout is Workout
+    assert hevy_api_wrapper.models is models
+    assert "Workout" in dir(models)
@@ -0,0 +1,70 @@
+import pytest
+import respx
+
+from hevy_api_wrapper import AsyncClient, Client
+from hevy_api_wrapper.cache import ResponseCache
+from hevy_api_wrapper.models import (
+    LazyPaginatedWorkouts,
+    LazyWorkout,
+    PaginatedWorkouts,
+    PostWorkoutsRequestBody,
+    PostWorkoutsRequestBodyWorkout,
+    Workout,
+    WorkoutExercise,
+)
+
+BASE = "https://api.hevyapp.com"
+
+
+@respx.mock
+def test_lazy_client_parses_exercises_on_first_access(sample_workout_json):
+    page = {"page": 1, "page_count": 1, "workouts": [sample_workout_json()]}
+    respx.get(f"{BASE}/v1/workouts").respond(200, json=page)
+
+    with Client(api_key="test-key", model_backend="lazy") as c:
+        result = c.workouts.get_workouts(page=1)
+
+    assert isinstance(result, LazyPaginatedWorkouts)
+    workout = result.workouts[0]
+    assert (workout.id, workout.title, workout.start_time) == ("w-1", "Morning Workout", "2021-09-14T12:00:00Z")
+    assert "exercises" not in workout.__dict__
+    assert isinstance(workout.exercises[0], WorkoutExercise)
+    assert workout.exercises is workout.exercises
+    assert workout.exercises[0].sets[0].weight_kg == 100.0
+    assert result.model_dump() == PaginatedWorkouts(**page).model_dump()
+    assert result.model_dump_json() == PaginatedWorkouts(**page).model_dump_json()
+
+
+@respx.mock
+def test_lazy_client_write_through_stores_lazy_workout(sample_workout_json):
+    respx.post(f"{BASE}/v1/workouts").respond(201, json={"workout": [sample_workout_json()]})
+    cache = ResponseCache(policies={"workouts.get_workout": 60})
+    body = PostWorkoutsRequestBody(
+        workout=PostWorkoutsRequestBodyWorkout(
+            title="Morning Workout",
+            start_time="2021-09-14T12:00:00Z",
+            end_time="2021-09-14T12:30:00Z",
+            is_private=False,
+            exercises=[],
+        )
+    )
+
+    with Client(api_key="test-key", cache=cache, model_backend="lazy") as c:
+        created = c.workouts.create_workout(body)
+        cached = c.workouts.get_workout("w-1")
+
+    assert isinstance(created, Workout)
+    assert isinstance(cached, LazyWorkout)
+    assert cached.exercises == created.exercises
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_lazy_async_client(sample_workout_json):
+    respx.get(f"{BASE}/v1/workouts/w-1").respond(200, json=sample_workout_json())
+
+    async with AsyncClient(api_key="test-key", model_backend="lazy") as c:
+        workout = await c.workouts.get_workout("w-1")
+
+    assert isinstance(workout, LazyWorkout)
+    assert workout.exercises[0].title == "Bench Press (Barbell)"
@@ -0,0 +1,133 @@
+import pytest
+import respx
+
+from hevy_api_wrapper import AsyncClient, Client
+from hevy_api_wrapper.cache import ResponseCache
+from hevy_api_wrapper.models import ExerciseHistoryResponse, PaginatedRoutines, PaginatedWorkouts
+from hevy_api_wrapper.projection import project
+
+BASE = "https://api.hevyapp.com"
+
+
+WORKOUT_FIELDS = [
+    "id",
+    "start_time",
+    "exercises.exercise_template_id",
+    "exercises.sets.weight_kg",
+    "exercises.sets.reps",
+]
+
+
+def test_project_keeps_only_requested_fields():
+    projected = project(PaginatedWorkouts, WORKOUT_FIELDS)
+
+    assert list(projected.model_fields) == ["page", "page_count", "workouts"]
+    workout_type = projected.model_fields["workouts"].annotation.__args__[0]
+    assert list(workout_type.model_fields) == ["id", "start_time", "exercises"]
+    exercise_type = workout_type.model_fields["exercises"].annotation.__args__[0]
+    set_type = exercise_type.model_fields["sets"].annotation.__args__[0]
+    assert list(set_type.model_fields) == ["weight_kg", "reps"]
+    assert project(PaginatedWorkouts, reversed(WORKOUT_FIELDS)) is projected
+
+
+def test_project_keeps_whole_nested_models_and_rejects_unknown_fields():
+    routines = project(PaginatedRoutines, ["exercises.sets", "exercises.sets.reps"])
+    routine_type = routines.model_fields["routines"].annotation.__args__[0]
+    exercise_type = routine_type.model_fields["exercises"].annotation.__args__[0]
+    assert "rep_range" in exercise_type.model_fields["sets"].annotation.__args__[0].model_fields
+
+    with pytest.raises(ValueError, match="no field 'weight'"):
+        project(PaginatedWorkouts, ["exercises.sets.weight"])
+    with pytest.raises(ValueError, match="no fields to select"):
+        project(PaginatedWorkouts, ["title.length"])
+
+
+@respx.mock
+def test_projected_list_and_history_requests(sample_workout_json):
+    respx.get(f"{BASE}/v1/workouts").respond(
+        200, json={"page": 1, "page_count": 2, "workouts": [sample_workout_json()]}
+    )
+    respx.get(f"{BASE}/v1/exercise_history/05293BCA").respond(
+        200,
+        json={
+            "exercise_history": [
+                {
+                    "workout_id": "w-1",
+                    "workout_title": "Morning Workout",
+                    "workout_start_time": "2021-09-14T12:00:00Z",
+                    "workout_end_time": "2021-09-14T12:30:00Z",
+                    "exercise_template_id": "05293BCA",
+                    "weight_kg": 100,
+                    "reps": 10,
+                    "set_type": "normal",
+                }
+            ]
+        },
+    )
+
+    with Client(api_key="test-key") as c:
+        page = c.workouts.get_workouts(page=1, fields=WORKOUT_FIELDS)
+        history = c.exercise_history.get_exercise_history(
+            "05293BCA", fields=["workout_id", "workout_start_time", "weight_kg", "reps"]
+        )
+
+    workout = page.workouts[0]
+    assert page.page_count == 2
+    assert workout.model_dump() == {
+        "id": "w-1",
+        "start_time": "2021-09-14T12:00:00Z",
+        "exercises": [{"exercise_template_id": "05293BCA", "sets": [{"weight_kg": 100.0, "reps": 10}]}],
+    }
+    assert not hasattr(workout, "title")
+    assert not isinstance(history, ExerciseHistoryResponse)
+    assert history.exercise_history[0].model_dump() == {
+        "workout_id": "w-1",
+        "workout_start_time": "2021-09-14T12:00:00Z",
+        "weight_kg": 100.0,
+        "reps": 10,
+    }
+
+
+@respx.mock
+def test_projections_are_cached_apart_from_full_responses(sample_workout_json):
+    route = respx.get(f"{BASE}/v1/workouts").respond(
+        200, json={"page": 1, "page_count": 1, "workouts": [sample_workout_json()]}
+    )
+    cache = ResponseCache(policies={"workouts.get_workouts": 60})
+
+    with Client(api_key="test-key", cache=cache) as c:
+        full = c.workouts.get_workouts(page=1)
+        projected = c.workouts.get_workouts(page=1, fields=["id"])
+        assert c.workouts.get_workouts(page=1, fields=["id"]) is projected
+        assert c.workouts.get_workouts(page=1) is full
+
+    assert route.call_count == 2
+    assert isinstance(full, PaginatedWorkouts)
+    assert projected.workouts[0].model_dump() == {"id": "w-1"}
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_projected_request_async():
+    respx.get(f"{BASE}/v1/routines").respond(
+        200,
+        json={
+            "page": 1,
+            "page_count": 1,
+            "routines": [
+                {
+                    "id": "r-1",
+                    "title": "Upper Body",
+                    "folder_id": None,
+                    "updated_at": "2021-09-14T12:31:00Z",
+                    "created_at": "2021-09-14T12:00:00Z",
+                    "exercises": [],
+                }
+            ],
+        },
+    )
+
+    async with AsyncClient(api_key="test-key") as c:
+        page = await c.routines.get_routines(page=1, fields=["id", "title"])
+
+    assert page.routines[0].model_dump() == {"id": "r-1", "title": "Upper Body"}
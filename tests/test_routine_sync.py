@@ -0,0 +1,84 @@
+import respx
+
+from hevy_api_wrapper import Client
+from hevy_api_wrapper.routine_sync import RoutineChangeTracker, RoutineSyncState
+
+BASE = "https://api.hevyapp.com"
+
+
+def sample_routine_json(id: str = "r-1", title: str = "Upper Body", updated_at: str = "2021-09-14T12:31:00Z"):
+    return {
+        "id": id,
+        "title": title,
+        "folder_id": None,
+        "updated_at": updated_at,
+        "created_at": "2021-09-14T12:00:00Z",
+        "exercises": [],
+    }
+
+
+def sample_folder_json(id: int = 42, title: str = "Push Pull"):
+    return {
+        "id": id,
+        "index": 0,
+        "title": title,
+        "updated_at": "2021-09-14T12:31:00Z",
+        "created_at": "2021-09-14T12:00:00Z",
+    }
+
+
+def mock_listing(routines, folders):
+    respx.get(f"{BASE}/v1/routines").respond(200, json={"page": 1, "page_count": 1, "routines": routines})
+    respx.get(f"{BASE}/v1/routine_folders").respond(200, json={"page": 1, "page_count": 1, "routine_folders": folders})
+
+
+@respx.mock
+def test_routine_change_tracker_reports_differences():
+    c = Client(api_key="test-key")
+    tracker = RoutineChangeTracker(c)
+
+    mock_listing([sample_routine_json("r-1"), sample_routine_json("r-2")], [sample_folder_json(42)])
+    first = tracker.sync()
+    assert [r.id for r in first.added_routines] == ["r-1", "r-2"]
+    assert [f.id for f in first.added_folders] == [42]
+
+    # Nothing changed: both pages are skipped on their fingerprint alone.
+    unchanged = tracker.sync()
+    assert not unchanged.has_changes
+    assert unchanged.skipped_pages == 2
+
+    mock_listing(
+        [
+            sample_routine_json("r-1", title="Upper Body v2", updated_at="2021-09-15T08:00:00Z"),
+            sample_routine_json("r-3"),
+        ],
+        [],
+    )
+    changes = tracker.sync()
+    assert [r.title for r in changes.changed_routines] == ["Upper Body v2"]
+    assert [r.id for r in changes.added_routines] == ["r-3"]
+    assert changes.removed_routine_ids == ["r-2"]
+    assert changes.removed_folder_ids == [42]
+
+    c.close()
+
+
+@respx.mock
+def test_routine_change_tracker_state_round_trip_and_details():
+    mock_listing([sample_routine_json("r-1")], [sample_folder_json(42)])
+    detail = respx.get(f"{BASE}/v1/routines/r-1").respond(
+        200, json={"routine": sample_routine_json("r-1", title="Detailed")}
+    )
+    respx.get(f"{BASE}/v1/routine_folders/42").respond(200, json=sample_folder_json(42))
+
+    c = Client(api_key="test-key")
+    tracker = RoutineChangeTracker(c, fetch_details=True)
+    first = tracker.sync()
+    assert first.added_routines[0].title == "Detailed"
+    assert detail.call_count == 1
+
+    restored = RoutineChangeTracker(c, state=RoutineSyncState.from_dict(tracker.state.to_dict()), fetch_details=True)
+    assert not restored.sync().has_changes
+    assert detail.call_count == 1
+
+    c.close()
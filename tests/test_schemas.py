@@ -0,0 +1,7 @@
+from hevy_api_wrapper import models
+from hevy_api_wrapper.models import schemas
+
+
+def test_schemas_aliases_the_model_modules():
+    for name in schemas.__all__:
+        assert getattr(schemas, name) is getattr(models, name), name
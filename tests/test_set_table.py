@@ -0,0 +1,119 @@
+import math
+
+import pytest
+
+from hevy_api_wrapper.compact import to_compact
+from hevy_api_wrapper.models import DeletedWorkout, PaginatedWorkouts, UpdatedWorkout, Workout
+from hevy_api_wrapper.set_table import SET_COLUMNS, SetTable
+
+
+def workout(id: str, start_time: str = "2024-01-01T18:00:00Z", weight: float = 100.0):
+    return Workout(
+        id=id,
+        title="Push Day",
+        start_time=start_time,
+        end_time="2024-01-01T19:00:00Z",
+        updated_at="2024-01-01T19:00:00Z",
+        created_at="2024-01-01T19:00:00Z",
+        exercises=[
+            {
+                "index": 0,
+                "title": "Bench Press (Barbell)",
+                "exercise_template_id": "05293BCA",
+                "sets": [
+                    {"index": 0, "type": "warmup", "weight_kg": 60, "reps": 10},
+                    {"index": 1, "type": "normal", "weight_kg": weight, "reps": 5, "rpe": 8.5},
+                ],
+            },
+            {
+                "index": 1,
+                "title": "Plank",
+                "exercise_template_id": "C6C9B8A0",
+                "sets": [{"index": 0, "type": "normal", "duration_seconds": 60}],
+            },
+        ],
+    )
+
+
+def test_append_pages_builds_dictionary_encoded_columns():
+    table = SetTable()
+    table.append_page(PaginatedWorkouts(page=1, page_count=2, workouts=[workout("w-1")]))
+    table.append_page(PaginatedWorkouts(page=2, page_count=2, workouts=[workout("w-2", "2024-01-03T18:00:00Z")]))
+
+    assert len(table) == 6
+    assert table.workout_ids == ["w-1", "w-2"]
+    assert table.exercise_template_ids == ["05293BCA", "C6C9B8A0"]
+    assert table.set_types == ["warmup", "normal"]
+    assert table.column("workout").tolist() == [0, 0, 0, 1, 1, 1]
+    assert table.column("weight_kg")[:2].tolist() == [60.0, 100.0]
+    assert math.isnan(table.column("weight_kg")[2])
+    assert table.column("workout_start")[3] - table.column("workout_start")[0] == 2 * 86400
+    row = table.row(4)
+    assert set(row) == set(SET_COLUMNS)
+    assert (row["workout"], row["exercise_template"], row["set_index"], row["set_type"]) == (
+        "w-2",
+        "05293BCA",
+        1,
+        "normal",
+    )
+    assert (row["weight_kg"], row["reps"], row["rpe"]) == (100.0, 5.0, 8.5)
+    assert math.isnan(row["duration_seconds"])
+
+
+def test_slices_share_memory_and_block_growth_until_released():
+    table = SetTable.from_workouts([workout("w-1"), to_compact(workout("w-2"))])
+    view = table[3:]
+    weights = view.column("weight_kg")
+
+    assert len(view) == 3
+    assert view.row(0)["workout"] == "w-2"
+    assert view[1:2].row(0)["set_type"] == "normal"
+    assert weights.obj is table.column("weight_kg").obj
+    with pytest.raises(BufferError):
+        table.append_workouts([workout("w-3")])
+
+    weights.release()
+    view.release()
+    table.append_workouts([workout("w-3")])
+    assert len(table) == 9
+
+
+def test_events_replace_and_remove_workouts():
+    table = SetTable.from_workouts([workout("w-1"), workout("w-2")])
+
+    table.append_events(
+        [
+            UpdatedWorkout(type="updated", workout=workout("w-1", weight=105.0)),
+            DeletedWorkout(type="deleted", id="w-2", deleted_at="2024-01-05T00:00:00Z"),
+        ]
+    )
+
+    assert len(table) == 3
+    assert {table.row(i)["workout"] for i in range(3)} == {"w-1"}
+    assert table.row(1)["weight_kg"] == 105.0
+
+
+def test_events_leave_the_table_unchanged_while_views_are_alive():
+    table = SetTable.from_workouts([workout("w-1"), workout("w-2")])
+    codes = table.column("workout")
+
+    with pytest.raises(BufferError):
+        table.append_events([UpdatedWorkout(type="updated", workout=workout("w-1", weight=105.0))])
+
+    assert codes.tolist() == [0, 0, 0, 1, 1, 1]
+    assert codes.obj is table.column("workout").obj
+    codes.release()
+    table.append_events([UpdatedWorkout(type="updated", workout=workout("w-1", weight=105.0))])
+    assert len(table) == 6
+    assert table.row(4)["weight_kg"] == 105.0
+
+
+def test_to_numpy_shares_the_columns():
+    numpy = pytest.importorskip("numpy")
+    table = SetTable.from_workouts([workout("w-1")])
+
+    weights = table.to_numpy()["weight_kg"]
+    weights[0] = 65.0
+
+    assert numpy.nanmax(weights) == 100.0
+    assert table.column("weight_kg")[0] == 65.0
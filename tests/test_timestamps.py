@@ -0,0 +1,76 @@
+from datetime import datetime, timezone
+
+from hevy_api_wrapper.compact import to_compact
+from hevy_api_wrapper.models import ExerciseHistoryEntry, RoutineFolder, Workout
+from hevy_api_wrapper.timestamps import parse_timestamp, parse_timestamps
+
+UTC = timezone.utc
+
+
+def test_parse_timestamp_treats_z_and_naive_values_as_utc():
+    expected = datetime(2024, 1, 1, 18, 0, tzinfo=UTC)
+    assert parse_timestamp("2024-01-01T18:00:00Z") == expected
+    assert parse_timestamp("2024-01-01T18:00:00") == expected
+    assert parse_timestamp("2024-01-01T19:00:00+01:00") == expected
+
+
+def test_parse_timestamps_parses_each_distinct_value_once():
+    values = ["2024-01-02T00:00:00Z", "2024-01-01T00:00:00Z", "2024-01-02T00:00:00Z"]
+    parsed = parse_timestamps(values)
+
+    assert parsed == [parse_timestamp(value) for value in values]
+    assert parsed[0] is parsed[2]
+
+
+def test_model_datetime_properties():
+    workout = Workout(
+        id="w-1",
+        title="Push Day",
+        start_time="2024-01-01T18:00:00Z",
+        end_time="2024-01-01T19:10:00Z",
+        updated_at="2024-01-01T19:11:00Z",
+        created_at="2024-01-01T19:11:00Z",
+        exercises=[],
+    )
+    entry = ExerciseHistoryEntry(
+        workout_id="w-1",
+        workout_title="Push Day",
+        workout_start_time="2024-01-01T18:00:00Z",
+        workout_end_time="2024-01-01T19:10:00Z",
+        exercise_template_id="05293BCA",
+        set_type="normal",
+    )
+    folder = RoutineFolder(
+        id=1, index=0, title="Push", updated_at="2024-01-01T00:00:00Z", created_at="2024-01-01T00:00:00Z"
+    )
+
+    assert workout.start_datetime == datetime(2024, 1, 1, 18, 0, tzinfo=UTC)
+    assert workout.end_datetime - workout.start_datetime == (datetime(2024, 1, 1, 19, 10) - datetime(2024, 1, 1, 18, 0))
+    assert workout.start_datetime is workout.start_datetime
+    assert entry.workout_start_datetime == workout.start_datetime
+    assert folder.created_datetime.tzinfo is not None
+    assert "start_datetime" not in workout.model_dump()
+    assert workout == workout.model_copy()
+
+
+def test_model_datetime_properties_follow_the_timestamp_strings():
+    workout = Workout(
+        id="w-1",
+        title="Push Day",
+        start_time="2024-01-01T18:00:00Z",
+        end_time="2024-01-01T19:10:00Z",
+        updated_at="2024-01-01T19:11:00Z",
+        created_at="2024-01-01T19:11:00Z",
+        exercises=[],
+    )
+    assert workout.start_datetime.hour == 18
+
+    moved = workout.model_copy(update={"start_time": "2024-01-01T17:00:00Z"})
+    assert moved.start_datetime.hour == 17
+    workout.start_time = "2024-01-01T16:00:00Z"
+    assert workout.start_datetime.hour == 16
+
+    compact = to_compact(moved)
+    assert compact.start_datetime == moved.start_datetime
+    compact.start_time = "2024-01-01T15:00:00Z"
+    assert compact.start_datetime.hour == 15
@@ -0,0 +1,161 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+import respx
+
+from hevy_api_wrapper import AsyncClient, Client
+from hevy_api_wrapper.cache import ResponseCache
+
+BASE = "https://api.hevyapp.com"
+POLICIES = {
+    "routines.get_routines": 60,
+    "routines.get_routine": 60,
+    "routine_folders.get_routine_folders": 60,
+    "routine_folders.get_routine_folder": 60,
+}
+
+
+def template_json(id):
+    return {
+        "id": id,
+        "title": f"Exercise {id}",
+        "type": "weight_reps",
+        "primary_muscle_group": "chest",
+        "secondary_muscle_groups": [],
+        "is_custom": False,
+    }
+
+
+def routine_json(id):
+    return {
+        "id": id,
+        "title": "Upper Body",
+        "folder_id": None,
+        "updated_at": "2021-09-14T12:31:00Z",
+        "created_at": "2021-09-14T12:00:00Z",
+        "exercises": [],
+    }
+
+
+def folder_json(id):
+    return {
+        "id": id,
+        "index": 0,
+        "title": "Push",
+        "updated_at": "2021-09-14T12:31:00Z",
+        "created_at": "2021-09-14T12:00:00Z",
+    }
+
+
+def mock_lists():
+    def templates(request):
+        page = int(request.url.params["page"])
+        assert request.url.params["pageSize"] == "100"
+        return httpx.Response(
+            200, json={"page": page, "page_count": 3, "exercise_templates": [template_json(f"T-{page}")]}
+        )
+
+    return {
+        "templates": respx.get(f"{BASE}/v1/exercise_templates").mock(side_effect=templates),
+        "routines": respx.get(f"{BASE}/v1/routines").respond(
+            200, json={"page": 1, "page_count": 1, "routines": [routine_json("r-1"), routine_json("r-2")]}
+        ),
+        "folders": respx.get(f"{BASE}/v1/routine_folders").respond(
+            200, json={"page": 1, "page_count": 1, "routine_folders": [folder_json(7)]}
+        ),
+        "template": respx.get(url__regex=rf"{BASE}/v1/exercise_templates/.+").respond(404),
+        "routine": respx.get(url__regex=rf"{BASE}/v1/routines/.+").respond(404),
+        "folder": respx.get(url__regex=rf"{BASE}/v1/routine_folders/.+").respond(404),
+    }
+
+
+@respx.mock
+def test_warm_loads_every_page_and_seeds_item_lookups():
+    routes = mock_lists()
+
+    with Client(api_key="test-key", cache=ResponseCache(policies=POLICIES)) as c:
+        counts = c.warm()
+        assert c.exercise_templates.get_exercise_template("T-3").title == "Exercise T-3"
+        assert c.routines.get_routine("r-2").routine.id == "r-2"
+        assert c.routine_folders.get_routine_folder(7).title == "Push"
+        c.routines.get_routines(page=1, page_size=10)
+
+    assert counts == {"exercise_templates": 3, "routine_folders": 1, "routines": 2}
+    assert routes["templates"].call_count == 3
+    assert routes["routines"].call_count == 1
+    assert all(routes[name].call_count == 0 for name in ("template", "routine", "folder"))
+
+
+def test_warm_requires_a_cache_and_known_targets():
+    with Client(api_key="test-key") as c:
+        with pytest.raises(ValueError):
+            c.warm()
+    with Client(api_key="test-key", cache=ResponseCache()) as c:
+        with pytest.raises(ValueError):
+            c.warm(["workouts"])
+        with pytest.raises(ValueError):
+            c.start_refresher(["routines"])  # no policy, so no TTL to refresh before
+
+
+@respx.mock
+def test_warm_skips_targets_without_a_cache_policy():
+    routes = mock_lists()
+
+    with Client(api_key="test-key", cache=ResponseCache()) as c:
+        counts = c.warm()
+        assert c.exercise_templates.get_exercise_template("T-1").id == "T-1"
+
+    assert counts == {"exercise_templates": 3, "routine_folders": 0, "routines": 0}
+    assert routes["routines"].call_count == 0
+    assert routes["folders"].call_count == 0
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_warm_skips_targets_without_a_cache_policy():
+    routes = mock_lists()
+
+    async with AsyncClient(api_key="test-key", cache=ResponseCache()) as c:
+        counts = await c.warm(["routines"])
+
+    assert counts == {"routines": 0}
+    assert routes["routines"].call_count == 0
+
+
+@respx.mock
+def test_refresher_renews_entries_until_stopped():
+    routes = mock_lists()
+
+    with Client(api_key="test-key", cache=ResponseCache(policies=POLICIES)) as c:
+        refresher = c.start_refresher(["routines"], interval=0.01)
+        deadline = time.monotonic() + 5
+        while refresher.refreshes < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert refresher.interval == 0.01
+        assert c.start_refresher(["routines"], ratio=0.5).interval == 30
+    assert not refresher.running
+
+    assert routes["routines"].call_count >= 2
+    assert refresher.errors == 0
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_warm_and_refresher():
+    routes = mock_lists()
+
+    async with AsyncClient(api_key="test-key", cache=ResponseCache(policies=POLICIES)) as c:
+        counts = await c.warm(max_concurrency=2)
+        assert (await c.exercise_templates.get_exercise_template("T-2")).id == "T-2"
+        refresher = c.start_refresher(["routine_folders"], interval=0.01)
+        for _ in range(500):
+            if refresher.refreshes:
+                break
+            await asyncio.sleep(0.01)
+    assert not refresher.running
+
+    assert counts["exercise_templates"] == 3
+    assert routes["folders"].call_count >= 2
+    assert routes["template"].call_count == 0